@@ -69,6 +69,55 @@ LINESEG_LINE_WIDTH = 2
 # Mask overlay opacity (0-255)
 DEFAULT_MASK_OPACITY = 128
 
+# Oblique slice sampling: extra z-planes kept around the sampled range so
+# scrolling through parallel slices reuses the same slab of the volume
+OBLIQUE_SLAB_MARGIN = 16
+
+# Sample oblique slices from a transposed copy of the volume whose axis order
+# suits the plane orientation. Keeps up to two extra copies of the volume in
+# memory; disable for very large volumes.
+OBLIQUE_AXIS_LAYOUTS = True
+
+# Keep an x-major copy of each loaded volume (and reference mask) so sagittal
+# slices are read contiguously, about 5x faster to display. Doubles the
+# memory of every resident patient; disable for very large volumes.
+SAGITTAL_SLICE_LAYOUT = True
+
+# Render the slice views through an OpenGL viewport so the image and overlay
+# layers are composited on the GPU. Only used if an OpenGL context can be
+# created; otherwise (or when disabled) the views paint with the raster engine
+SLICE_VIEW_OPENGL = True
+
+# Number of rotated p4ch slices kept so revisited slider angles skip resampling
+ROTATION_CACHE_SIZE = 32
+
+# Number of mask overlay pixmaps each slice view keeps so revisited slices
+# skip recompositing (about 1 MB each for a 512x512 slice)
+MASK_OVERLAY_CACHE_SIZE = 32
+
+# Slider ticks arriving within this many milliseconds are coalesced into a
+# single re-render using the latest value
+SLIDER_COALESCE_MS = 15
+
+# Brush/segment preview redraws during a drag are limited to one per this
+# many milliseconds (about one per frame)
+PREVIEW_COALESCE_MS = 16
+
+# Maximum number of patients whose volumes stay in memory (the current one
+# plus prefetched neighbours); least recently used ones are unloaded first
+MAX_RESIDENT_PATIENTS = 4
+
+# Patient list rows changed within this many milliseconds are refreshed
+# together
+PATIENT_LIST_REFRESH_MS = 50
+
+# Maximum number of patients saved concurrently by "Save All"
+SAVE_WORKERS = 4
+
+# zlib level for saved mask archives (1-9). Masks are long runs of 0/255, so
+# low levels compress nearly as well and are several times faster to write
+MASK_COMPRESS_LEVEL = 1
+
 # File patterns
 NIFTI_PATTERN = "*.nii.gz"
 IMAGE_SUFFIX = "_image.nii.gz"
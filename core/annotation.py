@@ -1,5 +1,7 @@
 """Annotation data structures for 3D medical imaging."""
 
+import logging
+import math
 from dataclasses import dataclass, field
 from typing import Dict, List, Tuple, Optional
 import numpy as np
@@ -7,6 +9,21 @@ import numpy as np
 import config
 
 
+logger = logging.getLogger(__name__)
+
+# Slices of the reference mask compared per step when seeding a new mask,
+# bounding the temporary boolean array to this many slices
+_REFERENCE_CHUNK_SLICES = 32
+
+# Volume coordinate that is fixed on each slice plane
+_PLANE_AXIS = {"axial": "z", "sagittal": "x", "coronal": "y"}
+
+
+def _nearby_slices(coord: float) -> range:
+    """Slice indices within the half-voxel tolerance of a coordinate."""
+    return range(math.ceil(coord - 0.5), math.floor(coord + 0.5) + 1)
+
+
 @dataclass
 class Keypoint:
     """Single 3D keypoint with label.
@@ -121,6 +138,13 @@ class LineSegment:
             color=tuple(d.get("color", (255, 0, 0))),
         )
 
+    @classmethod
+    def from_endpoints(cls, points: np.ndarray, label: str = "",
+                       color: Tuple[int, int, int] = (255, 0, 0)) -> "LineSegment":
+        """Create from a (2, 3) array of (x, y, z) endpoints."""
+        (x1, y1, z1), (x2, y2, z2) = [[float(c) for c in p] for p in points]
+        return cls(x1=x1, y1=y1, z1=z1, x2=x2, y2=y2, z2=z2, label=label, color=color)
+
     def get_2d_positions(
         self, plane: str, slice_index: int
     ) -> Optional[Tuple[Tuple[float, float], Tuple[float, float]]]:
@@ -179,7 +203,8 @@ class MaskAnnotation:
             slice_index: Slice index
 
         Returns:
-            2D numpy array (binary mask)
+            2D numpy array (binary mask). This is a view into the volume
+            mask, so writing to it edits the annotation directly.
         """
         if plane == "axial":
             return self.mask[slice_index, :, :]
@@ -225,18 +250,47 @@ class Annotations:
     line_segments: List[LineSegment] = field(default_factory=list)
     masks: Dict[int, MaskAnnotation] = field(default_factory=dict)
     modified: bool = False
+    # Bumped whenever mask voxels or the set of masks change, so views can
+    # tell whether a cached overlay is still current
+    mask_version: int = field(default=0, init=False, repr=False, compare=False)
+    # Keypoint indices by plane and slice, built on first lookup per plane
+    _keypoint_buckets: Dict[str, Dict[int, List[int]]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # Line segment indices by plane and the slice of their first endpoint
+    _lineseg_buckets: Dict[str, Dict[int, List[int]]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # get_line_segments_on_slice() results keyed by (plane, slice_index)
+    _lineseg_slice_index: Dict[Tuple[str, int], list] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # get_line_segment_endpoints_on_slice() results keyed by (plane, slice_index)
+    _lineseg_endpoint_index: Dict[Tuple[str, int], tuple] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     def add_keypoint(self, kp: Keypoint) -> None:
         """Add a new keypoint."""
         self.keypoints.append(kp)
+        self.keypoints_changed()
         self.modified = True
 
     def remove_keypoint(self, index: int) -> None:
         """Remove keypoint by index."""
         if 0 <= index < len(self.keypoints):
             self.keypoints.pop(index)
+            self.keypoints_changed()
             self.modified = True
 
+    def keypoints_changed(self) -> None:
+        """Drop the per-slice keypoint buckets.
+
+        Called by add/remove; callers that move keypoints in place must
+        call it too.
+        """
+        self._keypoint_buckets.clear()
+
     def remove_nearest_keypoint(
         self, x: float, y: float, z: float, max_distance: float = 10.0
     ) -> bool:
@@ -252,26 +306,56 @@ class Annotations:
         if not self.keypoints:
             return False
 
-        target = Keypoint(x=x, y=y, z=z)
-        distances = [(i, kp.distance_to(target)) for i, kp in enumerate(self.keypoints)]
-        distances.sort(key=lambda x: x[1])
+        # Nearest by squared distance; no sqrt or sort needed
+        best_idx, best_dist_sq = min(
+            ((i, (kp.x - x) ** 2 + (kp.y - y) ** 2 + (kp.z - z) ** 2)
+             for i, kp in enumerate(self.keypoints)),
+            key=lambda item: item[1],
+        )
 
-        if distances[0][1] <= max_distance:
-            self.remove_keypoint(distances[0][0])
+        if best_dist_sq <= max_distance * max_distance:
+            self.remove_keypoint(best_idx)
             return True
         return False
 
     def add_line_segment(self, ls: LineSegment) -> None:
         """Add a new line segment."""
         self.line_segments.append(ls)
+        self.line_segments_changed()
         self.modified = True
 
     def remove_line_segment(self, index: int) -> None:
         """Remove line segment by index."""
         if 0 <= index < len(self.line_segments):
             self.line_segments.pop(index)
+            self.line_segments_changed()
             self.modified = True
 
+    def line_segments_changed(self) -> None:
+        """Drop cached per-slice line segment lookups.
+
+        Called by add/remove; callers that move endpoints in place must
+        call it too.
+        """
+        self._lineseg_buckets.clear()
+        self._lineseg_slice_index.clear()
+        self._lineseg_endpoint_index.clear()
+
+    def remove_line_segment_object(self, ls: LineSegment) -> bool:
+        """Remove a specific line segment object (matched by identity).
+
+        Searches from the end, since the segment being replaced is usually
+        the most recently added one.
+
+        Returns:
+            True if the segment was found and removed
+        """
+        for i in range(len(self.line_segments) - 1, -1, -1):
+            if self.line_segments[i] is ls:
+                self.remove_line_segment(i)
+                return True
+        return False
+
     def remove_nearest_line_segment(
         self, x: float, y: float, z: float, max_distance: float = 15.0
     ) -> bool:
@@ -289,8 +373,8 @@ class Annotations:
         if not self.line_segments:
             return False
 
-        def point_to_segment_distance(px, py, pz, ls):
-            """Calculate distance from point to line segment."""
+        def point_to_segment_distance_sq(px, py, pz, ls):
+            """Calculate squared distance from point to line segment."""
             # Vector from p1 to p2
             dx = ls.x2 - ls.x1
             dy = ls.y2 - ls.y1
@@ -304,7 +388,7 @@ class Annotations:
             segment_len_sq = dx * dx + dy * dy + dz * dz
             if segment_len_sq == 0:
                 # Degenerate segment (single point)
-                return np.sqrt(fx * fx + fy * fy + fz * fz)
+                return fx * fx + fy * fy + fz * fz
 
             # Parameter t for closest point on infinite line
             t = (fx * dx + fy * dy + fz * dz) / segment_len_sq
@@ -315,17 +399,17 @@ class Annotations:
             cy = ls.y1 + t * dy
             cz = ls.z1 + t * dz
 
-            # Distance
-            return np.sqrt((px - cx) ** 2 + (py - cy) ** 2 + (pz - cz) ** 2)
+            # Squared distance
+            return (px - cx) ** 2 + (py - cy) ** 2 + (pz - cz) ** 2
 
-        distances = [
-            (i, point_to_segment_distance(x, y, z, ls))
-            for i, ls in enumerate(self.line_segments)
-        ]
-        distances.sort(key=lambda x: x[1])
+        best_idx, best_dist_sq = min(
+            ((i, point_to_segment_distance_sq(x, y, z, ls))
+             for i, ls in enumerate(self.line_segments)),
+            key=lambda item: item[1],
+        )
 
-        if distances[0][1] <= max_distance:
-            self.remove_line_segment(distances[0][0])
+        if best_dist_sq <= max_distance * max_distance:
+            self.remove_line_segment(best_idx)
             return True
         return False
 
@@ -339,13 +423,53 @@ class Annotations:
             slice_index: Current slice index
 
         Returns:
-            List of (index, line_segment, ((x1_2d, y1_2d), (x2_2d, y2_2d))) tuples
+            List of (index, line_segment, ((x1_2d, y1_2d), (x2_2d, y2_2d))) tuples.
+            The list is cached until line_segments_changed(); do not modify it.
         """
-        result = []
-        for i, ls in enumerate(self.line_segments):
-            pos_2d = ls.get_2d_positions(plane, slice_index)
-            if pos_2d is not None:
-                result.append((i, ls, pos_2d))
+        key = (plane, slice_index)
+        result = self._lineseg_slice_index.get(key)
+        if result is None:
+            result = []
+            buckets = self._lineseg_buckets.get(plane)
+            if buckets is None and plane in _PLANE_AXIS:
+                # Both endpoints must be on the slice, so bucketing by the
+                # first one finds every candidate
+                buckets = self._lineseg_buckets[plane] = {}
+                attr = _PLANE_AXIS[plane] + "1"
+                for i, ls in enumerate(self.line_segments):
+                    for s in _nearby_slices(getattr(ls, attr)):
+                        buckets.setdefault(s, []).append(i)
+            for i in (buckets or {}).get(slice_index, ()):
+                ls = self.line_segments[i]
+                pos_2d = ls.get_2d_positions(plane, slice_index)
+                if pos_2d is not None:
+                    result.append((i, ls, pos_2d))
+            self._lineseg_slice_index[key] = result
+        return result
+
+    def get_line_segment_endpoints_on_slice(
+        self, plane: str, slice_index: int
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Get 2D endpoints of line segments on given slice as arrays.
+
+        Args:
+            plane: One of 'axial', 'sagittal', 'coronal'
+            slice_index: Current slice index
+
+        Returns:
+            Tuple of (indices, starts, ends): (N,) segment indices and (N, 2)
+            float32 start/end positions in 2D view coordinates. Cached until
+            line_segments_changed(); do not modify.
+        """
+        key = (plane, slice_index)
+        result = self._lineseg_endpoint_index.get(key)
+        if result is None:
+            on_slice = self.get_line_segments_on_slice(plane, slice_index)
+            indices = np.array([idx for idx, _, _ in on_slice], dtype=np.intp)
+            starts = np.array([pos[0] for _, _, pos in on_slice], dtype=np.float32).reshape(-1, 2)
+            ends = np.array([pos[1] for _, _, pos in on_slice], dtype=np.float32).reshape(-1, 2)
+            result = (indices, starts, ends)
+            self._lineseg_endpoint_index[key] = result
         return result
 
     def get_or_create_mask(
@@ -370,10 +494,15 @@ class Annotations:
             if reference_mask is not None:
                 # Map UI label_id to reference mask value
                 ref_value = config.LABEL_TO_REFERENCE_VALUE.get(label_id, label_id)
-                print(f"  [get_or_create_mask] label_id={label_id} -> ref_value={ref_value}")
-                # Extract only the specific label from reference mask
-                mask_data = (reference_mask == ref_value).astype(np.uint8) * 255
-                print(f"  [get_or_create_mask] extracted {np.sum(mask_data > 0)} voxels")
+                logger.debug("Mask for label %s initialized from reference value %s",
+                             label_id, ref_value)
+                # Extract only the specific label from reference mask. The
+                # zeroed output is allocated lazily, so only the label's
+                # voxels are written
+                mask_data = np.zeros(reference_mask.shape, dtype=np.uint8)
+                for z in range(0, reference_mask.shape[0], _REFERENCE_CHUNK_SLICES):
+                    chunk = slice(z, z + _REFERENCE_CHUNK_SLICES)
+                    np.copyto(mask_data[chunk], 255, where=reference_mask[chunk] == ref_value)
             else:
                 mask_data = np.zeros(volume_shape, dtype=np.uint8)
             self.masks[label_id] = MaskAnnotation(
@@ -382,20 +511,31 @@ class Annotations:
                 mask=mask_data,
                 color=color,
             )
+            self.masks_changed()
             self.modified = True
         return self.masks[label_id]
 
     def update_mask(self, label_id: int, mask: MaskAnnotation) -> None:
         """Update or add a mask annotation."""
         self.masks[label_id] = mask
+        self.masks_changed()
         self.modified = True
 
     def clear_mask(self, label_id: int) -> None:
         """Remove a mask annotation."""
         if label_id in self.masks:
             del self.masks[label_id]
+            self.masks_changed()
             self.modified = True
 
+    def masks_changed(self) -> None:
+        """Record a change to the masks.
+
+        Called when masks are added or removed; callers that write mask
+        voxels directly must call it too.
+        """
+        self.mask_version += 1
+
     def get_keypoints_on_slice(
         self, plane: str, slice_index: int
     ) -> List[Tuple[int, Keypoint, Tuple[float, float]]]:
@@ -408,8 +548,19 @@ class Annotations:
         Returns:
             List of (index, keypoint, 2d_position) tuples
         """
+        buckets = self._keypoint_buckets.get(plane)
+        if buckets is None:
+            if plane not in _PLANE_AXIS:
+                return []
+            buckets = self._keypoint_buckets[plane] = {}
+            attr = _PLANE_AXIS[plane]
+            for i, kp in enumerate(self.keypoints):
+                for s in _nearby_slices(getattr(kp, attr)):
+                    buckets.setdefault(s, []).append(i)
+
         result = []
-        for i, kp in enumerate(self.keypoints):
+        for i in buckets.get(slice_index, ()):
+            kp = self.keypoints[i]
             pos_2d = kp.get_2d_position(plane, slice_index)
             if pos_2d is not None:
                 result.append((i, kp, pos_2d))
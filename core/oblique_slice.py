@@ -1,9 +1,10 @@
 """Oblique plane definition and slice extraction for cardiac view planning."""
 
+import math
 from dataclasses import dataclass
 from typing import Tuple, Optional, NamedTuple
 import numpy as np
-from scipy.ndimage import map_coordinates
+from scipy.ndimage import affine_transform
 
 
 class P4CHPlaneResult(NamedTuple):
@@ -16,12 +17,23 @@ class P4CHPlaneResult(NamedTuple):
 
 def normalize(v: np.ndarray) -> np.ndarray:
     """Normalize a vector to unit length."""
-    norm = np.linalg.norm(v)
+    norm = math.sqrt(float(np.dot(v, v)))
     if norm < 1e-10:
         return v
     return v / norm
 
 
+def cross(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Cross product of two 3-vectors.
+
+    Written out in scalar form: np.cross has a large fixed overhead for
+    single vectors, and plane construction calls it several times.
+    """
+    a0, a1, a2 = np.asarray(a, dtype=np.float64).tolist()
+    b0, b1, b2 = np.asarray(b, dtype=np.float64).tolist()
+    return np.array([a1 * b2 - a2 * b1, a2 * b0 - a0 * b2, a0 * b1 - a1 * b0])
+
+
 @dataclass
 class ObliquePlane:
     """Definition of an oblique plane in 3D volume space.
@@ -52,12 +64,17 @@ class ObliquePlane:
             (x, y, z) in volume coordinates
         """
         # Convert from pixel coords (0 to width/height) to centered coords
-        u = x2d - self.width / 2
-        v = y2d - self.height / 2
-
-        # Calculate 3D position
-        pos = self.origin + u * self.u_axis + v * self.v_axis + offset * self.normal
-        return (float(pos[0]), float(pos[1]), float(pos[2]))
+        u = float(x2d) - self.width / 2
+        v = float(y2d) - self.height / 2
+
+        # Calculate 3D position (scalar math: cheaper than numpy for one point)
+        ox, oy, oz = self.origin.tolist()
+        ux, uy, uz = self.u_axis.tolist()
+        vx, vy, vz = self.v_axis.tolist()
+        nx, ny, nz = self.normal.tolist()
+        return (ox + u * ux + v * vx + offset * nx,
+                oy + u * uy + v * vy + offset * ny,
+                oz + u * uz + v * vz + offset * nz)
 
     def map_3d_to_2d(self, x: float, y: float, z: float,
                      tolerance: float = 5.0) -> Optional[Tuple[float, float]]:
@@ -70,25 +87,59 @@ class ObliquePlane:
         Returns:
             (x2d, y2d) in slice coordinates, or None if point is not near the plane
         """
-        point = np.array([x, y, z])
-
-        # Vector from origin to point
-        diff = point - self.origin
+        # Vector from origin to point (scalar math: cheaper than numpy for one point)
+        ox, oy, oz = self.origin.tolist()
+        dx, dy, dz = float(x) - ox, float(y) - oy, float(z) - oz
 
         # Distance from plane
-        dist = np.abs(np.dot(diff, self.normal))
+        nx, ny, nz = self.normal.tolist()
+        dist = abs(dx * nx + dy * ny + dz * nz)
         if dist > tolerance:
             return None
 
         # Project to 2D
-        u = np.dot(diff, self.u_axis)
-        v = np.dot(diff, self.v_axis)
+        ux, uy, uz = self.u_axis.tolist()
+        vx, vy, vz = self.v_axis.tolist()
+        u = dx * ux + dy * uy + dz * uz
+        v = dx * vx + dy * vy + dz * vz
 
         # Convert to pixel coordinates
         x2d = u + self.width / 2
         y2d = v + self.height / 2
 
-        return (float(x2d), float(y2d))
+        return (x2d, y2d)
+
+    def map_3d_to_2d_batch(self, points: np.ndarray,
+                           tolerance: float = 5.0) -> Optional[np.ndarray]:
+        """Project several 3D points to 2D slice coordinates at once.
+
+        Args:
+            points: (N, 3) array of (x, y, z) volume coordinates
+            tolerance: Maximum distance from plane to consider a point visible
+
+        Returns:
+            (N, 2) array of (x2d, y2d) slice coordinates, or None if any
+            point is not near the plane
+        """
+        diff = np.asarray(points, dtype=np.float64) - self.origin
+        if np.any(np.abs(diff @ self.normal) > tolerance):
+            return None
+        pos = diff @ np.column_stack([self.u_axis, self.v_axis])
+        pos += (self.width / 2, self.height / 2)
+        return pos
+
+    def pixel_affine(self, offset: float = 0.0) -> np.ndarray:
+        """Get the affine map from slice pixels to 3D volume coordinates.
+
+        Args:
+            offset: Distance along normal from origin (for scrolling)
+
+        Returns:
+            3x3 matrix M with (x, y, z) = M @ (u, v, 1), where u and v are
+            pixel coordinates relative to the slice center
+        """
+        origin = self.origin + offset * self.normal
+        return np.column_stack([self.u_axis, self.v_axis, origin])
 
     def with_offset(self, offset: float) -> 'ObliquePlane':
         """Create a new plane parallel to this one, shifted by offset along normal."""
@@ -102,41 +153,92 @@ class ObliquePlane:
         )
 
 
-def extract_oblique_slice(volume: np.ndarray, plane: ObliquePlane,
-                          offset: float = 0.0) -> np.ndarray:
-    """Extract an arbitrary oblique slice from a 3D volume.
+def plane_axis_range(plane: ObliquePlane, axis: int = 0,
+                     offset: float = 0.0) -> Tuple[float, float]:
+    """Get the range of volume coordinates sampled by an oblique slice along one axis.
+
+    Coordinates are linear in the pixel grid, so the extremes lie at
+    the four corners of the slice.
 
     Args:
-        volume: 3D numpy array in (z, y, x) order
         plane: ObliquePlane defining the slice orientation and position
+        axis: Volume axis in (z, y, x) order (0 = z, 1 = y, 2 = x)
         offset: Distance along normal from plane origin (for scrolling)
 
     Returns:
-        2D numpy array of shape (height, width)
+        (min, max) coordinate along the axis
     """
-    # Create sampling grid in plane coordinates
-    # u goes from -width/2 to +width/2, v goes from -height/2 to +height/2
-    u_coords = np.arange(plane.width) - plane.width / 2
-    v_coords = np.arange(plane.height) - plane.height / 2
-    uu, vv = np.meshgrid(u_coords, v_coords)
+    # Plane vectors are stored in (x, y, z) order
+    i = 2 - axis
+    u_lo, u_hi = -plane.width / 2, plane.width - 1 - plane.width / 2
+    v_lo, v_hi = -plane.height / 2, plane.height - 1 - plane.height / 2
+    c0 = plane.origin[i] + offset * plane.normal[i]
+    corners = [
+        c0 + u * plane.u_axis[i] + v * plane.v_axis[i]
+        for u in (u_lo, u_hi) for v in (v_lo, v_hi)
+    ]
+    return float(min(corners)), float(max(corners))
 
-    # Apply offset along normal
-    origin = plane.origin + offset * plane.normal
 
-    # Convert to 3D volume coordinates
-    # point_3d = origin + u * u_axis + v * v_axis
-    x_coords = origin[0] + uu * plane.u_axis[0] + vv * plane.v_axis[0]
-    y_coords = origin[1] + uu * plane.u_axis[1] + vv * plane.v_axis[1]
-    z_coords = origin[2] + uu * plane.u_axis[2] + vv * plane.v_axis[2]
+def sampling_axes(plane: ObliquePlane) -> Tuple[int, int, int]:
+    """Choose the volume axis order that suits sampling this plane.
 
-    # Stack for scipy interpolation
-    # Volume is in (z, y, x) order, so coords should be [z, y, x]
-    coords = np.array([z_coords, y_coords, x_coords])
+    Trilinear sampling walks the two in-plane directions, so it reads
+    memory most coherently when the axis closest to the plane normal is
+    the middle axis and the in-plane axes are the outer ones.
+
+    Args:
+        plane: ObliquePlane defining the slice orientation
+
+    Returns:
+        Axis permutation of a (z, y, x) volume, one of (0, 1, 2),
+        (1, 2, 0) or (2, 0, 1)
+    """
+    # Dominant normal component, converted from (x, y, z) to (z, y, x) order
+    n = 2 - int(np.argmax(np.abs(plane.normal)))
+    return ((n - 1) % 3, n, (n + 1) % 3)
+
+
+def extract_oblique_slice(volume: np.ndarray, plane: ObliquePlane,
+                          offset: float = 0.0, slab_start: int = 0,
+                          axes: Tuple[int, int, int] = (0, 1, 2)) -> np.ndarray:
+    """Extract an arbitrary oblique slice from a 3D volume.
+
+    Args:
+        volume: 3D numpy array in (z, y, x) order, or a copy of one
+            transposed by `axes`
+        plane: ObliquePlane defining the slice orientation and position
+        offset: Distance along normal from plane origin (for scrolling)
+        slab_start: Index along the first axis of `volume` of its first
+            plane when it is a slab of the full volume
+        axes: Permutation such that `volume` is a (z, y, x) volume
+            transposed by these axes
+
+    Returns:
+        2D numpy array of shape (height, width)
+    """
+    # Affine from centered pixel coords (u, v, 1) to volume coords, with
+    # rows reordered from (x, y, z) to the axis order of `volume`
+    xyz = plane.pixel_affine(offset)
+    affine = xyz[[2 - a for a in axes]]
+    affine[0, 2] -= slab_start
+
+    # Sample as a (1, H, W) output of an affine resampling: output index
+    # (0, row, col) maps to u = col - width/2, v = row - height/2. Scipy
+    # computes each voxel position on the fly, so no coordinate arrays
+    # are built
+    matrix = np.zeros((3, 3))
+    matrix[:, 1] = affine[:, 1]
+    matrix[:, 2] = affine[:, 0]
+    shift = affine[:, 2] - affine[:, 0] * (plane.width / 2) - affine[:, 1] * (plane.height / 2)
 
     # Interpolate using linear interpolation
-    slice_data = map_coordinates(volume, coords, order=1, mode='constant', cval=0)
+    slice_data = affine_transform(
+        volume, matrix, shift, output_shape=(1, plane.height, plane.width),
+        order=1, mode='constant', cval=0
+    )
 
-    return slice_data
+    return slice_data[0]
 
 
 def create_p2ch_plane_from_axial_line(
@@ -243,7 +345,7 @@ def create_p4ch_plane_from_p2ch_line(
     if rotation_mode == "perp_p2ch":
         # Mode: perpendicular to p2ch at 0°
         # Base normal is perpendicular to both p2ch normal and long axis
-        base_normal = normalize(np.cross(p2ch_plane.normal, long_axis))
+        base_normal = normalize(cross(p2ch_plane.normal, long_axis))
     else:
         # Mode: rotate around long axis (default)
         # Base normal is p2ch normal projected onto the plane perpendicular to long axis
@@ -252,7 +354,7 @@ def create_p4ch_plane_from_p2ch_line(
         if np.linalg.norm(proj) < 1e-6:
             # Edge case: p2ch normal is parallel to long axis
             # Fall back to perpendicular mode
-            base_normal = normalize(np.cross(p2ch_plane.normal, long_axis))
+            base_normal = normalize(cross(p2ch_plane.normal, long_axis))
         else:
             base_normal = normalize(proj)
 
@@ -264,7 +366,7 @@ def create_p4ch_plane_from_p2ch_line(
     sin_t = np.sin(theta)
 
     # Since base_normal ⊥ long_axis, the (k·v) term is 0
-    p4ch_normal = base_normal * cos_t + np.cross(long_axis, base_normal) * sin_t
+    p4ch_normal = base_normal * cos_t + cross(long_axis, base_normal) * sin_t
     p4ch_normal = normalize(p4ch_normal)
 
     # V-axis: along the long axis (so heart appears vertical in image)
@@ -272,10 +374,10 @@ def create_p4ch_plane_from_p2ch_line(
     v_axis = -long_axis  # Negative so valve (superior) is at top
 
     # U-axis: perpendicular to both v_axis and normal (horizontal in image)
-    u_axis = normalize(np.cross(v_axis, p4ch_normal))
+    u_axis = normalize(cross(v_axis, p4ch_normal))
 
     # Compute base u_axis (at 0 degrees) for rotation optimization
-    base_u_axis = normalize(np.cross(v_axis, base_normal))
+    base_u_axis = normalize(cross(v_axis, base_normal))
 
     # Origin: valve point (the plane passes through valve)
     origin = valve_3d.copy()
@@ -345,7 +447,7 @@ def create_sax_plane_from_p4ch_line(
     u_axis = normalize(u_axis)
 
     # V-axis: perpendicular to both
-    v_axis = normalize(np.cross(sax_normal, u_axis))
+    v_axis = normalize(cross(sax_normal, u_axis))
 
     # Origin: midpoint of line
     origin = (p1_3d + p2_3d) / 2
@@ -1,19 +1,32 @@
 """Patient data container."""
 
+import os
+import re
 from dataclasses import dataclass, field
+from fnmatch import translate
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import AbstractSet, Callable, List, Optional, Tuple
 
+import config
 from .volume import VolumeData
 from .annotation import Annotations
 
 
+@lru_cache(maxsize=None)
+def _glob_matcher(pattern: str) -> Callable[[str], Optional[re.Match]]:
+    """Compile a file name glob once, matching like fnmatch on this platform."""
+    flags = re.IGNORECASE if os.path.normcase("A") == "a" else 0
+    return re.compile(translate(pattern), flags).match
+
+
 @dataclass
 class Patient:
     """Represents a single patient with image, mask, and annotations.
 
     Supports lazy loading to manage memory when working with
-    multiple patients.
+    multiple patients: a new Patient holds only its file paths, so listing
+    a large folder is cheap.
     """
 
     patient_id: str
@@ -26,18 +39,33 @@ class Patient:
     annotations: Optional[Annotations] = field(default=None, repr=False)
 
     _loaded: bool = field(default=False, repr=False)
+    _annotations_dir: Optional[Path] = field(default=None, repr=False)
 
     def load(self) -> None:
-        """Load image and optional reference mask."""
+        """Load image and optional reference mask.
+
+        Safe to call from a worker thread: the volumes are only assigned
+        once both have finished loading, so the GUI thread never sees a
+        half-loaded patient.
+        """
         if self._loaded:
             return
 
-        self.image = VolumeData(self.image_path)
-        self.image.load()
+        image = VolumeData(self.image_path)
+        image.load()
 
+        reference_mask = None
         if self.mask_path and Path(self.mask_path).exists():
-            self.reference_mask = VolumeData(self.mask_path)
-            self.reference_mask.load()
+            reference_mask = VolumeData(self.mask_path)
+            reference_mask.load()
+
+        if config.SAGITTAL_SLICE_LAYOUT:
+            image.build_sagittal_layout()
+            if reference_mask is not None:
+                reference_mask.build_sagittal_layout()
+
+        self.image = image
+        self.reference_mask = reference_mask
 
         # Initialize empty annotations if not already loaded from file
         if self.annotations is None:
@@ -64,6 +92,14 @@ class Patient:
         """Check if volume data is loaded."""
         return self._loaded
 
+    @property
+    def annotations_dir(self) -> Path:
+        """Directory the patient's annotations are saved in (next to the image)."""
+        if self._annotations_dir is None:
+            from config import ANNOTATIONS_DIR
+            self._annotations_dir = Path(self.image_path).parent / ANNOTATIONS_DIR
+        return self._annotations_dir
+
     @property
     def has_unsaved_changes(self) -> bool:
         """Check if there are unsaved annotation changes."""
@@ -76,22 +112,28 @@ class Patient:
             self.load()
         return self.image.shape
 
+    @cached_property
+    def _display_names(self) -> Tuple[str, str]:
+        """Display names without and with the unsaved-changes marker."""
+        return self.patient_id, f"{self.patient_id} *"
+
     def get_display_name(self) -> str:
         """Get display name for patient list."""
-        name = self.patient_id
-        if self.has_unsaved_changes:
-            name += " *"
-        return name
+        return self._display_names[self.has_unsaved_changes]
 
     @classmethod
-    def from_image_path(cls, image_path: str) -> "Patient":
+    def from_image_path(cls, image_path: str,
+                        sibling_names: Optional[AbstractSet[str]] = None) -> "Patient":
         """Create Patient from image file path.
 
         Automatically determines patient ID and looks for corresponding
-        mask file using naming convention.
+        mask file using naming convention. Only the file name is used; the
+        NIfTI files are not opened until load().
 
         Args:
             image_path: Path to image NIfTI file
+            sibling_names: File names in the image's folder, if already
+                listed; used instead of probing the filesystem for the mask
 
         Returns:
             Patient instance
@@ -105,8 +147,13 @@ class Patient:
         if filename.endswith(IMAGE_SUFFIX):
             patient_id = filename[:-len(IMAGE_SUFFIX)]
             # Look for corresponding mask
-            mask_path = path.parent / f"{patient_id}{LABEL_SUFFIX}"
-            mask_path = str(mask_path) if mask_path.exists() else None
+            mask_name = f"{patient_id}{LABEL_SUFFIX}"
+            mask_path = path.parent / mask_name
+            if sibling_names is not None:
+                has_mask = mask_name in sibling_names
+            else:
+                has_mask = mask_path.exists()
+            mask_path = str(mask_path) if has_mask else None
         else:
             # Generic NIfTI file
             patient_id = path.stem
@@ -119,3 +166,37 @@ class Patient:
             image_path=str(path),
             mask_path=mask_path,
         )
+
+    @classmethod
+    def scan_folder(cls, folder_path: str) -> List["Patient"]:
+        """Create Patients for all image files in a folder.
+
+        The folder is listed once; label files are skipped and masks are
+        matched against the listing rather than probed one by one.
+
+        Args:
+            folder_path: Path to folder containing NIfTI files
+
+        Returns:
+            List of Patient instances, sorted by file name
+        """
+        from config import NIFTI_PATTERN, LABEL_SUFFIX
+
+        is_image = _glob_matcher(NIFTI_PATTERN)
+        names = set()
+        image_names = []
+        with os.scandir(folder_path) as it:
+            for entry in it:
+                # is_file() uses the cached directory entry type where available
+                if not entry.is_file():
+                    continue
+                name = entry.name
+                names.add(name)
+                if not name.endswith(LABEL_SUFFIX) and is_image(name):
+                    image_names.append(name)
+
+        image_names.sort()
+        return [
+            cls.from_image_path(os.path.join(folder_path, name), sibling_names=names)
+            for name in image_names
+        ]
@@ -1,14 +1,35 @@
 """Save and load annotations."""
 
 import json
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Iterable, Optional
 import numpy as np
 
+import config
 from .annotation import Annotations, Keypoint, LineSegment, MaskAnnotation
 from .patient import Patient
 
 
+def _write_npz(path: Path, arrays: Dict[str, np.ndarray]) -> None:
+    """Write arrays to a deflate-compressed .npz readable by np.load.
+
+    Like np.savez_compressed, but streams each array straight into the
+    archive at config.MASK_COMPRESS_LEVEL.
+
+    Args:
+        path: Output .npz file
+        arrays: Mapping of array name -> array
+    """
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED,
+                         compresslevel=config.MASK_COMPRESS_LEVEL) as zf:
+        for name, array in arrays.items():
+            with zf.open(f"{name}.npy", "w", force_zip64=True) as f:
+                np.lib.format.write_array(f, np.asanyarray(array),
+                                          allow_pickle=False)
+
+
 def save_patient_annotations(patient: Patient, output_dir: Path) -> None:
     """Save annotations for a single patient.
 
@@ -50,7 +71,7 @@ def save_patient_annotations(patient: Patient, output_dir: Path) -> None:
                     "color": list(mask_ann.color),
                 }
         if mask_arrays:
-            np.savez_compressed(str(masks_file), **mask_arrays)
+            _write_npz(masks_file, mask_arrays)
 
     # Save JSON
     json_file = output_dir / f"{ann.patient_id}.json"
@@ -112,22 +133,30 @@ def load_patient_annotations(
     return ann
 
 
-def save_all_patients(patients: Dict[str, Patient], output_dir: Path) -> int:
-    """Save all patients with unsaved changes.
+def save_all_patients(patients: Iterable[Patient], output_dir: Path) -> int:
+    """Save the given patients that have unsaved changes.
+
+    Patients are written concurrently (up to config.SAVE_WORKERS at a time);
+    mask compression and file writes release the GIL.
 
     Args:
-        patients: Dictionary of patient_id -> Patient
+        patients: Patients to save, e.g. the modified ones from the patient
+            list (pass dict.values() to consider a whole cohort)
         output_dir: Directory to save annotations to
 
     Returns:
         Number of patients saved
     """
-    saved = 0
-    for patient in patients.values():
-        if patient.has_unsaved_changes:
-            save_patient_annotations(patient, output_dir)
-            saved += 1
-    return saved
+    to_save = [p for p in patients if p.has_unsaved_changes]
+    if not to_save:
+        return 0
+
+    workers = min(len(to_save), config.SAVE_WORKERS)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        # Consume results so the first error, if any, is raised here
+        for _ in pool.map(lambda p: save_patient_annotations(p, output_dir), to_save):
+            pass
+    return len(to_save)
 
 
 def try_load_existing_annotations(patient: Patient) -> bool:
@@ -142,18 +171,13 @@ def try_load_existing_annotations(patient: Patient) -> bool:
     Returns:
         True if annotations were loaded
     """
-    from config import ANNOTATIONS_DIR
-
-    image_dir = Path(patient.image_path).parent
-    annotations_dir = image_dir / ANNOTATIONS_DIR
-
     # Need volume shape, so ensure patient is loaded
     if not patient.is_loaded:
         patient.load()
 
     volume_shape = patient.image.shape
 
-    ann = load_patient_annotations(patient.patient_id, annotations_dir, volume_shape)
+    ann = load_patient_annotations(patient.patient_id, patient.annotations_dir, volume_shape)
     if ann is not None:
         patient.annotations = ann
         return True
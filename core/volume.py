@@ -1,7 +1,7 @@
 """Volume data handling with SimpleITK."""
 
 from dataclasses import dataclass, field
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
 import SimpleITK as sitk
 import numpy as np
 
@@ -20,6 +20,10 @@ class VolumeData:
     filepath: str
     _image: Optional[sitk.Image] = field(default=None, repr=False)
     _array: Optional[np.ndarray] = field(default=None, repr=False)
+    _sampling: Optional[Tuple[np.ndarray, float]] = field(default=None, repr=False)
+    _layouts: Dict[Tuple[int, int, int], np.ndarray] = field(default_factory=dict, repr=False)
+    # Copy of the array in (x, z, y) order, so sagittal slices are contiguous
+    _sagittal_array: Optional[np.ndarray] = field(default=None, repr=False)
 
     # Cached metadata
     shape: Tuple[int, int, int] = field(default=(0, 0, 0))
@@ -61,6 +65,62 @@ class VolumeData:
         """Free memory by clearing cached data."""
         self._array = None
         self._image = None
+        self._sampling = None
+        self._layouts.clear()
+        self._sagittal_array = None
+
+    def get_sampling_array(self) -> Tuple[np.ndarray, float]:
+        """Get a compact copy of the array for interpolated sampling.
+
+        Integer volumes of up to 16 bits are used as is. Anything wider
+        (float CT/MR exports, 32-bit ints) is quantized to int16 so that
+        array ~= sampling_array * scale. Zero stays zero, so constant-border
+        sampling is unaffected, and the scale can be applied after
+        interpolation (or folded into the window) since it is linear.
+
+        Returns:
+            (sampling_array, scale)
+        """
+        if self._sampling is None:
+            array = self.array
+            if np.issubdtype(array.dtype, np.integer) and array.dtype.itemsize <= 2:
+                self._sampling = (array, 1.0)
+            else:
+                max_abs = float(np.max(np.abs(array))) if array.size else 0.0
+                scale = max_abs / 32767 if max_abs > 0 else 1.0
+                quantized = np.rint(array / scale).astype(np.int16)
+                self._sampling = (quantized, scale)
+        return self._sampling
+
+    def get_layout(self, axes: Tuple[int, int, int]) -> np.ndarray:
+        """Get a C-contiguous copy of the sampling array with its axes permuted.
+
+        Copies are built on first use and kept until the volume is unloaded.
+
+        Args:
+            axes: Axis permutation, as for np.transpose
+
+        Returns:
+            Array equal to get_sampling_array()[0].transpose(axes)
+        """
+        axes = tuple(axes)
+        sampling_array, _ = self.get_sampling_array()
+        if axes == (0, 1, 2):
+            return sampling_array
+        if axes not in self._layouts:
+            self._layouts[axes] = np.ascontiguousarray(sampling_array.transpose(axes))
+        return self._layouts[axes]
+
+    def build_sagittal_layout(self) -> None:
+        """Keep an x-major copy of the array for sagittal slicing.
+
+        Sagittal slices of the (z, y, x) array are strided along the
+        fastest axis and several times slower to read than axial ones.
+        The copy doubles the memory of the volume and is kept until it is
+        unloaded.
+        """
+        if self._sagittal_array is None:
+            self._sagittal_array = np.ascontiguousarray(self.array.transpose(2, 0, 1))
 
     def get_axial_slice(self, z: int) -> np.ndarray:
         """Get axial slice (XY plane at given Z index).
@@ -84,6 +144,8 @@ class VolumeData:
             2D numpy array of shape (height, width) = (Z, Y)
         """
         x = max(0, min(x, self.shape[2] - 1))
+        if self._sagittal_array is not None:
+            return self._sagittal_array[x]
         return self.array[:, :, x]
 
     def get_coronal_slice(self, y: int) -> np.ndarray:
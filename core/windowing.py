@@ -0,0 +1,57 @@
+"""Window/level mapping of slice intensities to 8-bit display values."""
+
+from functools import lru_cache
+from typing import Optional
+
+import numpy as np
+
+
+@lru_cache(maxsize=8)
+def _window_lut(dtype: np.dtype, vmin: float, vmax: float) -> np.ndarray:
+    """Get a uint8 lookup table applying the window to every value of dtype.
+
+    The table is indexed by the raw bits of the value (the slice viewed as
+    unsigned). Tables are shared between views showing the same window.
+
+    Args:
+        dtype: Integer dtype of at most 16 bits
+        vmin, vmax: Window bounds in the same units as the values
+
+    Returns:
+        Read-only array of 2**bits uint8 display values
+    """
+    unsigned = np.dtype(f'u{dtype.itemsize}')
+    values = np.arange(2 ** (8 * dtype.itemsize), dtype=unsigned).view(dtype)
+    lut = np.clip(values.astype(np.float32), vmin, vmax)
+    lut = ((lut - vmin) / (vmax - vmin + 1e-8) * 255).astype(np.uint8)
+    lut.flags.writeable = False
+    return lut
+
+
+def apply_window(slice_data: np.ndarray, vmin: float, vmax: float,
+                 out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Map a slice to uint8 display values, clipping to [vmin, vmax].
+
+    Integer slices of up to 16 bits go through a cached lookup table (one
+    gather per pixel); other dtypes use the float pipeline.
+
+    Args:
+        slice_data: 2D slice of any numeric dtype
+        vmin, vmax: Window bounds
+        out: Optional C-contiguous uint8 array of the same shape to write into
+
+    Returns:
+        C-contiguous uint8 array (out, if given)
+    """
+    if slice_data.dtype.kind in 'iu' and slice_data.dtype.itemsize <= 2:
+        lut = _window_lut(slice_data.dtype, float(vmin), float(vmax))
+        return lut.take(slice_data.view(f'u{slice_data.dtype.itemsize}'), out=out)
+
+    # One float32 buffer, updated in place: shift, clip, scale
+    windowed = np.subtract(slice_data, vmin, dtype=np.float32)
+    np.clip(windowed, 0, vmax - vmin, out=windowed)
+    np.multiply(windowed, 255 / (vmax - vmin + 1e-8), out=windowed)
+    if out is None:
+        return windowed.astype(np.uint8)
+    np.copyto(out, windowed, casting='unsafe')
+    return out
@@ -0,0 +1,48 @@
+"""Keyboard shortcuts reach MainWindow while child widgets have focus."""
+
+import os
+import sys
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import pytest
+from PySide6.QtCore import Qt
+from PySide6.QtTest import QTest
+from PySide6.QtWidgets import QApplication
+
+from ui.main_window import MainWindow
+
+
+@pytest.fixture
+def window():
+    app = QApplication.instance() or QApplication([])
+    win = MainWindow()
+    win.show()
+    QTest.qWaitForWindowExposed(win)
+    win.patient_list.list_view.setFocus()
+    app.processEvents()
+    yield win
+    win.close()
+
+
+@pytest.mark.parametrize("key, tool", [
+    (Qt.Key_1, "view"),
+    (Qt.Key_2, "keypoint"),
+    (Qt.Key_3, "brush"),
+    (Qt.Key_4, "segment"),
+    (Qt.Key_5, "lineseg"),
+])
+def test_tool_keys_with_patient_list_focused(window, key, tool):
+    # Start from a different tool so the key has to change it
+    window.toolbar.set_tool("keypoint" if tool == "view" else "view")
+    QTest.keyClick(window.patient_list.list_view, key)
+    assert window.toolbar.get_current_tool() == tool
+
+
+def test_erase_key_with_patient_list_focused(window):
+    window.toolbar.set_tool("brush")
+    erase = window.toolbar.is_erase_mode()
+    QTest.keyClick(window.patient_list.list_view, Qt.Key_E)
+    assert window.toolbar.is_erase_mode() != erase
@@ -4,6 +4,7 @@ from typing import List, Tuple, Optional
 
 from PySide6.QtCore import Qt, QPointF
 from PySide6.QtGui import QMouseEvent, QCursor, QPixmap, QPainter, QColor
+import cv2
 import numpy as np
 
 from .base_tool import BaseTool
@@ -154,8 +155,6 @@ class BrushTool(BaseTool):
         Returns:
             Modified mask array
         """
-        import cv2
-
         plane = stroke_data["plane"]
         slice_idx = stroke_data["slice_index"]
         points = stroke_data["points"]
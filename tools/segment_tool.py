@@ -1,11 +1,13 @@
 """Segment tool for contour-based mask creation."""
 
-from typing import Tuple
-
 from PySide6.QtGui import QPainterPath, QImage, QPainter, QColor, QBrush
 from PySide6.QtCore import Qt
+import cv2
 import numpy as np
 
+# Fractional bits of the fixed-point vertices passed to cv2.fillPoly
+_FILL_SHIFT = 4
+
 
 class SegmentTool:
     """Static methods for segment/contour operations.
@@ -54,23 +56,22 @@ class SegmentTool:
         mask_3d: np.ndarray,
         plane: str,
         slice_idx: int,
-        path: QPainterPath,
-        slice_shape: Tuple[int, int],
+        polygon: np.ndarray,
         erase: bool = False
     ) -> None:
-        """Apply segment path to 3D mask array in-place.
+        """Fill a segment contour into a 3D mask array in-place.
+
+        The polygon is rasterized with cv2.fillPoly straight into the mask
+        slice. Pixels on the outline are included.
 
         Args:
             mask_3d: 3D numpy array (z, y, x) to modify
             plane: The anatomical plane ('axial', 'sagittal', 'coronal')
             slice_idx: Index of the slice being modified
-            path: The closed QPainterPath defining the segment region
-            slice_shape: (height, width) of the 2D slice
+            polygon: (N, 2) array of (x, y) contour vertices in slice
+                coordinates; the contour is closed implicitly
             erase: If True, subtract from mask; if False, add to mask
         """
-        height, width = slice_shape
-        segment_mask = SegmentTool.path_to_mask(path, width, height)
-
         # Get 2D slice view from 3D mask (modifying in-place)
         if plane == "axial":
             slice_2d = mask_3d[slice_idx, :, :]
@@ -79,8 +80,15 @@ class SegmentTool:
         else:  # coronal
             slice_2d = mask_3d[:, slice_idx, :]
 
-        # Apply operation
-        if erase:
-            slice_2d[segment_mask > 0] = 0
-        else:
-            slice_2d[segment_mask > 0] = 255
+        # cv2 needs a unit column stride; sagittal slices are filled on a copy
+        in_place = slice_2d.strides[1] == slice_2d.itemsize
+        target = slice_2d if in_place else np.ascontiguousarray(slice_2d)
+
+        # Fixed-point vertices; the half-pixel offset samples pixel centres
+        # like QPainter did
+        pts = np.asarray(polygon, dtype=np.float64) - 0.5
+        pts = np.round(pts * (1 << _FILL_SHIFT)).astype(np.int32).reshape(-1, 1, 2)
+        cv2.fillPoly(target, [pts], 0 if erase else 255, lineType=cv2.LINE_8, shift=_FILL_SHIFT)
+
+        if not in_place:
+            slice_2d[...] = target
@@ -0,0 +1,77 @@
+"""Background saving of patient annotations."""
+
+from pathlib import Path
+from typing import List
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+from core.patient import Patient
+from core.persistence import save_all_patients
+
+
+class _SaveSignals(QObject):
+    """Signals emitted by a save task (QRunnable cannot emit itself)."""
+
+    finished = Signal(int)  # number of patients saved
+    failed = Signal(str)  # error message
+
+
+class _SaveTask(QRunnable):
+    """Runs save_all_patients() on a worker thread."""
+
+    def __init__(self, patients: List[Patient], output_dir: Path,
+                 signals: _SaveSignals):
+        super().__init__()
+        self._patients = patients
+        self._output_dir = output_dir
+        self._signals = signals
+
+    def run(self):
+        try:
+            count = save_all_patients(self._patients, self._output_dir)
+        except Exception as e:
+            self._signals.failed.emit(str(e))
+        else:
+            self._signals.finished.emit(count)
+
+
+class AnnotationSaver(QObject):
+    """Saves patients' annotations off the GUI thread.
+
+    Saves run one at a time. The annotations must not be edited until the
+    save finishes, since the worker reads the mask arrays and marks the
+    annotations as saved.
+
+    Signals:
+        finished(int): The save completed; number of patients saved
+        failed(str): The save raised an error
+    """
+
+    finished = Signal(int)
+    failed = Signal(str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+        self._signals = _SaveSignals(self)
+        self._signals.finished.connect(self._on_finished)
+        self._signals.failed.connect(self._on_failed)
+        self._busy = False
+
+    def save_all(self, patients: List[Patient], output_dir: Path):
+        """Queue a save; arguments are as for save_all_patients."""
+        self._busy = True
+        self._pool.start(_SaveTask(patients, output_dir, self._signals))
+
+    def is_busy(self) -> bool:
+        """Check if a save is still running."""
+        return self._busy
+
+    def _on_finished(self, count: int):
+        self._busy = False
+        self.finished.emit(count)
+
+    def _on_failed(self, message: str):
+        self._busy = False
+        self.failed.emit(message)
@@ -1,33 +1,34 @@
 """Cardiac view planning window with oblique slice visualization."""
 
-from typing import Optional, Dict, List, Tuple, TYPE_CHECKING
+from collections import OrderedDict
+from typing import Optional, Dict, List, Tuple
 import numpy as np
 
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
-    QGraphicsView, QGraphicsScene, QGraphicsPixmapItem, QSlider,
-    QLabel, QSplitter, QListWidget, QListWidgetItem, QMessageBox,
-    QFileDialog, QMenuBar, QSizePolicy, QComboBox
+    QSlider, QLabel, QSplitter, QListWidget, QListWidgetItem,
+    QMessageBox, QFileDialog, QMenuBar, QComboBox
 )
 from PySide6.QtGui import (
-    QImage, QPixmap, QPainter, QColor, QPen, QBrush,
+    QPainter, QColor, QPen, QBrush,
     QPainterPath, QWheelEvent, QMouseEvent, QAction
 )
-from PySide6.QtCore import Qt, Signal, QPointF, QRectF
-
-from pathlib import Path
+from PySide6.QtCore import Qt, Signal, QPointF, QTimer
 
 from core.oblique_slice import (
-    ObliquePlane, extract_oblique_slice,
+    ObliquePlane, extract_oblique_slice, plane_axis_range, sampling_axes,
     create_p2ch_plane_from_axial_line,
     create_p4ch_plane_from_p2ch_line,
     create_sax_plane_from_p4ch_line
 )
 from core.volume import VolumeData
+from core.windowing import apply_window
 from core.patient import Patient
 from core.annotation import Annotations, LineSegment
 from core.persistence import save_patient_annotations, load_patient_annotations
 from ui.slice_view import SliceView
+from ui.slice_canvas import FastSliceCanvas
+from ui.patient_loader import PatientLoader
 import config
 
 
@@ -40,24 +41,26 @@ def scan_patient_folder(folder_path: str) -> List[Patient]:
     Returns:
         List of Patient objects
     """
-    folder = Path(folder_path)
-    patients = []
+    return Patient.scan_folder(folder_path)
+
 
-    # Find image files (exclude label files)
-    image_files = []
-    for pattern in [config.NIFTI_PATTERN]:
-        for f in folder.glob(pattern):
-            if not f.name.endswith(config.LABEL_SUFFIX):
-                image_files.append(f)
+# For each top-view plane, the (x, y, z) index that receives the 2D x, the
+# 2D y and the slice index respectively
+_PLANE_AXES: Dict[str, Tuple[int, int, int]] = {
+    'axial': (0, 1, 2),
+    'sagittal': (1, 2, 0),
+    'coronal': (0, 2, 1),
+}
 
-    for image_path in sorted(image_files):
-        patient = Patient.from_image_path(str(image_path))
-        patients.append(patient)
 
-    return patients
+def _start_point_key(ls: LineSegment) -> Tuple[float, float, float]:
+    """Hash key for a line segment's first endpoint, rounded to 0.1 voxel."""
+    return (round(ls.x1, 1), round(ls.y1, 1), round(ls.z1, 1))
 
-if TYPE_CHECKING:
-    pass
+
+def _line_endpoints(ls: LineSegment) -> np.ndarray:
+    """Both endpoints of a line segment as a (2, 3) array of (x, y, z)."""
+    return np.array([[ls.x1, ls.y1, ls.z1], [ls.x2, ls.y2, ls.z2]])
 
 
 class ObliqueSliceView(QWidget):
@@ -113,9 +116,39 @@ class ObliqueSliceView(QWidget):
 
         # Rotation optimization: store axis info for local rotation computation
         # This avoids expensive plane regeneration on every rotation slider tick
+        # Base normal and u_axis (at 0 degrees) are stacked as rows of
+        # _rotation_basis; their cross products with the axis don't change
+        # between ticks, so they are precomputed in _rotation_basis_perp
         self._rotation_axis: Optional[np.ndarray] = None
-        self._base_normal: Optional[np.ndarray] = None
-        self._base_u_axis: Optional[np.ndarray] = None
+        self._rotation_basis: Optional[np.ndarray] = None
+        self._rotation_basis_perp: Optional[np.ndarray] = None
+
+        # Sampled slices for rotation angles already visited with the current
+        # rotation info: (degrees, scroll offset) -> (normal, u_axis, slice)
+        self._rotation_cache: "OrderedDict[Tuple[float, float], Tuple[np.ndarray, np.ndarray, np.ndarray]]" = OrderedDict()
+
+        # Rotation slider ticks are coalesced: the latest value is applied
+        # when the timer fires, dropping ticks that arrived in between
+        self._pending_rotation: Optional[float] = None
+        self._rotation_timer = QTimer(self)
+        self._rotation_timer.setSingleShot(True)
+        self._rotation_timer.setInterval(config.SLIDER_COALESCE_MS)
+        self._rotation_timer.timeout.connect(self._apply_pending_rotation)
+
+        # Slab of the volume reused across nearby slices:
+        # (axes, lo, hi, array), cut along the first axis of the axes layout
+        self._slab: Optional[Tuple[Tuple[int, int, int], int, int, np.ndarray]] = None
+
+        # Display buffer reused by every slice of the same size
+        self._display_buf: Optional[np.ndarray] = None
+
+        # Overlay pens/brushes; the line segment ones are recolored on change
+        self._ls_color: Optional[Tuple[int, int, int]] = None
+        self._ls_pen = QPen(Qt.white, 2)
+        self._ls_brush = QBrush(Qt.white)
+        preview_color = QColor(255, 0, 0, 200)
+        self._preview_pen = QPen(preview_color, 2, Qt.DashLine)
+        self._preview_brush = QBrush(preview_color)
 
         self._setup_ui()
 
@@ -130,29 +163,12 @@ class ObliqueSliceView(QWidget):
         self.title_label.setAlignment(Qt.AlignCenter)
         self.title_label.setStyleSheet("font-weight: bold;")
 
-        # Graphics view
-        self.scene = QGraphicsScene()
-        self.view = QGraphicsView(self.scene)
-        self.view.setRenderHint(QPainter.Antialiasing)
-        self.view.setRenderHint(QPainter.SmoothPixmapTransform)
-        self.view.setDragMode(QGraphicsView.NoDrag)
-        self.view.setTransformationAnchor(QGraphicsView.AnchorUnderMouse)
-        self.view.setResizeAnchor(QGraphicsView.AnchorViewCenter)
-        self.view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.view.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.view.setBackgroundBrush(QBrush(QColor(30, 30, 30)))
-        self.view.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        # Canvas painting the slice and line segment overlay directly
+        self.view = FastSliceCanvas()
+        self.view.overlay_painter = self._paint_overlay
 
         # Install event filter
-        self.view.viewport().installEventFilter(self)
-
-        # Image and overlay items
-        self.image_item = QGraphicsPixmapItem()
-        self.scene.addItem(self.image_item)
-
-        self.annotation_overlay_item = QGraphicsPixmapItem()
-        self.annotation_overlay_item.setZValue(2)
-        self.scene.addItem(self.annotation_overlay_item)
+        self.view.installEventFilter(self)
 
         # Placeholder label (shown when no plane is set)
         self.placeholder_label = QLabel("Draw line on previous view")
@@ -171,6 +187,8 @@ class ObliqueSliceView(QWidget):
             self.slider.setMaximum(100)
             self.slider.setValue(0)
             self.slider.valueChanged.connect(self._on_slider_changed)
+            self.slider.sliderPressed.connect(self._begin_interactive)
+            self.slider.sliderReleased.connect(self._end_interactive)
 
             self.slice_label = QLabel("0")
             self.slice_label.setMinimumWidth(40)
@@ -205,6 +223,8 @@ class ObliqueSliceView(QWidget):
             self.rotation_slider.setMaximum(180)
             self.rotation_slider.setValue(0)
             self.rotation_slider.valueChanged.connect(self._on_rotation_changed)
+            self.rotation_slider.sliderPressed.connect(self._begin_interactive)
+            self.rotation_slider.sliderReleased.connect(self._end_interactive)
 
             self.rotation_value_label = QLabel("0°")
             self.rotation_value_label.setMinimumWidth(40)
@@ -224,7 +244,7 @@ class ObliqueSliceView(QWidget):
 
     def eventFilter(self, obj, event):
         """Handle mouse events."""
-        if obj == self.view.viewport():
+        if obj == self.view:
             if event.type() == event.Type.MouseButtonPress:
                 self._handle_mouse_press(event)
                 return True
@@ -245,9 +265,10 @@ class ObliqueSliceView(QWidget):
             self._is_panning = True
             self._pan_start = event.pos()
             self.view.setCursor(Qt.ClosedHandCursor)
+            self._begin_interactive()
             return
 
-        scene_pos = self.view.mapToScene(event.pos())
+        scene_pos = self.view.map_to_image(event.pos())
         if self._is_in_image_bounds(scene_pos):
             self.mouse_pressed.emit(self.view_name, scene_pos, event)
 
@@ -256,15 +277,10 @@ class ObliqueSliceView(QWidget):
         if self._is_panning:
             delta = event.pos() - self._pan_start
             self._pan_start = event.pos()
-            self.view.horizontalScrollBar().setValue(
-                self.view.horizontalScrollBar().value() - delta.x()
-            )
-            self.view.verticalScrollBar().setValue(
-                self.view.verticalScrollBar().value() - delta.y()
-            )
+            self.view.pan(delta.x(), delta.y())
             return
 
-        scene_pos = self.view.mapToScene(event.pos())
+        scene_pos = self.view.map_to_image(event.pos())
         self.mouse_moved.emit(self.view_name, scene_pos, event)
 
     def _handle_mouse_release(self, event: QMouseEvent):
@@ -272,27 +288,36 @@ class ObliqueSliceView(QWidget):
         if self._is_panning and event.button() == Qt.LeftButton:
             self._is_panning = False
             self.view.setCursor(Qt.ArrowCursor)
+            self._end_interactive()
             return
 
-        scene_pos = self.view.mapToScene(event.pos())
+        scene_pos = self.view.map_to_image(event.pos())
         self.mouse_released.emit(self.view_name, scene_pos, event)
 
     def _handle_wheel(self, event: QWheelEvent):
         """Handle wheel for zooming or scrolling."""
         if event.modifiers() == Qt.ControlModifier:
             factor = 1.15 if event.angleDelta().y() > 0 else 1 / 1.15
-            self.view.scale(factor, factor)
+            self.view.zoom(factor, event.position())
         elif self.scrollable and self.slider:
             delta = 5 if event.angleDelta().y() > 0 else -5
             self.slider.setValue(self.slider.value() + delta)
 
+    def _begin_interactive(self):
+        """Drop to cheap rendering while the user drags a slider or pans."""
+        self.view.set_smooth(False)
+
+    def _end_interactive(self):
+        """Restore full-quality rendering for the final frame."""
+        self.view.set_smooth(True)
+
     def _is_in_image_bounds(self, scene_pos: QPointF) -> bool:
         """Check if position is within image bounds."""
-        pixmap = self.image_item.pixmap()
-        if pixmap.isNull():
+        # The displayed slice is always plane.width x plane.height pixels
+        if self._plane is None:
             return False
-        rect = QRectF(0, 0, pixmap.width(), pixmap.height())
-        return rect.contains(scene_pos)
+        x, y = scene_pos.x(), scene_pos.y()
+        return 0 <= x < self._plane.width and 0 <= y < self._plane.height
 
     def _on_slider_changed(self, value: int):
         """Handle scroll slider change."""
@@ -306,34 +331,64 @@ class ObliqueSliceView(QWidget):
         if self.rotation_value_label:
             self.rotation_value_label.setText(f"{value}°")
 
+        self._pending_rotation = float(value)
+        if not self._rotation_timer.isActive():
+            self._rotation_timer.start()
+
+    def _apply_pending_rotation(self):
+        """Apply the latest rotation slider value."""
+        degrees = self._pending_rotation
+        self._pending_rotation = None
+        if degrees is None:
+            return
+
         # Fast path: if we have rotation info, compute locally without parent signal
         if self._rotation_axis is not None and self._plane is not None:
-            self._apply_rotation(float(value))
+            self._apply_rotation(degrees)
         else:
             # Fallback: emit signal so parent can regenerate the plane
-            self.rotation_changed.emit(self.view_name, float(value))
+            self.rotation_changed.emit(self.view_name, degrees)
 
     def _apply_rotation(self, degrees: float):
         """Apply rotation around stored axis using Rodrigues' formula.
 
         This is the fast path for rotation - it updates the plane normal and u_axis
-        in-place without regenerating the entire plane from scratch.
+        in-place without regenerating the entire plane from scratch. Slices
+        sampled for recently visited angles are kept in an LRU cache.
         """
+        key = (round(degrees, 1), self._scroll_offset)
+        cached = self._rotation_cache.get(key)
+        if cached is not None:
+            # Angle seen before: reuse its axes and sampled slice
+            self._rotation_cache.move_to_end(key)
+            normal, u_axis, slice_data = cached
+            self._plane.normal = normal.copy()
+            self._plane.u_axis = u_axis.copy()
+            self._show_slice(slice_data)
+            return
+
         theta = np.radians(degrees)
         cos_t = np.cos(theta)
         sin_t = np.sin(theta)
-        k = self._rotation_axis
 
         # Rodrigues' formula: v_rot = v*cos(θ) + (k×v)*sin(θ) + k*(k·v)*(1-cos(θ))
         # Since base_normal and base_u_axis are perpendicular to k, the (k·v) term is 0
-        new_normal = self._base_normal * cos_t + np.cross(k, self._base_normal) * sin_t
-        new_u_axis = self._base_u_axis * cos_t + np.cross(k, self._base_u_axis) * sin_t
+        rotated = self._rotation_basis * cos_t + self._rotation_basis_perp * sin_t
 
         # Update plane in-place (normalize for numerical stability)
-        self._plane.normal = new_normal / np.linalg.norm(new_normal)
-        self._plane.u_axis = new_u_axis / np.linalg.norm(new_u_axis)
+        rotated /= np.linalg.norm(rotated, axis=1, keepdims=True)
+        self._plane.normal = rotated[0]
+        self._plane.u_axis = rotated[1]
 
-        self.update_display()
+        if self._volume is None:
+            return
+        slice_data = self._sample_slice()
+        self._rotation_cache[key] = (
+            self._plane.normal.copy(), self._plane.u_axis.copy(), slice_data
+        )
+        if len(self._rotation_cache) > config.ROTATION_CACHE_SIZE:
+            self._rotation_cache.popitem(last=False)
+        self._show_slice(slice_data)
 
     def get_rotation(self) -> float:
         """Get current rotation angle in degrees."""
@@ -383,14 +438,16 @@ class ObliqueSliceView(QWidget):
             base_u_axis: The plane u_axis at 0 degrees rotation
         """
         self._rotation_axis = rotation_axis.copy()
-        self._base_normal = base_normal.copy()
-        self._base_u_axis = base_u_axis.copy()
+        self._rotation_basis = np.stack([base_normal, base_u_axis]).astype(np.float64)
+        self._rotation_basis_perp = np.cross(self._rotation_axis, self._rotation_basis)
+        self._rotation_cache.clear()
 
     def clear_rotation_info(self):
         """Clear rotation info (e.g., when rotation mode changes)."""
         self._rotation_axis = None
-        self._base_normal = None
-        self._base_u_axis = None
+        self._rotation_basis = None
+        self._rotation_basis_perp = None
+        self._rotation_cache.clear()
 
     def set_plane(self, volume: VolumeData, plane: ObliquePlane,
                   scroll_range: Tuple[float, float] = (-100, 100)):
@@ -405,6 +462,8 @@ class ObliqueSliceView(QWidget):
         self._plane = plane
         self._scroll_range = scroll_range
         self._scroll_offset = 0.0
+        self._slab = None
+        self._rotation_cache.clear()
 
         # Set up slider if scrollable
         if self.scrollable and self.slider:
@@ -428,11 +487,23 @@ class ObliqueSliceView(QWidget):
         """Clear the displayed plane."""
         self._plane = None
         self._line_segment = None
-        self.image_item.setPixmap(QPixmap())
-        self.annotation_overlay_item.setPixmap(QPixmap())
+        self._slab = None
+        self._rotation_cache.clear()
+        self.view.set_image(None)
         self.view.hide()
         self.placeholder_label.show()
 
+    def mark_dirty(self):
+        """Invalidate the current plane ahead of an immediate set_plane.
+
+        Drops the line segment and plane caches like clear_plane, but keeps
+        the last image shown (and its buffer) instead of swapping in the
+        placeholder for the moment until the new plane is set.
+        """
+        self._line_segment = None
+        self._slab = None
+        self._rotation_cache.clear()
+
     def set_line_segment(self, ls: Optional[LineSegment]):
         """Set the line segment for this view."""
         self._line_segment = ls
@@ -454,74 +525,117 @@ class ObliqueSliceView(QWidget):
         """Update the displayed slice."""
         if self._volume is None or self._plane is None:
             return
-
-        # Extract oblique slice
+        self._show_slice(self._sample_slice())
+
+    def _sample_slice(self) -> np.ndarray:
+        """Sample the current plane from the volume (before windowing)."""
+        # Extract oblique slice from the slab it touches, in the axis
+        # layout that suits the plane orientation
+        if config.OBLIQUE_AXIS_LAYOUTS:
+            axes = sampling_axes(self._plane)
+        else:
+            axes = (0, 1, 2)
+        lo, hi = plane_axis_range(self._plane, axes[0], self._scroll_offset)
+        slab, slab_start = self._get_slab(axes, lo, hi)
         slice_data = extract_oblique_slice(
-            self._volume.array, self._plane, self._scroll_offset
+            slab, self._plane, self._scroll_offset,
+            slab_start=slab_start, axes=axes
         )
+        return slice_data
+
+    def _show_slice(self, slice_data: np.ndarray):
+        """Window a sampled slice and display it."""
+        # Apply windowing, with the window expressed in sampling-array units
+        _, scale = self._volume.get_sampling_array()
+        vmin = (self.window_center - self.window_width / 2) / scale
+        vmax = (self.window_center + self.window_width / 2) / scale
+        if self._display_buf is None or self._display_buf.shape != slice_data.shape:
+            self._display_buf = np.empty(slice_data.shape, dtype=np.uint8)
+        display = apply_window(slice_data, vmin, vmax, out=self._display_buf)
+
+        # The canvas keeps a reference to the array and paints it directly
+        self.view.set_image(display)
+
+    def _get_slab(self, axes: Tuple[int, int, int],
+                  c_min: float, c_max: float) -> Tuple[np.ndarray, int]:
+        """Get a contiguous slab of the volume covering [c_min, c_max].
+
+        The slab is cut along the first axis of the volume transposed by
+        `axes`. It is kept while successive slices (e.g. SAX scrolling)
+        stay inside it, and refilled with a margin around the request
+        otherwise. Slab bounds are clamped to the volume, so out-of-volume
+        samples still interpolate against the constant border as before.
 
-        # Apply windowing
-        vmin = self.window_center - self.window_width / 2
-        vmax = self.window_center + self.window_width / 2
-        display = np.clip(slice_data.astype(np.float32), vmin, vmax)
-        display = ((display - vmin) / (vmax - vmin + 1e-8) * 255).astype(np.uint8)
-
-        # Convert to QImage
-        h, w = display.shape
-        display = np.ascontiguousarray(display)
-        qimage = QImage(display.data, w, h, w, QImage.Format_Grayscale8)
-        self.image_item.setPixmap(QPixmap.fromImage(qimage.copy()))
+        Args:
+            axes: Axis layout of the volume, see sampling_axes
+            c_min, c_max: Coordinate range needed along the first axis
 
-        self._update_annotation_overlay()
+        Returns:
+            (slab, start) where start is the index of the slab's first plane
+        """
+        volume = self._volume.get_layout(axes)
+        depth = volume.shape[0]
+        need_lo = min(max(int(np.floor(c_min)), 0), depth)
+        need_hi = min(max(int(np.ceil(c_max)) + 1, 0), depth)
+        if need_lo >= need_hi:
+            # Slice lies entirely outside the volume
+            return volume, 0
+
+        if self._slab is not None:
+            slab_axes, lo, hi, slab = self._slab
+            if slab_axes == axes and lo <= need_lo and need_hi <= hi:
+                return slab, lo
+
+        lo = max(need_lo - config.OBLIQUE_SLAB_MARGIN, 0)
+        hi = min(need_hi + config.OBLIQUE_SLAB_MARGIN, depth)
+        slab = np.ascontiguousarray(volume[lo:hi])
+        self._slab = (axes, lo, hi, slab)
+        return slab, lo
 
     def _update_annotation_overlay(self):
         """Update annotation overlay (line segments)."""
+        # The overlay is painted with the image in the canvas paintEvent
+        self.view.update()
+
+    def _paint_overlay(self, painter: QPainter):
+        """Paint line segment and preview in image pixel coordinates."""
         if self._plane is None:
-            self.annotation_overlay_item.setPixmap(QPixmap())
             return
 
-        w, h = self._plane.width, self._plane.height
-        pixmap = QPixmap(w, h)
-        pixmap.fill(Qt.transparent)
-        painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.Antialiasing)
-
         # Draw stored line segment
         if self._line_segment is not None:
             ls = self._line_segment
             # Project 3D endpoints to 2D
-            pos1 = self._plane.map_3d_to_2d(ls.x1, ls.y1, ls.z1, tolerance=50)
-            pos2 = self._plane.map_3d_to_2d(ls.x2, ls.y2, ls.z2, tolerance=50)
-
-            if pos1 is not None and pos2 is not None:
-                color = QColor(*ls.color)
-                pen = QPen(color, 2)
-                painter.setPen(pen)
+            pos = self._plane.map_3d_to_2d_batch(_line_endpoints(ls), tolerance=50)
+
+            if pos is not None:
+                pos1, pos2 = pos
+                if ls.color != self._ls_color:
+                    color = QColor(*ls.color)
+                    self._ls_pen.setColor(color)
+                    self._ls_brush.setColor(color)
+                    self._ls_color = ls.color
+                painter.setPen(self._ls_pen)
                 painter.drawLine(QPointF(pos1[0], pos1[1]), QPointF(pos2[0], pos2[1]))
 
                 # Endpoints
-                painter.setBrush(QBrush(color))
+                painter.setBrush(self._ls_brush)
                 painter.drawEllipse(QPointF(pos1[0], pos1[1]), 3, 3)
                 painter.drawEllipse(QPointF(pos2[0], pos2[1]), 3, 3)
 
         # Draw preview
         if self._lineseg_preview_start and self._lineseg_preview_end:
-            color = QColor(255, 0, 0, 200)
-            pen = QPen(color, 2, Qt.DashLine)
-            painter.setPen(pen)
+            painter.setPen(self._preview_pen)
             x1, y1 = self._lineseg_preview_start
             x2, y2 = self._lineseg_preview_end
             painter.drawLine(QPointF(x1, y1), QPointF(x2, y2))
-            painter.setBrush(QBrush(color))
+            painter.setBrush(self._preview_brush)
             painter.drawEllipse(QPointF(x1, y1), 4, 4)
 
-        painter.end()
-        self.annotation_overlay_item.setPixmap(pixmap)
-
     def fit_view(self):
         """Fit image to view."""
-        if not self.image_item.pixmap().isNull():
-            self.view.fitInView(self.image_item, Qt.KeepAspectRatio)
+        if self.view.has_image():
+            self.view.fit()
 
     def resizeEvent(self, event):
         """Handle resize."""
@@ -552,6 +666,12 @@ class CardiacViewWindow(QMainWindow):
         self._current_patient: Optional[Patient] = None
         self._annotations: Optional[Annotations] = None
 
+        # Background patient loading; the pending patient is shown once loaded
+        self._loader = PatientLoader(self)
+        self._loader.loaded.connect(self._on_patient_loaded)
+        self._loader.failed.connect(self._on_patient_load_failed)
+        self._pending_patient: Optional[Patient] = None
+
         # Views dictionary
         self._top_views: Dict[str, SliceView] = {}
         self._bottom_views: Dict[str, ObliqueSliceView] = {}
@@ -571,9 +691,15 @@ class CardiacViewWindow(QMainWindow):
             'sax': None
         }
 
-        # Line segment drawing state
-        self._lineseg_first_point: Optional[Tuple[float, float, float]] = None
+        # Scroll range of the sax view, from the current patient's volume size
+        self._sax_scroll_range: Tuple[int, int] = (-100, 100)
+
+        # Line segment drawing state: endpoints in (x, y, z), row 0 set on
+        # press and row 1 on release, while a source view is set
+        self._lineseg_points = np.zeros((2, 3))
         self._lineseg_source_view: Optional[str] = None
+        # Start point projected onto an oblique source view, set on press
+        self._lineseg_start_2d: Optional[Tuple[float, float]] = None
 
         self._setup_ui()
         self._setup_menu()
@@ -681,10 +807,7 @@ class CardiacViewWindow(QMainWindow):
             # Update annotations with cardiac line segments
             self._sync_line_segments_to_annotations()
 
-            import os
-            ann_dir = os.path.join(os.path.dirname(self._current_patient.image_path), "annotations")
-            os.makedirs(ann_dir, exist_ok=True)
-            save_patient_annotations(self._current_patient, ann_dir)
+            save_patient_annotations(self._current_patient, self._current_patient.annotations_dir)
             QMessageBox.information(self, "Saved", "Annotations saved successfully.")
 
     def _on_patient_selected(self, item: QListWidgetItem):
@@ -694,18 +817,29 @@ class CardiacViewWindow(QMainWindow):
             self._load_patient(self._patients[idx])
 
     def _load_patient(self, patient: Patient):
-        """Load a patient's data."""
-        # Unload previous
-        if self._current_patient:
-            self._current_patient.unload()
-
+        """Load a patient's data in the background, prefetching its neighbours."""
+        self._pending_patient = patient
+        self._loader.request(patient)
+
+        idx = self._patients.index(patient)
+        if idx + 1 < len(self._patients):
+            self._loader.prefetch(self._patients[idx + 1])
+        if idx > 0:
+            self._loader.prefetch(self._patients[idx - 1])
+
+    def _on_patient_loaded(self, patient: Patient):
+        """Display a patient once its data has been loaded."""
+        if patient is not self._pending_patient:
+            # Superseded by a later selection
+            return
+        self._pending_patient = None
         self._current_patient = patient
-        patient.load()
+        max_dim = max(patient.image.shape)
+        self._sax_scroll_range = (-max_dim // 2, max_dim // 2)
 
         # Load annotations
-        import os
-        ann_dir = os.path.join(os.path.dirname(patient.image_path), "annotations")
-        if os.path.exists(ann_dir):
+        ann_dir = patient.annotations_dir
+        if ann_dir.exists():
             self._annotations = load_patient_annotations(
                 patient.patient_id, ann_dir, patient.image.shape
             )
@@ -728,6 +862,24 @@ class CardiacViewWindow(QMainWindow):
         # Check for existing line segments and try to restore views
         self._restore_cardiac_views_from_annotations()
 
+        # Free everything except this patient and its prefetched neighbours
+        idx = self._patients.index(patient)
+        keep = self._patients[max(idx - 1, 0):idx + 2]
+        for other in self._patients:
+            if other not in keep and other.is_loaded and not self._loader.is_busy(other):
+                other.unload()
+
+    def _on_patient_load_failed(self, patient: Patient, message: str):
+        """Report a patient that could not be loaded."""
+        if patient is not self._pending_patient:
+            return
+        self._pending_patient = None
+        QMessageBox.warning(
+            self,
+            "Load Failed",
+            f"Could not load {patient.patient_id}:\n{message}"
+        )
+
     def _restore_cardiac_views_from_annotations(self):
         """Try to restore cardiac views from existing annotations."""
         if not self._annotations or not self._annotations.line_segments:
@@ -749,18 +901,19 @@ class CardiacViewWindow(QMainWindow):
 
         # For now, we add the cardiac line segments to annotations
         # In a more complete implementation, we might want to track them separately
+
+        # Index existing segments by their first endpoint rounded to 0.1 voxel,
+        # so each duplicate check is a dict lookup instead of a scan
+        index = {
+            _start_point_key(existing): existing
+            for existing in self._annotations.line_segments
+        }
         for key, ls in self._cardiac_line_segments.items():
             if ls is not None:
                 # Check if already in annotations
-                found = False
-                for existing in self._annotations.line_segments:
-                    if (abs(existing.x1 - ls.x1) < 0.1 and
-                        abs(existing.y1 - ls.y1) < 0.1 and
-                        abs(existing.z1 - ls.z1) < 0.1):
-                        found = True
-                        break
-                if not found:
+                if _start_point_key(ls) not in index:
                     self._annotations.add_line_segment(ls)
+                    index[_start_point_key(ls)] = ls
 
     # --- Top View Mouse Handlers ---
 
@@ -770,8 +923,7 @@ class CardiacViewWindow(QMainWindow):
         if event.button() == Qt.LeftButton:
             # Start line segment
             x2d, y2d = scene_pos.x(), scene_pos.y()
-            x3d, y3d, z3d = self._convert_2d_to_3d(plane, slice_idx, x2d, y2d)
-            self._lineseg_first_point = (x3d, y3d, z3d)
+            self._lineseg_points[0] = self._convert_2d_to_3d(plane, slice_idx, x2d, y2d)
             self._lineseg_source_view = plane
 
         elif event.button() == Qt.RightButton:
@@ -780,21 +932,18 @@ class CardiacViewWindow(QMainWindow):
                 # Also remove from annotations
                 old_ls = self._cardiac_line_segments['axial']
                 if old_ls and self._annotations:
-                    for i, existing in enumerate(self._annotations.line_segments):
-                        if existing is old_ls:
-                            self._annotations.remove_line_segment(i)
-                            break
+                    self._annotations.remove_line_segment_object(old_ls)
                 self._cardiac_line_segments['axial'] = None
                 self._clear_dependent_views('axial')
-                self._top_views[plane].update_display()
+                self._top_views[plane].refresh_annotations()
 
     def _on_top_view_mouse_moved(self, plane: str, slice_idx: int,
                                   scene_pos: QPointF, event: QMouseEvent):
         """Handle mouse move on top views."""
-        if self._lineseg_first_point and self._lineseg_source_view == plane:
+        if self._lineseg_source_view == plane:
             # Show preview
             view = self._top_views[plane]
-            start_2d = self._convert_3d_to_2d(plane, slice_idx, *self._lineseg_first_point)
+            start_2d = self._convert_3d_to_2d(plane, slice_idx, *self._lineseg_points[0].tolist())
             if start_2d:
                 view.set_lineseg_preview(start_2d, (scene_pos.x(), scene_pos.y()))
 
@@ -807,15 +956,13 @@ class CardiacViewWindow(QMainWindow):
         view = self._top_views[plane]
         view.clear_lineseg_preview()
 
-        if self._lineseg_first_point and self._lineseg_source_view == plane:
+        if self._lineseg_source_view == plane:
             x2d, y2d = scene_pos.x(), scene_pos.y()
-            x3d, y3d, z3d = self._convert_2d_to_3d(plane, slice_idx, x2d, y2d)
+            self._lineseg_points[1] = self._convert_2d_to_3d(plane, slice_idx, x2d, y2d)
 
             # Create line segment
-            x1, y1, z1 = self._lineseg_first_point
-            ls = LineSegment(
-                x1=x1, y1=y1, z1=z1,
-                x2=x3d, y2=y3d, z2=z3d,
+            ls = LineSegment.from_endpoints(
+                self._lineseg_points,
                 label=f"{plane}_cardiac",
                 color=(255, 100, 100)
             )
@@ -825,11 +972,7 @@ class CardiacViewWindow(QMainWindow):
                 # Remove old line segment from annotations if exists
                 old_ls = self._cardiac_line_segments['axial']
                 if old_ls and self._annotations:
-                    # Find index of old line segment
-                    for i, existing in enumerate(self._annotations.line_segments):
-                        if existing is old_ls:
-                            self._annotations.remove_line_segment(i)
-                            break
+                    self._annotations.remove_line_segment_object(old_ls)
 
                 # Store new line segment
                 self._cardiac_line_segments['axial'] = ls
@@ -838,47 +981,44 @@ class CardiacViewWindow(QMainWindow):
                 if self._annotations:
                     self._annotations.add_line_segment(ls)
 
-                # Clear dependent views before regenerating
-                self._clear_dependent_views('axial')
+                # Invalidate dependent views; p2ch is regenerated right away
+                self._invalidate_dependent_views('axial')
                 self._generate_p2ch_view()
 
-            self._lineseg_first_point = None
             self._lineseg_source_view = None
-            view.update_display()
+            # Only the line overlay changed; the slice itself is unchanged
+            view.refresh_annotations()
 
     # --- Oblique View Mouse Handlers ---
 
     def _on_oblique_view_mouse_pressed(self, view_name: str,
                                         scene_pos: QPointF, event: QMouseEvent):
         """Handle mouse press on oblique views."""
-        if event.button() == Qt.LeftButton:
-            view = self._bottom_views[view_name]
+        view = self._bottom_views[view_name]
+        button = event.button()
+        if button == Qt.LeftButton:
             pos_3d = view.map_2d_to_3d(scene_pos.x(), scene_pos.y())
             if pos_3d:
-                self._lineseg_first_point = pos_3d
+                self._lineseg_points[0] = pos_3d
                 self._lineseg_source_view = view_name
+                # The start point is fixed for the whole drag
+                self._lineseg_start_2d = view.get_plane().map_3d_to_2d(*pos_3d)
 
-        elif event.button() == Qt.RightButton:
-            # Remove line segment
-            if view_name == 'p2ch' and self._cardiac_line_segments['p2ch']:
-                self._cardiac_line_segments['p2ch'] = None
-                self._clear_dependent_views('p2ch')
-                self._bottom_views[view_name].set_line_segment(None)
-            elif view_name == 'p4ch' and self._cardiac_line_segments['p4ch']:
-                self._cardiac_line_segments['p4ch'] = None
-                self._clear_dependent_views('p4ch')
-                self._bottom_views[view_name].set_line_segment(None)
+        elif button == Qt.RightButton:
+            # Remove line segment (only p2ch and p4ch lines drive other views)
+            line_segments = self._cardiac_line_segments
+            if view_name in ('p2ch', 'p4ch') and line_segments[view_name]:
+                line_segments[view_name] = None
+                self._clear_dependent_views(view_name)
+                view.set_line_segment(None)
 
     def _on_oblique_view_mouse_moved(self, view_name: str,
                                       scene_pos: QPointF, event: QMouseEvent):
         """Handle mouse move on oblique views."""
-        if self._lineseg_first_point and self._lineseg_source_view == view_name:
-            view = self._bottom_views[view_name]
-            plane = view.get_plane()
-            if plane:
-                start_2d = plane.map_3d_to_2d(*self._lineseg_first_point)
-                if start_2d:
-                    view.set_lineseg_preview(start_2d, (scene_pos.x(), scene_pos.y()))
+        if self._lineseg_source_view == view_name and self._lineseg_start_2d:
+            self._bottom_views[view_name].set_lineseg_preview(
+                self._lineseg_start_2d, (scene_pos.x(), scene_pos.y())
+            )
 
     def _on_oblique_view_mouse_released(self, view_name: str,
                                          scene_pos: QPointF, event: QMouseEvent):
@@ -889,30 +1029,26 @@ class CardiacViewWindow(QMainWindow):
         view = self._bottom_views[view_name]
         view.clear_lineseg_preview()
 
-        if self._lineseg_first_point and self._lineseg_source_view == view_name:
+        if self._lineseg_source_view == view_name:
             pos_3d = view.map_2d_to_3d(scene_pos.x(), scene_pos.y())
             if pos_3d:
-                x1, y1, z1 = self._lineseg_first_point
-                x2, y2, z2 = pos_3d
-
-                ls = LineSegment(
-                    x1=x1, y1=y1, z1=z1,
-                    x2=x2, y2=y2, z2=z2,
+                self._lineseg_points[1] = pos_3d
+                ls = LineSegment.from_endpoints(
+                    self._lineseg_points,
                     label=f"{view_name}_cardiac",
                     color=(100, 255, 100)
                 )
 
-                if view_name == 'p2ch':
-                    self._cardiac_line_segments['p2ch'] = ls
+                if view_name in ('p2ch', 'p4ch'):
+                    self._cardiac_line_segments[view_name] = ls
                     view.set_line_segment(ls)
-                    self._generate_p4ch_view()
-                elif view_name == 'p4ch':
-                    self._cardiac_line_segments['p4ch'] = ls
-                    view.set_line_segment(ls)
-                    self._generate_sax_view()
+                    if view_name == 'p2ch':
+                        self._generate_p4ch_view()
+                    else:
+                        self._generate_sax_view()
 
-            self._lineseg_first_point = None
             self._lineseg_source_view = None
+            self._lineseg_start_2d = None
 
     # --- View Generation ---
 
@@ -956,10 +1092,10 @@ class CardiacViewWindow(QMainWindow):
 
         # Get 2D coordinates on p2ch plane
         # Point 1 = valve, Point 2 = apex
-        pos1 = p2ch_plane.map_3d_to_2d(ls.x1, ls.y1, ls.z1)
-        pos2 = p2ch_plane.map_3d_to_2d(ls.x2, ls.y2, ls.z2)
-        if not pos1 or not pos2:
+        pos = p2ch_plane.map_3d_to_2d_batch(_line_endpoints(ls))
+        if pos is None:
             return
+        pos1, pos2 = pos
 
         # Get plane with rotation info for optimized local rotation
         result = create_p4ch_plane_from_p2ch_line(
@@ -1003,10 +1139,10 @@ class CardiacViewWindow(QMainWindow):
         volume = self._current_patient.image
 
         # Get 2D coordinates on p4ch plane
-        pos1 = p4ch_plane.map_3d_to_2d(ls.x1, ls.y1, ls.z1)
-        pos2 = p4ch_plane.map_3d_to_2d(ls.x2, ls.y2, ls.z2)
-        if not pos1 or not pos2:
+        pos = p4ch_plane.map_3d_to_2d_batch(_line_endpoints(ls))
+        if pos is None:
             return
+        pos1, pos2 = pos
 
         plane = create_sax_plane_from_p4ch_line(
             pos1[0], pos1[1], pos2[0], pos2[1],
@@ -1015,11 +1151,22 @@ class CardiacViewWindow(QMainWindow):
 
         self._oblique_planes['sax'] = plane
 
-        # Calculate scroll range based on volume size
-        max_dim = max(volume.shape)
-        scroll_range = (-max_dim // 2, max_dim // 2)
+        # Scroll range is based on volume size (set when the patient loads)
+        self._bottom_views['sax'].set_plane(volume, plane, self._sax_scroll_range)
+
+    def _invalidate_dependent_views(self, source: str):
+        """Invalidate views depending on source ahead of regenerating them.
 
-        self._bottom_views['sax'].set_plane(volume, plane, scroll_range)
+        The direct dependent is only marked dirty, since it gets a new plane
+        right after; views further down the chain are cleared as usual.
+        """
+        if source == 'axial':
+            self._bottom_views['p2ch'].mark_dirty()
+            self._oblique_planes['p2ch'] = None
+            self._cardiac_line_segments['p2ch'] = None
+            self._clear_dependent_views('p2ch')
+        else:
+            self._clear_dependent_views(source)
 
     def _clear_dependent_views(self, source: str):
         """Clear views that depend on the given source."""
@@ -1042,24 +1189,21 @@ class CardiacViewWindow(QMainWindow):
     def _convert_2d_to_3d(self, plane: str, slice_idx: int,
                           x2d: float, y2d: float) -> Tuple[float, float, float]:
         """Convert 2D view coordinates to 3D volume coordinates."""
-        if plane == "axial":
-            return (x2d, y2d, float(slice_idx))
-        elif plane == "sagittal":
-            return (float(slice_idx), x2d, y2d)
-        else:  # coronal
-            return (x2d, float(slice_idx), y2d)
+        i, j, k = _PLANE_AXES[plane]
+        out = [0.0, 0.0, 0.0]
+        out[i] = x2d
+        out[j] = y2d
+        out[k] = float(slice_idx)
+        return tuple(out)
 
     def _convert_3d_to_2d(self, plane: str, slice_idx: int,
                           x: float, y: float, z: float) -> Optional[Tuple[float, float]]:
-        """Convert 3D coordinates to 2D view coordinates."""
-        tolerance = 0.5
-        if plane == "axial":
-            if abs(z - slice_idx) <= tolerance:
-                return (x, y)
-        elif plane == "sagittal":
-            if abs(x - slice_idx) <= tolerance:
-                return (y, z)
-        else:  # coronal
-            if abs(y - slice_idx) <= tolerance:
-                return (x, z)
+        """Convert 3D coordinates to 2D view coordinates.
+
+        Returns None unless the point lies within half a voxel of the slice.
+        """
+        i, j, k = _PLANE_AXES[plane]
+        pos = (x, y, z)
+        if -0.5 <= pos[k] - slice_idx <= 0.5:
+            return (pos[i], pos[j])
         return None
@@ -1,12 +1,12 @@
 """Control panel with window/level and other settings."""
 
-from typing import Optional
+from typing import Optional, Tuple
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QSlider,
     QSpinBox, QComboBox, QCheckBox, QGroupBox, QFormLayout
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, Slot
 
 import config
 
@@ -32,6 +32,10 @@ class ControlsWidget(QWidget):
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        # Set while window/level widgets are updated programmatically
+        self._updating_wl = False
+        # Last emitted (center, width); None after a programmatic update
+        self._last_wl: Optional[Tuple[float, float]] = None
         self._setup_ui()
 
     def _setup_ui(self):
@@ -46,13 +50,13 @@ class ControlsWidget(QWidget):
         self.window_center_slider = QSlider(Qt.Horizontal)
         self.window_center_slider.setRange(-1000, 4000)
         self.window_center_slider.setValue(config.DEFAULT_WINDOW_CENTER)
-        self.window_center_slider.valueChanged.connect(self._on_window_level_changed)
 
         self.window_center_spin = QSpinBox()
         self.window_center_spin.setRange(-1000, 4000)
         self.window_center_spin.setValue(config.DEFAULT_WINDOW_CENTER)
-        self.window_center_spin.valueChanged.connect(self.window_center_slider.setValue)
-        self.window_center_slider.valueChanged.connect(self.window_center_spin.setValue)
+
+        self.window_center_slider.valueChanged.connect(self._on_window_center_changed)
+        self.window_center_spin.valueChanged.connect(self._on_window_center_changed)
 
         center_layout = QHBoxLayout()
         center_layout.addWidget(self.window_center_slider)
@@ -61,13 +65,13 @@ class ControlsWidget(QWidget):
         self.window_width_slider = QSlider(Qt.Horizontal)
         self.window_width_slider.setRange(1, 5000)
         self.window_width_slider.setValue(config.DEFAULT_WINDOW_WIDTH)
-        self.window_width_slider.valueChanged.connect(self._on_window_level_changed)
 
         self.window_width_spin = QSpinBox()
         self.window_width_spin.setRange(1, 5000)
         self.window_width_spin.setValue(config.DEFAULT_WINDOW_WIDTH)
-        self.window_width_spin.valueChanged.connect(self.window_width_slider.setValue)
-        self.window_width_slider.valueChanged.connect(self.window_width_spin.setValue)
+
+        self.window_width_slider.valueChanged.connect(self._on_window_width_changed)
+        self.window_width_spin.valueChanged.connect(self._on_window_width_changed)
 
         width_layout = QHBoxLayout()
         width_layout.addWidget(self.window_width_slider)
@@ -83,15 +87,15 @@ class ControlsWidget(QWidget):
         self.mask_opacity_slider = QSlider(Qt.Horizontal)
         self.mask_opacity_slider.setRange(0, 255)
         self.mask_opacity_slider.setValue(config.DEFAULT_MASK_OPACITY)
-        self.mask_opacity_slider.valueChanged.connect(self.mask_opacity_changed.emit)
+        self.mask_opacity_slider.valueChanged.connect(self.mask_opacity_changed)
 
         self.show_ref_mask_check = QCheckBox("Show Reference Mask")
         self.show_ref_mask_check.setChecked(True)
-        self.show_ref_mask_check.toggled.connect(self.show_reference_mask_changed.emit)
+        self.show_ref_mask_check.toggled.connect(self.show_reference_mask_changed)
 
         self.show_annotations_check = QCheckBox("Show Annotations")
         self.show_annotations_check.setChecked(True)
-        self.show_annotations_check.toggled.connect(self.show_annotations_changed.emit)
+        self.show_annotations_check.toggled.connect(self.show_annotations_changed)
 
         display_layout.addRow("Mask Opacity:", self.mask_opacity_slider)
         display_layout.addRow(self.show_ref_mask_check)
@@ -102,6 +106,7 @@ class ControlsWidget(QWidget):
         annotation_layout = QFormLayout(annotation_group)
 
         self.label_combo = QComboBox()
+        label_items = []
         for label_id, label_name in config.LABEL_NAMES.items():
             color = config.LABEL_COLORS.get(label_id, (128, 128, 128))
             # Show reference mask value in dropdown if mapping exists
@@ -110,19 +115,25 @@ class ControlsWidget(QWidget):
                 display_text = f"{label_name} ({ref_value})"
             else:
                 display_text = label_name
-            self.label_combo.addItem(display_text, label_id)
+            # Keep the resolved (id, name, color) triple as item data
+            label_items.append((label_id, display_text, color))
+        # Insert all items in one batch, then attach their data
+        self.label_combo.addItems([text for _, text, _ in label_items])
+        for i, item in enumerate(label_items):
+            self.label_combo.setItemData(i, item)
         self.label_combo.currentIndexChanged.connect(self._on_label_changed)
 
         self.brush_size_slider = QSlider(Qt.Horizontal)
         self.brush_size_slider.setRange(config.MIN_BRUSH_SIZE, config.MAX_BRUSH_SIZE)
         self.brush_size_slider.setValue(config.DEFAULT_BRUSH_SIZE)
-        self.brush_size_slider.valueChanged.connect(self.brush_size_changed.emit)
 
         self.brush_size_spin = QSpinBox()
         self.brush_size_spin.setRange(config.MIN_BRUSH_SIZE, config.MAX_BRUSH_SIZE)
         self.brush_size_spin.setValue(config.DEFAULT_BRUSH_SIZE)
+
+        # The slider is the source of truth; the spin box only forwards to it
+        self.brush_size_slider.valueChanged.connect(self._on_brush_size_changed)
         self.brush_size_spin.valueChanged.connect(self.brush_size_slider.setValue)
-        self.brush_size_slider.valueChanged.connect(self.brush_size_spin.setValue)
 
         brush_layout = QHBoxLayout()
         brush_layout.addWidget(self.brush_size_slider)
@@ -137,41 +148,63 @@ class ControlsWidget(QWidget):
         layout.addWidget(annotation_group)
         layout.addStretch()
 
+    @Slot(int)
+    def _on_window_center_changed(self, value: int):
+        """Sync center slider and spin box, then emit once."""
+        if self._updating_wl:
+            return
+        self._updating_wl = True
+        self.window_center_slider.setValue(value)
+        self.window_center_spin.setValue(value)
+        self._updating_wl = False
+        self._on_window_level_changed()
+
+    @Slot(int)
+    def _on_window_width_changed(self, value: int):
+        """Sync width slider and spin box, then emit once."""
+        if self._updating_wl:
+            return
+        self._updating_wl = True
+        self.window_width_slider.setValue(value)
+        self.window_width_spin.setValue(value)
+        self._updating_wl = False
+        self._on_window_level_changed()
+
     def _on_window_level_changed(self):
         """Emit combined window/level change signal."""
-        center = self.window_center_slider.value()
-        width = self.window_width_slider.value()
-        self.window_level_changed.emit(float(center), float(width))
-
+        wl = (float(self.window_center_slider.value()), float(self.window_width_slider.value()))
+        if wl == self._last_wl:
+            return
+        self._last_wl = wl
+        self.window_level_changed.emit(*wl)
+
+    @Slot(int)
+    def _on_brush_size_changed(self, value: int):
+        """Sync the brush spin box and emit the new size."""
+        self.brush_size_spin.setValue(value)
+        self.brush_size_changed.emit(value)
+
+    @Slot(int)
     def _on_label_changed(self, index: int):
         """Emit label change signal."""
-        label_id = self.label_combo.itemData(index)
-        label_name = self.label_combo.itemText(index)
+        label_id, label_name, _ = self.label_combo.itemData(index)
         self.label_changed.emit(label_id, label_name)
 
     def set_window_level(self, center: float, width: float):
-        """Set window/level values without emitting signals."""
-        self.window_center_slider.blockSignals(True)
-        self.window_width_slider.blockSignals(True)
-        self.window_center_spin.blockSignals(True)
-        self.window_width_spin.blockSignals(True)
-
+        """Set window/level values without emitting window_level_changed."""
+        self._updating_wl = True
         self.window_center_slider.setValue(int(center))
         self.window_width_slider.setValue(int(width))
         self.window_center_spin.setValue(int(center))
         self.window_width_spin.setValue(int(width))
-
-        self.window_center_slider.blockSignals(False)
-        self.window_width_slider.blockSignals(False)
-        self.window_center_spin.blockSignals(False)
-        self.window_width_spin.blockSignals(False)
+        self._updating_wl = False
+        # Views may hold a window the widgets can't show exactly (fractional),
+        # so the next user change must always be emitted
+        self._last_wl = None
 
     def get_current_label(self) -> tuple:
         """Get current label (id, name, color)."""
-        label_id = self.label_combo.currentData()
-        label_name = self.label_combo.currentText()
-        color = config.LABEL_COLORS.get(label_id, (128, 128, 128))
-        return label_id, label_name, color
+        return self.label_combo.currentData()
 
     def get_brush_size(self) -> int:
         """Get current brush size."""
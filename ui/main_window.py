@@ -1,22 +1,58 @@
 """Main application window."""
 
-from pathlib import Path
-from typing import Dict, Optional, List, Tuple
+import logging
+from collections import OrderedDict
+from functools import partial
+from typing import Callable, Dict, Optional, List, Tuple
 
+import cv2
+import numpy as np
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
-    QSplitter, QStatusBar, QMessageBox, QApplication
+    QSplitter, QStatusBar, QMessageBox, QApplication, QProgressBar
 )
-from PySide6.QtCore import Qt, Signal, QPointF
-from PySide6.QtGui import QKeySequence, QShortcut, QCursor, QPainterPath
+from PySide6.QtCore import Qt, Signal, Slot, QPointF, QTimer
+from PySide6.QtGui import QColor, QKeySequence, QShortcut, QCursor, QPainterPath, QPolygonF
 
 import config
 from core.patient import Patient
 from core.annotation import Keypoint, LineSegment, Annotations
+from core.persistence import save_patient_annotations, save_all_patients
+from tools.segment_tool import SegmentTool
 from .slice_view import SliceView
 from .controls import ControlsWidget
 from .patient_list import PatientListWidget
 from .toolbar import ToolBar
+from .patient_loader import PatientLoader
+from .annotation_saver import AnnotationSaver
+
+
+logger = logging.getLogger(__name__)
+
+# Initial number of points the brush stroke buffer holds before growing
+_STROKE_INITIAL_CAPACITY = 8192
+
+# (x2d, y2d, slice_idx) in a plane's view -> (x, y, z) volume coordinates
+_PLANE_TO_3D_COORDS = {
+    "axial": lambda x2d, y2d, s: (x2d, y2d, float(s)),
+    "sagittal": lambda x2d, y2d, s: (float(s), x2d, y2d),
+    "coronal": lambda x2d, y2d, s: (x2d, float(s), y2d),
+}
+
+# (x, y, z) volume coordinates -> (x2d, y2d) in a plane's view
+_PLANE_TO_2D_COORDS = {
+    "axial": lambda x, y, z: (x, y),
+    "sagittal": lambda x, y, z: (y, z),
+    "coronal": lambda x, y, z: (x, z),
+}
+
+# (edited plane, other plane) -> which 2D axis (0 = x2d, 1 = y2d) of the
+# edited plane runs along the other plane's slice axis
+_CROSS_AXIS = {
+    ("axial", "sagittal"): 0, ("axial", "coronal"): 1,
+    ("sagittal", "axial"): 1, ("sagittal", "coronal"): 0,
+    ("coronal", "axial"): 1, ("coronal", "sagittal"): 0,
+}
 
 
 class MainWindow(QMainWindow):
@@ -39,19 +75,73 @@ class MainWindow(QMainWindow):
         self._current_patient: Optional[Patient] = None
         self._current_tool = "view"
 
-        # Brush stroke accumulator
-        self._brush_stroke_points: List[Tuple[int, int]] = []
+        # Background patient loading; the pending patient is shown once loaded
+        self._loader = PatientLoader(self)
+        self._pending_patient: Optional[Patient] = None
+
+        # "Save" on close writes in the background; the window closes once done
+        self._close_saver = AnnotationSaver(self)
+        self._force_close = False
+        # Patients with loaded volumes, least recently used first
+        self._resident: "OrderedDict[str, Patient]" = OrderedDict()
+
+        # Brush stroke accumulator: the first _brush_stroke_len rows are the
+        # (x, y) points of the current stroke. Doubled when full; cv2 and the
+        # preview read slices of it without copying
+        self._brush_stroke_points = np.empty((_STROKE_INITIAL_CAPACITY, 2), dtype=np.int32)
+        self._brush_stroke_len = 0
         self._brush_stroke_plane: Optional[str] = None
         self._brush_stroke_slice: Optional[int] = None
         self._is_drawing = False
         self._temp_erase_mode = False
 
+        # Current label (label_id, label_name, color) and brush size, kept in
+        # sync with the controls so mouse handlers don't query the widgets
+        self._current_label: Optional[Tuple[int, str, Tuple[int, int, int]]] = None
+        # Preview QColor per label id, built lazily by _current_label_cached()
+        # and cleared when the selected label changes
+        self._label_color_cache: Dict[int, QColor] = {}
+        self._brush_size = config.DEFAULT_BRUSH_SIZE
+
+        # Settings captured when a brush/segment stroke starts and used for
+        # the whole stroke: (label_id, label_name, color), size, erase
+        self._stroke_label: Optional[Tuple[int, str, Tuple[int, int, int]]] = None
+        self._stroke_brush_size = 0
+        self._stroke_erase = False
+
         # Segment tool state
-        self._segment_path: Optional[QPainterPath] = None
+        # Contour points; the view's preview path is extended with the points
+        # added since the last preview (_segment_preview_len already sent)
+        self._segment_points: Optional[List[QPointF]] = None
+        self._segment_preview_len = 0
         self._segment_plane: Optional[str] = None
         self._segment_slice: Optional[int] = None
         self._segment_is_erasing = False
 
+        # Brush/segment previews are redrawn at most once per timer interval
+        # while dragging; mouse moves in between only extend the stroke
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(config.PREVIEW_COALESCE_MS)
+        self._preview_timer.timeout.connect(self._flush_drawing_preview)
+
+        # Line segment drags only move annotations; their redraws are
+        # throttled the same way and touch only the dragged view's overlay
+        self._drag_redraw_timer = QTimer(self)
+        self._drag_redraw_timer.setSingleShot(True)
+        self._drag_redraw_timer.setInterval(config.PREVIEW_COALESCE_MS)
+        self._drag_redraw_timer.timeout.connect(self._refresh_drag_annotations)
+
+        # Views other than the one just edited are refreshed on the next
+        # event loop pass, so the edited view repaints first
+        self._deferred_views: List[SliceView] = []
+        self._deferred_update_timer = QTimer(self)
+        self._deferred_update_timer.setSingleShot(True)
+        self._deferred_update_timer.setInterval(0)
+        self._deferred_update_timer.timeout.connect(self._flush_deferred_views)
+        # Views that keep showing a stroke preview until their deferred redraw
+        self._preview_commit_views: List[SliceView] = []
+
         # Line segment tool state
         self._lineseg_first_point: Optional[Tuple[float, float, float]] = None
         self._lineseg_plane: Optional[str] = None
@@ -63,6 +153,7 @@ class MainWindow(QMainWindow):
         self._lineseg_drag_endpoint: Optional[str] = None  # "start" or "end"
         self._lineseg_drag_plane: Optional[str] = None
         self._lineseg_drag_slice: Optional[int] = None
+        self._lineseg_drag_to_3d: Optional[Callable[[float, float, int], Tuple[float, float, float]]] = None
 
         self._setup_ui()
         self._setup_shortcuts()
@@ -113,29 +204,51 @@ class MainWindow(QMainWindow):
         self.setStatusBar(self.status_bar)
         self.status_bar.showMessage("Ready - Load a folder to begin")
 
-        # Store views in list for easy iteration
-        self._views = [self.axial_view, self.sagittal_view, self.coronal_view]
+        # Busy indicator shown while a patient loads in the background
+        self.load_progress = QProgressBar()
+        self.load_progress.setRange(0, 0)
+        self.load_progress.setMaximumWidth(120)
+        self.load_progress.setVisible(False)
+        self.status_bar.addPermanentWidget(self.load_progress)
+
+        # Store views in a tuple for easy iteration
+        self._views = (self.axial_view, self.sagittal_view, self.coronal_view)
+        self._view_by_plane: Dict[str, SliceView] = {
+            "axial": self.axial_view,
+            "sagittal": self.sagittal_view,
+            "coronal": self.coronal_view,
+        }
 
     def _setup_shortcuts(self):
-        """Set up keyboard shortcuts."""
-        # Tool modes
-        QShortcut(QKeySequence("1"), self, lambda: self.toolbar.set_tool("view"))
-        QShortcut(QKeySequence("2"), self, lambda: self.toolbar.set_tool("keypoint"))
-        QShortcut(QKeySequence("3"), self, lambda: self.toolbar.set_tool("brush"))
-        QShortcut(QKeySequence("4"), self, lambda: self.toolbar.set_tool("segment"))
-        QShortcut(QKeySequence("5"), self, lambda: self.toolbar.set_tool("lineseg"))
-
-        # Save
-        QShortcut(QKeySequence("Ctrl+S"), self, self._save_current)
-        QShortcut(QKeySequence("Ctrl+Shift+S"), self, self._save_all)
-
-        # Brush size
-        QShortcut(QKeySequence("+"), self, self.controls.increase_brush_size)
-        QShortcut(QKeySequence("="), self, self.controls.increase_brush_size)
-        QShortcut(QKeySequence("-"), self, self.controls.decrease_brush_size)
-
-        # Erase toggle
-        QShortcut(QKeySequence("E"), self, self._toggle_erase_mode)
+        """Set up keyboard shortcuts.
+
+        Window-wide QShortcuts fire even when a child widget (e.g. the
+        patient list) has focus; partial() binds the callbacks without a
+        Python lambda frame per activation.
+        """
+        set_tool = self.toolbar.set_tool
+        shortcuts = [
+            # Tool modes
+            ("1", partial(set_tool, "view")),
+            ("2", partial(set_tool, "keypoint")),
+            ("3", partial(set_tool, "brush")),
+            ("4", partial(set_tool, "segment")),
+            ("5", partial(set_tool, "lineseg")),
+
+            # Save
+            ("Ctrl+S", self._save_current),
+            ("Ctrl+Shift+S", self._save_all),
+
+            # Brush size
+            ("+", self.controls.increase_brush_size),
+            ("=", self.controls.increase_brush_size),
+            ("-", self.controls.decrease_brush_size),
+
+            # Erase toggle
+            ("E", self._toggle_erase_mode),
+        ]
+        for key, callback in shortcuts:
+            QShortcut(QKeySequence(key), self, callback, context=Qt.WindowShortcut)
 
     def _connect_signals(self):
         """Connect signals between components."""
@@ -148,11 +261,19 @@ class MainWindow(QMainWindow):
         # Patient list signals
         self.patient_list.patient_selected.connect(self._on_patient_selected)
         self.patient_list.folder_loaded.connect(self._on_folder_loaded)
+        self._loader.loaded.connect(self._on_patient_loaded)
+        self._loader.failed.connect(self._on_patient_load_failed)
+        self._loader.prefetched.connect(self._mark_resident)
+        self._close_saver.finished.connect(self._on_close_save_done)
+        self._close_saver.failed.connect(self._on_close_save_failed)
 
         # Control signals
         self.controls.window_level_changed.connect(self._on_window_level_changed)
         self.controls.mask_opacity_changed.connect(self._on_mask_opacity_changed)
         self.controls.brush_size_changed.connect(self._on_brush_size_changed)
+        self.controls.label_changed.connect(self._on_label_changed)
+        self._current_label = self.controls.get_current_label()
+        self._brush_size = self.controls.get_brush_size()
         self.controls.show_reference_mask_changed.connect(self._on_show_ref_mask_changed)
         self.controls.show_annotations_changed.connect(self._on_show_annotations_changed)
 
@@ -162,6 +283,7 @@ class MainWindow(QMainWindow):
             view.mouse_moved.connect(self._on_view_mouse_moved)
             view.mouse_released.connect(self._on_view_mouse_released)
 
+    @Slot(str)
     def _on_tool_changed(self, tool_name: str):
         """Handle tool change."""
         # Cancel any in-progress line segment when switching tools
@@ -187,12 +309,14 @@ class MainWindow(QMainWindow):
         for view in self._views:
             view.view.setCursor(QCursor(cursor))
 
+    @Slot(str)
     def _on_patient_selected(self, patient_id: str):
         """Handle patient selection from list."""
         patient = self.patient_list.get_patient(patient_id)
         if patient:
             self._load_patient(patient)
 
+    @Slot(list)
     def _on_folder_loaded(self, patients: list):
         """Handle folder load completion."""
         if patients:
@@ -214,12 +338,52 @@ class MainWindow(QMainWindow):
             if reply == QMessageBox.No:
                 return
 
-        # Load patient data
+        # Load patient data in the background, prefetching its neighbours
         self.status_bar.showMessage(f"Loading {patient.patient_id}...")
-        QApplication.processEvents()
+        self._pending_patient = patient
+        self.load_progress.setVisible(True)
+        self._loader.request(patient)
+
+        self._prefetch_neighbors(patient.patient_id)
 
-        patient.load()
+    def _prefetch_neighbors(self, patient_id: str):
+        """Queue background loads for the patients around the given one."""
+        for neighbor in (self.patient_list.get_next_patient(patient_id),
+                         self.patient_list.get_previous_patient(patient_id)):
+            if neighbor is not None:
+                self._loader.prefetch(neighbor)
+
+    @Slot(object)
+    def _mark_resident(self, patient: Patient):
+        """Record a patient as most recently used and evict old ones.
+
+        Evicts least recently used patients beyond MAX_RESIDENT_PATIENTS,
+        never the current or pending patient or one still being loaded.
+        """
+        self._resident[patient.patient_id] = patient
+        self._resident.move_to_end(patient.patient_id)
+
+        excess = len(self._resident) - config.MAX_RESIDENT_PATIENTS
+        for patient_id, other in list(self._resident.items()):
+            if excess <= 0:
+                break
+            if (other is self._current_patient or other is self._pending_patient
+                    or self._loader.is_busy(other)):
+                continue
+            other.unload()
+            del self._resident[patient_id]
+            excess -= 1
+
+    @Slot(object)
+    def _on_patient_loaded(self, patient: Patient):
+        """Display a patient once its data has been loaded."""
+        if patient is not self._pending_patient:
+            # Superseded by a later selection
+            return
+        self._pending_patient = None
+        self.load_progress.setVisible(False)
         self._current_patient = patient
+        self._mark_resident(patient)
 
         # Update all views
         for view in self._views:
@@ -234,39 +398,73 @@ class MainWindow(QMainWindow):
         self.controls.set_window_level(center, width)
 
         self.status_bar.showMessage(f"Loaded: {patient.patient_id}")
-        self.patient_list.refresh_display()
+        self.patient_list.refresh_patient(patient.patient_id)
+
+    @Slot(object, str)
+    def _on_patient_load_failed(self, patient: Patient, message: str):
+        """Report a patient that could not be loaded."""
+        if patient is not self._pending_patient:
+            return
+        self._pending_patient = None
+        self.load_progress.setVisible(False)
+        self.status_bar.showMessage(f"Failed to load {patient.patient_id}")
+        QMessageBox.warning(
+            self,
+            "Load Failed",
+            f"Could not load {patient.patient_id}:\n{message}"
+        )
 
+    @Slot(float, float)
     def _on_window_level_changed(self, center: float, width: float):
-        """Handle window/level change."""
+        """Handle window/level change (redraws only the images)."""
         for view in self._views:
             view.set_window_level(center, width)
-            view.update_display()
 
+    @Slot(int)
     def _on_mask_opacity_changed(self, opacity: int):
-        """Handle mask opacity change."""
+        """Handle mask opacity change (redraws only the mask overlays)."""
         for view in self._views:
             view.set_mask_opacity(opacity)
-            view.update_display()
 
+    @Slot(int)
     def _on_brush_size_changed(self, size: int):
         """Handle brush size change."""
-        # Update cursor if in brush mode
-        if self._current_tool == "brush":
-            # Could update cursor size here
-            pass
+        self._brush_size = size
+
+    @Slot(int, str)
+    def _on_label_changed(self, label_id: int, label_name: str):
+        """Cache the newly selected label."""
+        self._current_label = self.controls.get_current_label()
+        self._label_color_cache.clear()
 
+    def _current_label_cached(self) -> Tuple[int, str, Tuple[int, int, int], QColor]:
+        """Get the current label (id, name, color) with its preview QColor.
+
+        The QColor is built once per label, so previews redrawn on every
+        mouse move don't allocate a new color each time.
+        """
+        label_id, label_name, color = self._current_label
+        qcolor = self._label_color_cache.get(label_id)
+        if qcolor is None:
+            qcolor = QColor(*color, 200)
+            self._label_color_cache[label_id] = qcolor
+        return label_id, label_name, color, qcolor
+
+    @Slot(bool)
     def _on_show_ref_mask_changed(self, show: bool):
         """Handle reference mask visibility toggle."""
         for view in self._views:
             view.show_reference_mask = show
-            view.update_display()
+        self._schedule_view_update()
 
+    @Slot(bool)
     def _on_show_annotations_changed(self, show: bool):
         """Handle annotations visibility toggle."""
         for view in self._views:
             view.show_annotations = show
-            view.update_display()
+        self._schedule_view_update()
 
+    @Slot()
     def _toggle_erase_mode(self):
         """Toggle erase mode for brush tool."""
         if self._current_tool == "brush":
@@ -274,6 +472,7 @@ class MainWindow(QMainWindow):
             self.toolbar.set_erase_mode(not current)
 
     # Mouse event handlers
+    @Slot(str, int, QPointF, object)
     def _on_view_mouse_pressed(self, plane: str, slice_idx: int, scene_pos: QPointF, event):
         """Handle mouse press on a view."""
         if self._current_patient is None:
@@ -307,6 +506,7 @@ class MainWindow(QMainWindow):
             elif self._current_tool == "lineseg":
                 self._remove_line_segment(plane, slice_idx, scene_pos)
 
+    @Slot(str, int, QPointF, object)
     def _on_view_mouse_moved(self, plane: str, slice_idx: int, scene_pos: QPointF, event):
         """Handle mouse move on a view."""
         if self._current_patient is None:
@@ -321,6 +521,7 @@ class MainWindow(QMainWindow):
         elif self._current_tool == "lineseg" and self._lineseg_first_point is not None:
             self._update_lineseg_preview(plane, slice_idx, scene_pos)
 
+    @Slot(str, int, QPointF, object)
     def _on_view_mouse_released(self, plane: str, slice_idx: int, scene_pos: QPointF, event):
         """Handle mouse release on a view."""
         if self._current_patient is None:
@@ -345,20 +546,14 @@ class MainWindow(QMainWindow):
         """Add a keypoint at the clicked position."""
         x2d, y2d = scene_pos.x(), scene_pos.y()
 
-        # Convert 2D to 3D coordinates based on plane
-        if plane == "axial":
-            x, y, z = x2d, y2d, float(slice_idx)
-        elif plane == "sagittal":
-            x, y, z = float(slice_idx), x2d, y2d
-        else:  # coronal
-            x, y, z = x2d, float(slice_idx), y2d
+        x, y, z = _PLANE_TO_3D_COORDS[plane](x2d, y2d, slice_idx)
 
-        label_id, label_name, color = self.controls.get_current_label()
+        label_id, label_name, color = self._current_label
         kp = Keypoint(x=x, y=y, z=z, label=label_name, color=color)
 
         self._current_patient.annotations.add_keypoint(kp)
-        self._update_all_views()
-        self.patient_list.refresh_display()
+        self._refresh_all_annotations()
+        self.patient_list.refresh_patient(self._current_patient.patient_id)
 
         self.status_bar.showMessage(f"Added keypoint at ({x:.1f}, {y:.1f}, {z:.1f})")
 
@@ -366,128 +561,125 @@ class MainWindow(QMainWindow):
         """Remove nearest keypoint to clicked position."""
         x2d, y2d = scene_pos.x(), scene_pos.y()
 
-        # Convert 2D to 3D coordinates
-        if plane == "axial":
-            x, y, z = x2d, y2d, float(slice_idx)
-        elif plane == "sagittal":
-            x, y, z = float(slice_idx), x2d, y2d
-        else:
-            x, y, z = x2d, float(slice_idx), y2d
+        x, y, z = _PLANE_TO_3D_COORDS[plane](x2d, y2d, slice_idx)
 
         if self._current_patient.annotations.remove_nearest_keypoint(x, y, z):
-            self._update_all_views()
-            self.patient_list.refresh_display()
+            self._refresh_all_annotations()
+            self.patient_list.refresh_patient(self._current_patient.patient_id)
             self.status_bar.showMessage("Removed keypoint")
 
     def _start_brush_stroke(self, plane: str, slice_idx: int, scene_pos: QPointF):
         """Start a new brush stroke."""
         self._is_drawing = True
-        self._brush_stroke_points = [(int(scene_pos.x()), int(scene_pos.y()))]
+        self._brush_stroke_points[0] = (int(scene_pos.x()), int(scene_pos.y()))
+        self._brush_stroke_len = 1
         self._brush_stroke_plane = plane
         self._brush_stroke_slice = slice_idx
+        self._stroke_label = self._current_label
+        self._stroke_brush_size = self._brush_size
+        self._stroke_erase = self._temp_erase_mode or self.toolbar.is_erase_mode()
 
         # Show preview
         view = self._get_view_for_plane(plane)
-        view.set_brush_preview(self._brush_stroke_points, self.controls.get_brush_size())
+        view.set_brush_preview(self._brush_stroke_points[:1], self._stroke_brush_size)
 
     def _continue_brush_stroke(self, plane: str, slice_idx: int, scene_pos: QPointF):
         """Continue the current brush stroke."""
         if plane != self._brush_stroke_plane:
             return
 
-        self._brush_stroke_points.append((int(scene_pos.x()), int(scene_pos.y())))
+        # Skip samples too close to the last one to change the stroke
+        px, py = int(scene_pos.x()), int(scene_pos.y())
+        n = self._brush_stroke_len
+        lx, ly = self._brush_stroke_points[n - 1].tolist()
+        min_step = max(1, self._stroke_brush_size // 4)
+        if max(abs(px - lx), abs(py - ly)) < min_step:
+            return
+        if n == len(self._brush_stroke_points):
+            self._brush_stroke_points = np.concatenate(
+                [self._brush_stroke_points, np.empty_like(self._brush_stroke_points)]
+            )
+        self._brush_stroke_points[n] = (px, py)
+        self._brush_stroke_len = n + 1
 
-        # Update preview
-        view = self._get_view_for_plane(plane)
-        view.set_brush_preview(self._brush_stroke_points, self.controls.get_brush_size())
+        # Update preview (coalesced)
+        if not self._preview_timer.isActive():
+            self._preview_timer.start()
 
     def _end_brush_stroke(self, plane: str, slice_idx: int):
         """End the brush stroke and apply to mask."""
-        import cv2
-        import numpy as np
-
-        if not self._brush_stroke_points:
+        if self._brush_stroke_len == 0:
             self._is_drawing = False
             return
+        points = self._brush_stroke_points[:self._brush_stroke_len]
 
-        # Get current label info
-        label_id, label_name, color = self.controls.get_current_label()
-        erase = self._temp_erase_mode or self.toolbar.is_erase_mode()
+        # Label info and settings captured when the stroke started
+        label_id, label_name, color = self._stroke_label
+        erase = self._stroke_erase
 
-        # DEBUG logging
-        print(f"\n=== DEBUG _end_brush_stroke ===")
-        print(f"label_id={label_id}, label_name={label_name}, erase={erase}")
-        print(f"plane={self._brush_stroke_plane}, slice={self._brush_stroke_slice}")
-        print(f"num_points={len(self._brush_stroke_points)}")
+        logger.debug("Brush stroke: label=%s erase=%s plane=%s slice=%s points=%d",
+                     label_id, erase, self._brush_stroke_plane,
+                     self._brush_stroke_slice, self._brush_stroke_len)
 
         # Get or create mask (initialize from reference mask if available)
         volume_shape = self._current_patient.image.shape
         initial_mask = None
-        has_reference = self._current_patient.reference_mask is not None
-        print(f"has_reference_mask={has_reference}")
-
-        if has_reference:
+        if self._current_patient.reference_mask is not None:
             initial_mask = self._current_patient.reference_mask.array
-            # Check if this label exists in reference mask (using mapped value)
-            import config as cfg
-            ref_value = cfg.LABEL_TO_REFERENCE_VALUE.get(label_id, label_id)
-            ref_label_count = np.sum(initial_mask == ref_value)
-            print(f"label_id={label_id} maps to ref_value={ref_value}")
-            print(f"reference_mask voxels with ref_value={ref_value}: {ref_label_count}")
-
-        # Check if mask already exists for this label
-        mask_existed = label_id in self._current_patient.annotations.masks
-        print(f"mask_already_existed={mask_existed}")
 
+        # A new mask may be seeded from the reference mask, changing every view
+        is_new_mask = label_id not in self._current_patient.annotations.masks
         mask_ann = self._current_patient.annotations.get_or_create_mask(
             label_id, label_name, volume_shape, color, initial_mask
         )
 
-        # Check mask stats after get_or_create
-        total_mask_voxels = np.sum(mask_ann.mask > 0)
-        print(f"after get_or_create: total_mask_voxels={total_mask_voxels}")
-
-        # Get 2D slice
-        slice_2d = mask_ann.get_2d_slice(self._brush_stroke_plane, self._brush_stroke_slice).copy()
-        slice_nonzero_before = np.sum(slice_2d > 0)
-        print(f"slice_2d nonzero pixels BEFORE draw: {slice_nonzero_before}")
+        # Get 2D slice. Axial/coronal slices are views with unit column
+        # stride that cv2 can draw into directly; sagittal slices are strided
+        # along both axes, so they are drawn on a copy and written back
+        slice_2d = mask_ann.get_2d_slice(self._brush_stroke_plane, self._brush_stroke_slice)
+        in_place = slice_2d.strides[1] == slice_2d.itemsize
+        if not in_place:
+            slice_2d = np.ascontiguousarray(slice_2d)
 
         # Draw stroke on slice
-        brush_size = self.controls.get_brush_size()
+        brush_size = self._stroke_brush_size
         value = 0 if erase else 255
-        print(f"brush_size={brush_size}, draw_value={value}")
-
-        for i in range(len(self._brush_stroke_points) - 1):
-            pt1 = self._brush_stroke_points[i]
-            pt2 = self._brush_stroke_points[i + 1]
-            cv2.line(slice_2d, pt1, pt2, value, brush_size)
 
-        # Handle single point
-        if len(self._brush_stroke_points) == 1:
-            pt = self._brush_stroke_points[0]
-            cv2.circle(slice_2d, pt, brush_size // 2, value, -1)
-
-        slice_nonzero_after = np.sum(slice_2d > 0)
-        print(f"slice_2d nonzero pixels AFTER draw: {slice_nonzero_after}")
+        if len(points) > 1:
+            # Rasterize the whole stroke in one call (same pixels as
+            # drawing each segment with cv2.line)
+            cv2.polylines(slice_2d, [points.reshape(-1, 1, 2)], isClosed=False,
+                          color=value, thickness=brush_size, lineType=cv2.LINE_8)
+        else:
+            # Handle single point
+            x, y = points[0].tolist()
+            if brush_size <= 1:
+                # A one-pixel dot, which cv2.circle would also draw
+                h, w = slice_2d.shape
+                if 0 <= x < w and 0 <= y < h:
+                    slice_2d[y, x] = value
+            else:
+                cv2.circle(slice_2d, (x, y), brush_size // 2, value, -1)
 
         # Update mask
-        mask_ann.set_2d_slice(self._brush_stroke_plane, self._brush_stroke_slice, slice_2d)
+        if not in_place:
+            mask_ann.set_2d_slice(self._brush_stroke_plane, self._brush_stroke_slice, slice_2d)
+        self._current_patient.annotations.masks_changed()
         self._current_patient.annotations.modified = True
 
-        # Verify update
-        slice_verify = mask_ann.get_2d_slice(self._brush_stroke_plane, self._brush_stroke_slice)
-        print(f"slice_2d nonzero pixels AFTER set: {np.sum(slice_verify > 0)}")
-        print(f"annotations.masks keys: {list(self._current_patient.annotations.masks.keys())}")
-        print(f"=== END DEBUG ===\n")
-
         # Clear preview and update display
         self._is_drawing = False
-        self._brush_stroke_points = []
-
-        view = self._get_view_for_plane(self._brush_stroke_plane)
-        view.clear_brush_preview()
-        self._update_all_views()
-        self.patient_list.refresh_display()
+        self._brush_stroke_len = 0
+
+        # Only views whose slice crosses the stroke need a redraw
+        bbox = None
+        if not is_new_mask:
+            radius = brush_size // 2 + 1
+            x0, y0 = points.min(axis=0) - radius
+            x1, y1 = points.max(axis=0) + radius
+            bbox = (int(x0), int(y0), int(x1), int(y1))
+        self._commit_preview(self._brush_stroke_plane, bbox)
+        self.patient_list.refresh_patient(self._current_patient.patient_id)
 
         action = "Erased" if erase else "Painted"
         self.status_bar.showMessage(f"{action} mask for {label_name}")
@@ -495,88 +687,107 @@ class MainWindow(QMainWindow):
     def _start_segment(self, plane: str, slice_idx: int, scene_pos: QPointF):
         """Start a new segment contour."""
         self._is_drawing = True
-        self._segment_path = QPainterPath()
-        self._segment_path.moveTo(scene_pos)
+        self._segment_points = [scene_pos]
         self._segment_plane = plane
         self._segment_slice = slice_idx
+        self._stroke_label = self._current_label
 
-        # Get current label color for preview
-        _, _, color = self.controls.get_current_label()
+        # Label color for preview
+        _, _, _, qcolor = self._current_label_cached()
 
         view = self._get_view_for_plane(plane)
-        view.set_segment_preview(self._segment_path, self._segment_is_erasing, color)
+        view.set_segment_preview(self._build_segment_path(), self._segment_is_erasing, qcolor)
+        self._segment_preview_len = len(self._segment_points)
 
     def _continue_segment(self, plane: str, slice_idx: int, scene_pos: QPointF):
         """Continue the current segment contour."""
         if plane != self._segment_plane:
             return
 
-        self._segment_path.lineTo(scene_pos)
+        if (scene_pos - self._segment_points[-1]).manhattanLength() < 1:
+            return
+        self._segment_points.append(scene_pos)
 
-        # Get current label color for preview
-        _, _, color = self.controls.get_current_label()
+        # Update preview (coalesced)
+        if not self._preview_timer.isActive():
+            self._preview_timer.start()
 
-        view = self._get_view_for_plane(plane)
-        view.set_segment_preview(self._segment_path, self._segment_is_erasing, color)
+    @Slot()
+    def _flush_drawing_preview(self):
+        """Redraw the brush or segment preview with the latest stroke."""
+        if not self._is_drawing:
+            return
+        if self._segment_points is not None:
+            view = self._get_view_for_plane(self._segment_plane)
+            view.extend_segment_preview(self._segment_points[self._segment_preview_len:])
+            self._segment_preview_len = len(self._segment_points)
+        elif self._brush_stroke_len:
+            view = self._get_view_for_plane(self._brush_stroke_plane)
+            view.set_brush_preview(self._brush_stroke_points[:self._brush_stroke_len],
+                                   self._stroke_brush_size)
+
+    def _build_segment_path(self) -> QPainterPath:
+        """Build the segment preview path from the accumulated points."""
+        path = QPainterPath()
+        path.addPolygon(QPolygonF(self._segment_points))
+        return path
 
     def _end_segment(self, plane: str, slice_idx: int):
         """End the segment contour and apply to mask."""
         # Always reset drawing state first
         self._is_drawing = False
 
-        if self._segment_path is None:
+        if self._segment_points is None:
             return
 
         try:
-            from tools.segment_tool import SegmentTool
-
-            # Close the path
-            self._segment_path.closeSubpath()
+            # Contour vertices for the fill (closed implicitly)
+            polygon = np.array([(p.x(), p.y()) for p in self._segment_points])
 
-            # Get current label info
-            label_id, label_name, color = self.controls.get_current_label()
+            # Label info captured when the segment started
+            label_id, label_name, color = self._stroke_label
 
             # Get or create mask (initialize from reference mask if available)
             volume_shape = self._current_patient.image.shape
             initial_mask = None
             if self._current_patient.reference_mask is not None:
                 initial_mask = self._current_patient.reference_mask.array
-            mask_ann = self._current_patient.annotations.get_or_create_mask(
+            bbox = None
+            if label_id in self._current_patient.annotations.masks:
+                x0, y0 = np.floor(polygon.min(axis=0)).astype(int)
+                x1, y1 = np.ceil(polygon.max(axis=0)).astype(int)
+                bbox = (int(x0), int(y0), int(x1), int(y1))
+            annotations = self._current_patient.annotations
+            mask_ann = annotations.get_or_create_mask(
                 label_id, label_name, volume_shape, color, initial_mask
             )
 
-            # Get slice shape
-            slice_shape = self._current_patient.image.get_slice_shape(self._segment_plane)
-
-            # Apply segment to mask
+            # A single-slice fillPoly; fast enough to run on the GUI thread,
+            # which also keeps the mask from being written while it is used
             SegmentTool.apply_segment_to_mask(
                 mask_ann.mask,
                 self._segment_plane,
                 self._segment_slice,
-                self._segment_path,
-                slice_shape,
+                polygon,
                 self._segment_is_erasing
             )
-            self._current_patient.annotations.modified = True
+            annotations.masks_changed()
+            annotations.modified = True
+            self.patient_list.refresh_patient(annotations.patient_id)
+            self._commit_preview(self._segment_plane, bbox)
 
             action = "Erased" if self._segment_is_erasing else "Filled"
             self.status_bar.showMessage(f"{action} segment for {label_name}")
 
         except Exception as e:
-            import traceback
-            traceback.print_exc()
+            logger.exception("Segment fill failed")
             self.status_bar.showMessage(f"Segment error: {e}")
-
-        finally:
-            # Always clear preview and reset state
-            if self._segment_plane:
-                view = self._get_view_for_plane(self._segment_plane)
-                view.clear_segment_preview()
+            self._get_view_for_plane(self._segment_plane).clear_segment_preview()
             self._update_all_views()
-            self.patient_list.refresh_display()
 
+        finally:
             # Reset state
-            self._segment_path = None
+            self._segment_points = None
             self._segment_plane = None
             self._segment_slice = None
             self._segment_is_erasing = False
@@ -585,13 +796,7 @@ class MainWindow(QMainWindow):
         """Handle click in line segment mode."""
         x2d, y2d = scene_pos.x(), scene_pos.y()
 
-        # Convert 2D to 3D coordinates based on plane
-        if plane == "axial":
-            x, y, z = x2d, y2d, float(slice_idx)
-        elif plane == "sagittal":
-            x, y, z = float(slice_idx), x2d, y2d
-        else:  # coronal
-            x, y, z = x2d, float(slice_idx), y2d
+        x, y, z = _PLANE_TO_3D_COORDS[plane](x2d, y2d, slice_idx)
 
         if self._lineseg_first_point is None:
             # First click - store the start point
@@ -610,7 +815,7 @@ class MainWindow(QMainWindow):
                 return
 
             x1, y1, z1 = self._lineseg_first_point
-            label_id, label_name, color = self.controls.get_current_label()
+            label_id, label_name, color = self._current_label
 
             ls = LineSegment(
                 x1=x1, y1=y1, z1=z1,
@@ -622,8 +827,8 @@ class MainWindow(QMainWindow):
 
             # Clear state and update
             self._cancel_lineseg()
-            self._update_all_views()
-            self.patient_list.refresh_display()
+            self._refresh_all_annotations()
+            self.patient_list.refresh_patient(self._current_patient.patient_id)
 
             self.status_bar.showMessage(
                 f"Added line segment from ({x1:.1f}, {y1:.1f}, {z1:.1f}) to ({x:.1f}, {y:.1f}, {z:.1f})"
@@ -635,19 +840,11 @@ class MainWindow(QMainWindow):
             return
 
         x2d, y2d = scene_pos.x(), scene_pos.y()
-        x1, y1, z1 = self._lineseg_first_point
-
-        # Get 2D coordinates of first point for this plane
-        if plane == "axial":
-            start_2d = (x1, y1)
-        elif plane == "sagittal":
-            start_2d = (y1, z1)
-        else:  # coronal
-            start_2d = (x1, z1)
+        start_2d = _PLANE_TO_2D_COORDS[plane](*self._lineseg_first_point)
 
-        _, _, color = self.controls.get_current_label()
+        _, _, _, qcolor = self._current_label_cached()
         view = self._get_view_for_plane(plane)
-        view.set_lineseg_preview(start_2d, (x2d, y2d), color)
+        view.set_lineseg_preview(start_2d, (x2d, y2d), qcolor)
 
     def _cancel_lineseg(self):
         """Cancel the current line segment operation."""
@@ -662,17 +859,11 @@ class MainWindow(QMainWindow):
         """Remove nearest line segment to clicked position."""
         x2d, y2d = scene_pos.x(), scene_pos.y()
 
-        # Convert 2D to 3D coordinates
-        if plane == "axial":
-            x, y, z = x2d, y2d, float(slice_idx)
-        elif plane == "sagittal":
-            x, y, z = float(slice_idx), x2d, y2d
-        else:
-            x, y, z = x2d, float(slice_idx), y2d
+        x, y, z = _PLANE_TO_3D_COORDS[plane](x2d, y2d, slice_idx)
 
         if self._current_patient.annotations.remove_nearest_line_segment(x, y, z):
-            self._update_all_views()
-            self.patient_list.refresh_display()
+            self._refresh_all_annotations()
+            self.patient_list.refresh_patient(self._current_patient.patient_id)
             self.status_bar.showMessage("Removed line segment")
 
     def _start_lineseg_drag(self, plane: str, slice_idx: int, scene_pos: QPointF) -> bool:
@@ -682,43 +873,31 @@ class MainWindow(QMainWindow):
         """
         x2d, y2d = scene_pos.x(), scene_pos.y()
 
-        # Find nearest endpoint
-        lineseg_on_slice = self._current_patient.annotations.get_line_segments_on_slice(
-            plane, slice_idx
-        )
-
-        if not lineseg_on_slice:
+        # Find the closest start and end points (compared by squared distance)
+        annotations = self._current_patient.annotations
+        indices, starts, ends = annotations.get_line_segment_endpoints_on_slice(plane, slice_idx)
+        if len(indices) == 0:
             return False
 
-        # Find the closest endpoint
-        min_dist = float('inf')
-        best_idx = None
-        best_endpoint = None
-
-        for idx, ls, ((x1, y1), (x2, y2)) in lineseg_on_slice:
-            # Distance to start point
-            dist_start = ((x2d - x1) ** 2 + (y2d - y1) ** 2) ** 0.5
-            if dist_start < min_dist:
-                min_dist = dist_start
-                best_idx = idx
-                best_endpoint = "start"
-
-            # Distance to end point
-            dist_end = ((x2d - x2) ** 2 + (y2d - y2) ** 2) ** 0.5
-            if dist_end < min_dist:
-                min_dist = dist_end
-                best_idx = idx
-                best_endpoint = "end"
+        dist_start = (starts[:, 0] - x2d) ** 2 + (starts[:, 1] - y2d) ** 2
+        dist_end = (ends[:, 0] - x2d) ** 2 + (ends[:, 1] - y2d) ** 2
+        i_start = int(dist_start.argmin())
+        i_end = int(dist_end.argmin())
+        if dist_start[i_start] <= dist_end[i_end]:
+            min_dist_sq, best_idx, best_endpoint = dist_start[i_start], indices[i_start], "start"
+        else:
+            min_dist_sq, best_idx, best_endpoint = dist_end[i_end], indices[i_end], "end"
 
         # Only start drag if close enough (within 15 pixels)
-        if min_dist > 15:
+        if min_dist_sq > 15 * 15:
             return False
 
         self._lineseg_dragging = True
-        self._lineseg_drag_index = best_idx
+        self._lineseg_drag_index = int(best_idx)
         self._lineseg_drag_endpoint = best_endpoint
         self._lineseg_drag_plane = plane
         self._lineseg_drag_slice = slice_idx
+        self._lineseg_drag_to_3d = _PLANE_TO_3D_COORDS[plane]
 
         self.status_bar.showMessage(
             f"Dragging line segment {best_endpoint} point - release to place"
@@ -738,13 +917,7 @@ class MainWindow(QMainWindow):
         # Get the line segment being dragged
         ls = self._current_patient.annotations.line_segments[self._lineseg_drag_index]
 
-        # Convert new position to 3D
-        if plane == "axial":
-            new_x, new_y, new_z = x2d, y2d, float(slice_idx)
-        elif plane == "sagittal":
-            new_x, new_y, new_z = float(slice_idx), x2d, y2d
-        else:  # coronal
-            new_x, new_y, new_z = x2d, float(slice_idx), y2d
+        new_x, new_y, new_z = self._lineseg_drag_to_3d(x2d, y2d, slice_idx)
 
         # Update the appropriate endpoint
         if self._lineseg_drag_endpoint == "start":
@@ -752,8 +925,10 @@ class MainWindow(QMainWindow):
         else:
             ls.x2, ls.y2, ls.z2 = new_x, new_y, new_z
 
+        self._current_patient.annotations.line_segments_changed()
         self._current_patient.annotations.modified = True
-        self._update_all_views()
+        if not self._drag_redraw_timer.isActive():
+            self._drag_redraw_timer.start()
 
     def _end_lineseg_drag(self, plane: str, slice_idx: int, scene_pos: QPointF):
         """End dragging a line segment endpoint."""
@@ -769,43 +944,101 @@ class MainWindow(QMainWindow):
         self._lineseg_drag_endpoint = None
         self._lineseg_drag_plane = None
         self._lineseg_drag_slice = None
+        self._lineseg_drag_to_3d = None
 
-        self._update_all_views()
-        self.patient_list.refresh_display()
+        # Show the final position now instead of after the throttle interval
+        self._drag_redraw_timer.stop()
+        self._refresh_all_annotations()
+        self.patient_list.refresh_patient(self._current_patient.patient_id)
         self.status_bar.showMessage("Line segment endpoint moved")
 
     def _get_view_for_plane(self, plane: str) -> SliceView:
         """Get the view widget for a given plane."""
-        if plane == "axial":
-            return self.axial_view
-        elif plane == "sagittal":
-            return self.sagittal_view
-        else:
-            return self.coronal_view
+        return self._view_by_plane[plane]
 
     def _update_all_views(self):
         """Update display on all views."""
         for view in self._views:
             view.update_display()
 
+    @Slot()
+    def _refresh_drag_annotations(self):
+        """Redraw the annotations of the view an endpoint is dragged in.
+
+        The other views catch up when the drag ends.
+        """
+        if self._lineseg_drag_plane is not None:
+            self._get_view_for_plane(self._lineseg_drag_plane).refresh_annotations()
+
+    @Slot()
+    def _refresh_all_annotations(self):
+        """Redraw only the annotation overlay of every view."""
+        for view in self._views:
+            view.refresh_annotations()
+
+    def _commit_preview(self, plane: str, bbox: Optional[Tuple[int, int, int, int]] = None):
+        """Replace a view's stroke preview with the edited mask on the next pass.
+
+        The preview already shows the edit, so it stays on screen until the
+        deferred redraw (edited view first, then the others) takes its place.
+
+        Args:
+            plane: Plane of the edited slice
+            bbox: (x0, y0, x1, y1) inclusive 2D bounds of the edit. If given,
+                other views are only redrawn if their slice passes through it
+        """
+        edited = self._get_view_for_plane(plane)
+        if edited not in self._preview_commit_views:
+            self._preview_commit_views.append(edited)
+        if edited in self._deferred_views:
+            self._deferred_views.remove(edited)
+        self._deferred_views.insert(0, edited)
+        for view in self._views:
+            if view is edited or view in self._deferred_views:
+                continue
+            if bbox is not None:
+                axis = _CROSS_AXIS[(plane, view.plane)]
+                if not bbox[axis] <= view.current_slice <= bbox[axis + 2]:
+                    continue
+            self._deferred_views.append(view)
+        self._deferred_update_timer.start()
+
+    def _schedule_view_update(self):
+        """Redraw all views once control changes stop arriving.
+
+        Settings changed within one event loop iteration collapse into a
+        single redraw per view.
+        """
+        for view in self._views:
+            if view not in self._deferred_views:
+                self._deferred_views.append(view)
+        self._deferred_update_timer.start()
+
+    @Slot()
+    def _flush_deferred_views(self):
+        """Update views whose refresh was deferred by an edit."""
+        views, self._deferred_views = self._deferred_views, []
+        committed, self._preview_commit_views = self._preview_commit_views, []
+        for view in committed:
+            view.drop_stroke_previews()
+        for view in views:
+            view.update_display()
+
+    @Slot()
     def _save_current(self):
         """Save current patient's annotations."""
         if self._current_patient is None:
             self.status_bar.showMessage("No patient to save")
             return
 
-        from core.persistence import save_patient_annotations
-
-        output_dir = Path(self._current_patient.image_path).parent / config.ANNOTATIONS_DIR
-        save_patient_annotations(self._current_patient, output_dir)
+        save_patient_annotations(self._current_patient, self._current_patient.annotations_dir)
 
-        self.patient_list.refresh_display()
+        self.patient_list.refresh_patient(self._current_patient.patient_id)
         self.status_bar.showMessage(f"Saved annotations for {self._current_patient.patient_id}")
 
+    @Slot()
     def _save_all(self):
         """Save all modified patients."""
-        from core.persistence import save_all_patients
-
         modified = self.patient_list.get_modified_patients()
         if not modified:
             self.status_bar.showMessage("No unsaved changes")
@@ -813,35 +1046,59 @@ class MainWindow(QMainWindow):
 
         # Use directory of first patient
         first_patient = modified[0]
-        output_dir = Path(first_patient.image_path).parent / config.ANNOTATIONS_DIR
+        output_dir = first_patient.annotations_dir
 
-        count = save_all_patients(self.patient_list.get_all_patients(), output_dir)
+        # Only hand over the modified patients rather than the whole cohort
+        count = save_all_patients(modified, output_dir)
 
-        self.patient_list.refresh_display()
+        for patient in modified:
+            self.patient_list.refresh_patient(patient.patient_id)
         self.status_bar.showMessage(f"Saved annotations for {count} patient(s)")
 
     def closeEvent(self, event):
         """Handle window close with unsaved changes check."""
-        modified = self.patient_list.get_modified_patients()
-        if modified:
-            patient_ids = ", ".join(p.patient_id for p in modified[:5])
-            if len(modified) > 5:
-                patient_ids += f"... and {len(modified) - 5} more"
+        if self._force_close or not self.patient_list.has_modified_patients():
+            event.accept()
+            return
+        if self._close_saver.is_busy():
+            event.ignore()
+            return
 
-            reply = QMessageBox.question(
-                self,
-                "Unsaved Changes",
-                f"The following patients have unsaved changes:\n{patient_ids}\n\nSave before closing?",
-                QMessageBox.Save | QMessageBox.Discard | QMessageBox.Cancel,
-                QMessageBox.Save
-            )
+        modified = self.patient_list.get_modified_patients()
+        patient_ids = ", ".join(p.patient_id for p in modified[:5])
+        if len(modified) > 5:
+            patient_ids += f"... and {len(modified) - 5} more"
+
+        reply = QMessageBox.question(
+            self,
+            "Unsaved Changes",
+            f"The following patients have unsaved changes:\n{patient_ids}\n\nSave before closing?",
+            QMessageBox.Save | QMessageBox.Discard | QMessageBox.Cancel,
+            QMessageBox.Save
+        )
 
-            if reply == QMessageBox.Save:
-                self._save_all()
-                event.accept()
-            elif reply == QMessageBox.Discard:
-                event.accept()
-            else:
-                event.ignore()
-        else:
+        if reply == QMessageBox.Save:
+            # Save in the background and close once it finishes; the window
+            # is disabled meanwhile so the masks aren't edited mid-write
+            event.ignore()
+            self.setEnabled(False)
+            self.status_bar.showMessage(f"Saving annotations for {len(modified)} patient(s)...")
+            self._close_saver.save_all(modified, modified[0].annotations_dir)
+        elif reply == QMessageBox.Discard:
             event.accept()
+        else:
+            event.ignore()
+
+    @Slot(int)
+    def _on_close_save_done(self, count: int):
+        """Close the window once the save started by closeEvent finishes."""
+        self._force_close = True
+        self.close()
+
+    @Slot(str)
+    def _on_close_save_failed(self, message: str):
+        """Keep the window open if saving on close failed."""
+        self.setEnabled(True)
+        self.patient_list.refresh_display()
+        self.status_bar.showMessage("Save failed")
+        QMessageBox.critical(self, "Save Failed", f"Could not save annotations: {message}")
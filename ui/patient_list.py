@@ -1,18 +1,113 @@
 """Patient list widget for browsing and selecting patients."""
 
-from pathlib import Path
-from typing import Dict, List, Optional
+import bisect
+from typing import Dict, List, Optional, Set
 
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QListWidget,
-    QListWidgetItem, QFileDialog, QMessageBox, QLabel
+    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QListView,
+    QFileDialog, QMessageBox, QLabel
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import (
+    Qt, Signal, Slot, QTimer, QObject, QRunnable, QThreadPool,
+    QAbstractListModel, QModelIndex
+)
+from PySide6.QtGui import QColor
 
 import config
 from core.patient import Patient
 
 
+class _ScanSignals(QObject):
+    """Signals emitted by a folder scan task (QRunnable cannot emit itself)."""
+
+    finished = Signal(str, list)  # folder path, Patient objects
+    failed = Signal(str, str)  # folder path, error message
+
+
+class _ScanTask(QRunnable):
+    """Runs Patient.scan_folder() on a worker thread."""
+
+    def __init__(self, folder_path: str, signals: _ScanSignals):
+        super().__init__()
+        self._folder_path = folder_path
+        self._signals = signals
+
+    def run(self):
+        try:
+            patients = Patient.scan_folder(self._folder_path)
+        except Exception as e:
+            # Report every failure; an exception escaping run() would leave
+            # the list showing "Scanning..." forever
+            self._signals.failed.emit(self._folder_path, str(e))
+        else:
+            self._signals.finished.emit(self._folder_path, patients)
+
+
+class PatientListModel(QAbstractListModel):
+    """List model over patients, sorted by patient id.
+
+    Rows are read straight from the Patient objects, so a changed patient
+    only needs a dataChanged notification for its row.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.patients: Dict[str, Patient] = {}
+        # Patient ids in row order, kept sorted as patients are added
+        self.sorted_ids: List[str] = []
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.sorted_ids)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        patient = self.patients[self.sorted_ids[index.row()]]
+        if role == Qt.DisplayRole:
+            return patient.get_display_name()
+        if role == Qt.ForegroundRole:
+            # Highlight modified patients
+            return QColor(Qt.red) if patient.has_unsaved_changes else None
+        if role == Qt.UserRole:
+            return patient.patient_id
+        return None
+
+    def add_patient(self, patient: Patient) -> bool:
+        """Insert a patient at its sorted row.
+
+        Returns:
+            False if a patient with the same id is already listed
+        """
+        patient_id = patient.patient_id
+        if patient_id in self.patients:
+            return False
+        row = bisect.bisect_left(self.sorted_ids, patient_id)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.patients[patient_id] = patient
+        self.sorted_ids.insert(row, patient_id)
+        self.endInsertRows()
+        return True
+
+    def index_of(self, patient_id: str) -> QModelIndex:
+        """Get the model index of a patient's row (invalid if not listed)."""
+        if patient_id not in self.patients:
+            return QModelIndex()
+        return self.index(bisect.bisect_left(self.sorted_ids, patient_id))
+
+    def refresh_patient(self, patient_id: str):
+        """Notify views that a patient's name or highlight may have changed."""
+        index = self.index_of(patient_id)
+        if index.isValid():
+            self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.ForegroundRole])
+
+    def clear(self):
+        """Remove all patients."""
+        self.beginResetModel()
+        self.patients.clear()
+        self.sorted_ids.clear()
+        self.endResetModel()
+
+
 class PatientListWidget(QWidget):
     """Widget for displaying and selecting patients.
 
@@ -26,7 +121,27 @@ class PatientListWidget(QWidget):
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        self._patients: Dict[str, Patient] = {}
+        self._model = PatientListModel(self)
+        self._patients = self._model.patients
+        self._sorted_ids = self._model.sorted_ids
+        # Patients with unsaved changes, updated as their rows are refreshed
+        self._modified_ids: Set[str] = set()
+
+        # Rows waiting for a coalesced refresh_patient/refresh_display update
+        self._dirty_ids: Set[str] = set()
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(config.PATIENT_LIST_REFRESH_MS)
+        self._refresh_timer.timeout.connect(self._flush_refresh)
+
+        # Folders are listed on a worker thread so slow (e.g. network)
+        # directories don't block the UI
+        self._scan_pool = QThreadPool(self)
+        self._scan_pool.setMaxThreadCount(1)
+        self._scan_signals = _ScanSignals(self)
+        self._scan_signals.finished.connect(self._on_scan_finished)
+        self._scan_signals.failed.connect(self._on_scan_failed)
+
         self._setup_ui()
 
     def _setup_ui(self):
@@ -45,18 +160,23 @@ class PatientListWidget(QWidget):
         button_layout.addWidget(self.load_button)
 
         # Patient list
-        self.list_widget = QListWidget()
-        self.list_widget.setSelectionMode(QListWidget.SingleSelection)
-        self.list_widget.itemClicked.connect(self._on_item_clicked)
+        self.list_view = QListView()
+        self.list_view.setModel(self._model)
+        self.list_view.setSelectionMode(QListView.SingleSelection)
+        self.list_view.setEditTriggers(QListView.NoEditTriggers)
+        # All rows are one line of text; skip measuring each one
+        self.list_view.setUniformItemSizes(True)
+        self.list_view.clicked.connect(self._on_item_clicked)
 
         # Status label
         self.status_label = QLabel("No patients loaded")
 
         layout.addWidget(header_label)
         layout.addLayout(button_layout)
-        layout.addWidget(self.list_widget)
+        layout.addWidget(self.list_view)
         layout.addWidget(self.status_label)
 
+    @Slot()
     def _on_load_folder(self):
         """Handle load folder button click."""
         folder = QFileDialog.getExistingDirectory(
@@ -72,18 +192,17 @@ class PatientListWidget(QWidget):
         """Load NIfTI files from folder.
 
         Finds image files matching the pattern and creates Patient objects.
+        The folder is scanned in the background; folder_loaded is emitted
+        once the new patients are listed.
         """
-        folder = Path(folder_path)
-
-        # Find image files (exclude label files)
-        image_files = []
-        for pattern in [config.NIFTI_PATTERN]:
-            for f in folder.glob(pattern):
-                # Skip label files
-                if not f.name.endswith(config.LABEL_SUFFIX):
-                    image_files.append(f)
+        self.status_label.setText(f"Scanning {folder_path}...")
+        self._scan_pool.start(_ScanTask(folder_path, self._scan_signals))
 
-        if not image_files:
+    @Slot(str, list)
+    def _on_scan_finished(self, folder_path: str, patients: List[Patient]):
+        """Add the patients found by a folder scan."""
+        if not patients:
+            self.status_label.setText(f"{len(self._patients)} patient(s) loaded")
             QMessageBox.warning(
                 self,
                 "No Files Found",
@@ -91,80 +210,114 @@ class PatientListWidget(QWidget):
             )
             return
 
-        # Create patient objects
-        new_patients = []
-        for image_path in sorted(image_files):
-            patient = Patient.from_image_path(str(image_path))
-            if patient.patient_id not in self._patients:
-                new_patients.append(patient)
-                self._patients[patient.patient_id] = patient
-
-        self._update_list()
+        new_patients = [p for p in patients if self._model.add_patient(p)]
         self.folder_loaded.emit(new_patients)
 
         self.status_label.setText(f"{len(self._patients)} patient(s) loaded")
 
+    @Slot(str, str)
+    def _on_scan_failed(self, folder_path: str, message: str):
+        """Report a folder that could not be listed."""
+        self.status_label.setText(f"{len(self._patients)} patient(s) loaded")
+        QMessageBox.warning(self, "Folder Not Readable", f"Could not read {folder_path}: {message}")
+
     def add_patient(self, patient: Patient):
         """Add a single patient to the list."""
-        if patient.patient_id not in self._patients:
-            self._patients[patient.patient_id] = patient
-            self._update_list()
+        if self._model.add_patient(patient):
+            self.refresh_patient(patient.patient_id)
             self.status_label.setText(f"{len(self._patients)} patient(s) loaded")
 
-    def _update_list(self):
-        """Update the list widget display."""
-        # Remember current selection
-        current_item = self.list_widget.currentItem()
-        current_id = current_item.data(Qt.UserRole) if current_item else None
+    def refresh_display(self):
+        """Refresh the list display (update modification indicators).
 
-        self.list_widget.clear()
+        Marks every row for the next coalesced refresh, so bursts of calls
+        update each row once with the latest state.
+        """
+        self._dirty_ids.update(self._sorted_ids)
+        if not self._refresh_timer.isActive():
+            self._refresh_timer.start()
 
-        for patient_id, patient in sorted(self._patients.items()):
-            item = QListWidgetItem(patient.get_display_name())
-            item.setData(Qt.UserRole, patient_id)
+    def refresh_patient(self, patient_id: str):
+        """Refresh the modification indicator of a single patient's row.
 
-            # Highlight modified patients
+        Calls arriving within PATIENT_LIST_REFRESH_MS are applied together.
+        """
+        self._dirty_ids.add(patient_id)
+        if not self._refresh_timer.isActive():
+            self._refresh_timer.start()
+
+    @Slot()
+    def _flush_refresh(self):
+        """Apply pending refresh_patient updates."""
+        self._refresh_timer.stop()
+        for patient_id in self._dirty_ids:
+            patient = self._patients.get(patient_id)
+            if patient is None:
+                continue
             if patient.has_unsaved_changes:
-                item.setForeground(Qt.red)
-
-            self.list_widget.addItem(item)
-
-            # Restore selection
-            if patient_id == current_id:
-                item.setSelected(True)
-                self.list_widget.setCurrentItem(item)
-
-    def refresh_display(self):
-        """Refresh the list display (update modification indicators)."""
-        self._update_list()
-
-    def _on_item_clicked(self, item: QListWidgetItem):
+                self._modified_ids.add(patient_id)
+            else:
+                self._modified_ids.discard(patient_id)
+            self._model.refresh_patient(patient_id)
+        self._dirty_ids.clear()
+
+    @Slot(QModelIndex)
+    def _on_item_clicked(self, index: QModelIndex):
         """Handle patient selection."""
-        patient_id = item.data(Qt.UserRole)
+        patient_id = index.data(Qt.UserRole)
         self.patient_selected.emit(patient_id)
 
     def get_patient(self, patient_id: str) -> Optional[Patient]:
         """Get patient by ID."""
         return self._patients.get(patient_id)
 
+    def get_next_patient(self, patient_id: str) -> Optional[Patient]:
+        """Get the patient listed after the given one, if any."""
+        if patient_id not in self._patients:
+            return None
+        idx = bisect.bisect_left(self._sorted_ids, patient_id)
+        if idx + 1 < len(self._sorted_ids):
+            return self._patients[self._sorted_ids[idx + 1]]
+        return None
+
+    def get_previous_patient(self, patient_id: str) -> Optional[Patient]:
+        """Get the patient listed before the given one, if any."""
+        if patient_id not in self._patients:
+            return None
+        idx = bisect.bisect_left(self._sorted_ids, patient_id)
+        if idx > 0:
+            return self._patients[self._sorted_ids[idx - 1]]
+        return None
+
     def get_all_patients(self) -> Dict[str, Patient]:
         """Get all patients."""
         return self._patients
 
+    def has_modified_patients(self) -> bool:
+        """Check if any patient has unsaved changes."""
+        if self._dirty_ids:
+            self._flush_refresh()
+        return bool(self._modified_ids)
+
     def get_modified_patients(self) -> List[Patient]:
-        """Get list of patients with unsaved changes."""
-        return [p for p in self._patients.values() if p.has_unsaved_changes]
+        """Get list of patients with unsaved changes.
+
+        Relies on edits being reported through refresh_patient; rows still
+        waiting for the coalesced refresh are applied first.
+        """
+        if self._dirty_ids:
+            self._flush_refresh()
+        return [self._patients[pid] for pid in sorted(self._modified_ids)]
 
     def select_patient(self, patient_id: str):
         """Programmatically select a patient."""
-        for i in range(self.list_widget.count()):
-            item = self.list_widget.item(i)
-            if item.data(Qt.UserRole) == patient_id:
-                self.list_widget.setCurrentItem(item)
-                break
+        index = self._model.index_of(patient_id)
+        if index.isValid():
+            self.list_view.setCurrentIndex(index)
 
     def clear(self):
         """Clear all patients."""
-        self._patients.clear()
-        self.list_widget.clear()
+        self._model.clear()
+        self._dirty_ids.clear()
+        self._modified_ids.clear()
         self.status_label.setText("No patients loaded")
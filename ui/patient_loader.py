@@ -0,0 +1,127 @@
+"""Background loading of patient volumes."""
+
+from typing import Callable, Set
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+from core.patient import Patient
+
+
+class _LoadSignals(QObject):
+    """Signals emitted by a load task (QRunnable cannot emit itself)."""
+
+    finished = Signal(object)  # Patient
+    failed = Signal(object, str)  # Patient, error message
+    cancelled = Signal(object)  # Patient
+
+
+class _LoadTask(QRunnable):
+    """Runs Patient.load() on a worker thread, unless no longer needed."""
+
+    def __init__(self, patient: Patient, signals: _LoadSignals,
+                 still_needed: Callable[[Patient], bool]):
+        super().__init__()
+        self._patient = patient
+        self._signals = signals
+        self._still_needed = still_needed
+
+    def run(self):
+        if not self._still_needed(self._patient):
+            self._signals.cancelled.emit(self._patient)
+            return
+        try:
+            self._patient.load()
+        except Exception as e:
+            self._signals.failed.emit(self._patient, str(e))
+        else:
+            self._signals.finished.emit(self._patient)
+
+
+class PatientLoader(QObject):
+    """Loads patients on a thread pool so volume I/O doesn't block the UI.
+
+    Each patient is loaded by at most one task at a time. Requesting a
+    patient that is already being prefetched simply waits for that task.
+    A request also drops earlier prefetches that have not started yet, so
+    jumping through the list doesn't queue loads of patients left behind.
+
+    Signals:
+        loaded(Patient): A requested (non-prefetch) patient is ready
+        prefetched(Patient): A prefetched patient finished loading
+        failed(Patient, str): Loading a requested patient raised an error
+    """
+
+    loaded = Signal(object)
+    prefetched = Signal(object)
+    failed = Signal(object, str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(2)
+        self._signals = _LoadSignals(self)
+        self._signals.finished.connect(self._on_finished)
+        self._signals.failed.connect(self._on_failed)
+        self._signals.cancelled.connect(self._on_cancelled)
+
+        # Patients with a running task, those whose result was asked for,
+        # and those prefetched since the last request
+        self._in_flight: Set[int] = set()
+        self._wanted: Set[int] = set()
+        self._prefetching: Set[int] = set()
+
+    def request(self, patient: Patient):
+        """Load a patient and emit `loaded` when it is ready.
+
+        Emits immediately if the patient is already loaded. Prefetches
+        queued before this call are cancelled unless prefetched again.
+        """
+        self._prefetching.clear()
+        if patient.is_loaded and id(patient) not in self._in_flight:
+            self.loaded.emit(patient)
+            return
+        self._wanted.add(id(patient))
+        self._start(patient, priority=1)
+
+    def prefetch(self, patient: Patient):
+        """Load a patient in the background without announcing it."""
+        if patient.is_loaded:
+            return
+        self._prefetching.add(id(patient))
+        self._start(patient, priority=0)
+
+    def is_busy(self, patient: Patient) -> bool:
+        """Check if a load task for the patient is still running."""
+        return id(patient) in self._in_flight
+
+    def _start(self, patient: Patient, priority: int):
+        if id(patient) in self._in_flight:
+            return
+        self._in_flight.add(id(patient))
+        self._pool.start(_LoadTask(patient, self._signals, self._still_needed), priority)
+
+    def _still_needed(self, patient: Patient) -> bool:
+        # Called from worker threads
+        key = id(patient)
+        return key in self._wanted or key in self._prefetching
+
+    def _on_finished(self, patient: Patient):
+        self._in_flight.discard(id(patient))
+        self._prefetching.discard(id(patient))
+        if id(patient) in self._wanted:
+            self._wanted.discard(id(patient))
+            self.loaded.emit(patient)
+        else:
+            self.prefetched.emit(patient)
+
+    def _on_failed(self, patient: Patient, message: str):
+        self._in_flight.discard(id(patient))
+        if id(patient) in self._wanted:
+            self._wanted.discard(id(patient))
+            self.failed.emit(patient, message)
+
+    def _on_cancelled(self, patient: Patient):
+        self._in_flight.discard(id(patient))
+        # Asked for again after the task decided to skip
+        if self._still_needed(patient) and not patient.is_loaded:
+            self._start(patient, priority=1 if id(patient) in self._wanted else 0)
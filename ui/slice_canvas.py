@@ -0,0 +1,124 @@
+"""Lightweight widget that paints a grayscale slice and overlay directly."""
+
+from typing import Callable, Optional
+
+import numpy as np
+
+from PySide6.QtWidgets import QWidget, QSizePolicy
+from PySide6.QtGui import QImage, QPainter, QColor, QTransform
+from PySide6.QtCore import QPointF
+
+
+class FastSliceCanvas(QWidget):
+    """Paints a cached QImage plus vector overlay in a single paintEvent.
+
+    Replaces a QGraphicsView/QGraphicsScene stack for views that only show
+    one image and a handful of overlay primitives. The image is fitted to
+    the widget (keeping aspect ratio), with zoom and pan kept as a simple
+    affine on top of the fit.
+
+    The overlay callback is called with the painter already transformed to
+    image pixel coordinates.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self.setMouseTracking(True)
+        self._background = QColor(30, 30, 30)
+
+        # Image and the array backing its pixels (QImage doesn't own them)
+        self._image: Optional[QImage] = None
+        self._image_data: Optional[np.ndarray] = None
+
+        self.overlay_painter: Optional[Callable[[QPainter], None]] = None
+        self._smooth = True
+
+        # View state: zoom and pan on top of the fit transform
+        self._zoom = 1.0
+        self._pan = QPointF(0.0, 0.0)
+        self._transform = QTransform()
+        self._inverse = QTransform()
+
+    def set_image(self, data: Optional[np.ndarray]):
+        """Set the displayed image from a 2D uint8 array (None to clear)."""
+        old_size = self._image.size() if self._image is not None else None
+        if data is None:
+            self._image = None
+            self._image_data = None
+        else:
+            data = np.ascontiguousarray(data)
+            h, w = data.shape
+            self._image = QImage(data.data, w, h, w, QImage.Format_Grayscale8)
+            self._image_data = data
+        if self._image is not None and self._image.size() != old_size:
+            self._update_transform()
+        self.update()
+
+    def has_image(self) -> bool:
+        """Check if an image is set."""
+        return self._image is not None
+
+    def set_smooth(self, smooth: bool):
+        """Toggle antialiasing and smooth image scaling."""
+        if smooth != self._smooth:
+            self._smooth = smooth
+            self.update()
+
+    def fit(self):
+        """Reset zoom and pan so the whole image fits the widget."""
+        self._zoom = 1.0
+        self._pan = QPointF(0.0, 0.0)
+        self._update_transform()
+        self.update()
+
+    def zoom(self, factor: float, anchor: QPointF):
+        """Zoom by factor, keeping the image point under anchor in place."""
+        image_pos = self.map_to_image(anchor)
+        self._zoom *= factor
+        self._update_transform()
+        moved = self._transform.map(image_pos)
+        self._pan += anchor - moved
+        self._update_transform()
+        self.update()
+
+    def pan(self, dx: float, dy: float):
+        """Shift the image by (dx, dy) widget pixels."""
+        self._pan += QPointF(dx, dy)
+        self._update_transform()
+        self.update()
+
+    def map_to_image(self, pos) -> QPointF:
+        """Map a widget position to image pixel coordinates."""
+        return self._inverse.map(QPointF(pos))
+
+    def _update_transform(self):
+        """Recompute the image-to-widget transform."""
+        if self._image is None or self._image.width() == 0 or self._image.height() == 0:
+            self._transform = QTransform()
+            self._inverse = QTransform()
+            return
+        iw, ih = self._image.width(), self._image.height()
+        scale = min(self.width() / iw, self.height() / ih) * self._zoom
+        dx = (self.width() - iw * scale) / 2 + self._pan.x()
+        dy = (self.height() - ih * scale) / 2 + self._pan.y()
+        self._transform = QTransform(scale, 0, 0, scale, dx, dy)
+        self._inverse, _ = self._transform.inverted()
+
+    def resizeEvent(self, event):
+        """Recompute the fit on resize."""
+        super().resizeEvent(event)
+        self._update_transform()
+
+    def paintEvent(self, event):
+        """Blit the image and draw the overlay."""
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), self._background)
+        if self._image is not None:
+            painter.setRenderHint(QPainter.SmoothPixmapTransform, self._smooth)
+            painter.setRenderHint(QPainter.Antialiasing, self._smooth)
+            painter.setTransform(self._transform)
+            painter.drawImage(QPointF(0, 0), self._image)
+            if self.overlay_painter is not None:
+                self.overlay_painter(painter)
+        painter.end()
@@ -1,18 +1,26 @@
 """Single plane slice viewer with annotation overlay."""
 
-from typing import Optional, List, Tuple, TYPE_CHECKING
+import logging
+from collections import OrderedDict
+from functools import lru_cache
+from typing import FrozenSet, Optional, List, Tuple, TYPE_CHECKING
 import numpy as np
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGraphicsView, QGraphicsScene,
     QGraphicsPixmapItem, QSlider, QLabel, QGraphicsEllipseItem,
-    QGraphicsPathItem, QSizePolicy
+    QGraphicsPathItem, QGraphicsLineItem, QGraphicsItem, QSizePolicy,
+    QStyleOptionGraphicsItem
 )
 from PySide6.QtGui import (
-    QImage, QPixmap, QPainter, QColor, QPen, QBrush,
-    QPainterPath, QWheelEvent, QMouseEvent
+    QImage, QPixmap, QPainter, QColor, QPen, QBrush, QFont, QFontMetrics,
+    QPainterPath, QPolygonF, QWheelEvent, QMouseEvent, QTransform, QPixmapCache,
+    QOpenGLContext
 )
-from PySide6.QtCore import Qt, Signal, QPointF, QRectF
+from PySide6.QtCore import Qt, Signal, QPoint, QPointF, QRectF, QTimer
+from PySide6.QtOpenGLWidgets import QOpenGLWidget
+
+from core.windowing import apply_window
 
 if TYPE_CHECKING:
     from core.volume import VolumeData
@@ -21,6 +29,122 @@ if TYPE_CHECKING:
 import config
 
 
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=1)
+def _opengl_available() -> bool:
+    """Check whether an OpenGL context can be created on this platform."""
+    return QOpenGLContext().create()
+
+
+@lru_cache(maxsize=64)
+def _edited_reference_values(label_ids: Tuple[int, ...]) -> FrozenSet[int]:
+    """Reference mask values replaced by the user's masks for these labels."""
+    return frozenset(config.LABEL_TO_REFERENCE_VALUE.get(label_id, label_id)
+                     for label_id in label_ids)
+
+
+@lru_cache(maxsize=64)
+def _mask_argb(color: Tuple[int, int, int], alpha: int) -> np.uint32:
+    """Overlay pixel value for a mask color, written with one masked assignment.
+
+    Overlays are built as uint32 premultiplied ARGB pixels, the format Qt
+    paints fastest; as whole 32-bit values they don't depend on byte order.
+    """
+    r, g, b = ((c * alpha + 127) // 255 for c in color)
+    return np.uint32((alpha << 24) | (r << 16) | (g << 8) | b)
+
+
+@lru_cache(maxsize=64)
+def _reference_palette(alpha: int, skipped_values: FrozenSet[int]) -> np.ndarray:
+    """Lookup table from reference mask value to overlay pixel.
+
+    Values without a color (including skipped ones) map to transparent;
+    the last entry is transparent too, so out-of-range values can be
+    clipped onto it.
+    """
+    palette = np.zeros(max(config.REFERENCE_MASK_COLORS) + 2, dtype=np.uint32)
+    for ref_value, color in config.REFERENCE_MASK_COLORS.items():
+        if ref_value not in skipped_values:
+            palette[ref_value] = _mask_argb(tuple(color), alpha)
+    palette.flags.writeable = False
+    return palette
+
+
+@lru_cache(maxsize=64)
+def _annotation_pen_brush(color: Tuple[int, int, int], width: int) -> Tuple[QPen, QBrush]:
+    """Pen and brush for drawing an annotation of the given color."""
+    qcolor = QColor(*color)
+    return QPen(qcolor, width), QBrush(qcolor)
+
+
+def _keypoint_glyph(color: Tuple[int, int, int], radius: int, label: str) -> QPixmap:
+    """Keypoint marker and label, rendered once and kept in QPixmapCache.
+
+    The keypoint is at the center of the pixmap, with the label to the
+    right of the marker, so it is drawn at the keypoint position minus
+    half the pixmap size.
+    """
+    key = f"kp-{color}-{radius}-{label}"
+    glyph = QPixmapCache.find(key)
+    if glyph is None:
+        # Room for the marker outline, plus the label on its right
+        half_w = half_h = radius + 2
+        if label:
+            metrics = QFontMetrics(QFont())
+            half_w += metrics.horizontalAdvance(label) + 2
+            half_h = max(half_h, metrics.height())
+
+        glyph = QPixmap(2 * half_w, 2 * half_h)
+        glyph.fill(Qt.transparent)
+        painter = QPainter(glyph)
+        painter.setRenderHint(QPainter.Antialiasing)
+        pen, brush = _annotation_pen_brush(color, 2)
+        painter.setPen(pen)
+        painter.setBrush(brush)
+        painter.drawEllipse(QPointF(half_w, half_h), radius, radius)
+        if label:
+            painter.setPen(_annotation_pen_brush((255, 255, 255), 1)[0])
+            painter.drawText(half_w + radius + 2, half_h, label)
+        painter.end()
+        QPixmapCache.insert(key, glyph)
+    return glyph
+
+
+class _ImageItem(QGraphicsItem):
+    """Graphics item that paints a QImage as is.
+
+    Unlike QGraphicsPixmapItem, setting a new image needs no QPixmap
+    conversion. The image may wrap a numpy array, which is kept alive
+    alongside it.
+    """
+
+    def __init__(self, parent: Optional[QGraphicsItem] = None):
+        super().__init__(parent)
+        self._image = QImage()
+        self._image_data: Optional[np.ndarray] = None
+
+    def image(self) -> QImage:
+        """Get the displayed image."""
+        return self._image
+
+    def set_image(self, image: QImage, data: Optional[np.ndarray] = None):
+        """Display an image, optionally with the array backing its pixels."""
+        if image.size() != self._image.size():
+            self.prepareGeometryChange()
+        self._image = image
+        self._image_data = data
+        self.update()
+
+    def boundingRect(self) -> QRectF:
+        return QRectF(0, 0, self._image.width(), self._image.height())
+
+    def paint(self, painter: QPainter, option: QStyleOptionGraphicsItem, widget=None):
+        if not self._image.isNull():
+            painter.drawImage(0, 0, self._image)
+
+
 class SliceView(QWidget):
     """Single plane viewer with slice slider and annotation overlay.
 
@@ -55,28 +179,53 @@ class SliceView(QWidget):
         self._reference_mask: Optional["VolumeData"] = None
         self._annotations: Optional["Annotations"] = None
 
+        # (volume id, slice, center, width) of the image currently
+        # shown; annotation edits redraw the overlays but reuse the image
+        self._image_key: Optional[Tuple[int, int, float, float]] = None
+        # Windowed slice buffer, reused while the slice shape stays the same
+        self._display_buf: Optional[np.ndarray] = None
+        # Size of the displayed image, for hit-testing clicks
+        self._image_bounds: Optional[QRectF] = None
+
         # Overlay settings
         self.mask_opacity = config.DEFAULT_MASK_OPACITY
         self.show_reference_mask = True
         self.show_annotations = True
 
-        # Brush preview
-        self._brush_preview_points: List[Tuple[int, int]] = []
-        self._brush_preview_size = config.DEFAULT_BRUSH_SIZE
+        # Composited mask overlays of recently shown slices, keyed by slice
+        # and overlay settings; cleared when the volume or masks are replaced,
+        # as (image, backing array)
+        self._overlay_cache: "OrderedDict[tuple, Tuple[QImage, np.ndarray]]" = OrderedDict()
 
         # Panning state
         self._is_panning = False
         self._pan_start = None
+        # True while a slider drag or pan is in progress
+        self._interactive = False
+
+        # Slider ticks are coalesced: current_slice follows the slider at
+        # once, but the slice is drawn when the timer fires, skipping the
+        # slices passed over in between
+        self._slice_timer = QTimer(self)
+        self._slice_timer.setSingleShot(True)
+        self._slice_timer.setInterval(config.SLIDER_COALESCE_MS)
+        self._slice_timer.timeout.connect(self._apply_slice_change)
+
+        # Mouse moves are coalesced: the latest one is emitted once the
+        # event loop is idle, dropping moves that arrived in between
+        self._pending_move: Optional[QMouseEvent] = None
+        self._last_move_key: Optional[Tuple[QPoint, int]] = None
+        self._move_timer = QTimer(self)
+        self._move_timer.setSingleShot(True)
+        self._move_timer.setInterval(0)
+        self._move_timer.timeout.connect(self._flush_mouse_move)
 
         # Segment preview
         self._segment_preview_path: Optional[QPainterPath] = None
-        self._segment_preview_is_erasing = False
-        self._segment_preview_color: Tuple[int, int, int] = (0, 255, 0)  # Default green
-
-        # Line segment preview
-        self._lineseg_preview_start: Optional[Tuple[float, float]] = None
-        self._lineseg_preview_end: Optional[Tuple[float, float]] = None
-        self._lineseg_preview_color: Tuple[int, int, int] = (255, 0, 0)
+        self._segment_preview_color = QColor(0, 255, 0, 200)  # Default green
+        # Outline pen and fill brush, set up once per set_segment_preview()
+        self._segment_preview_pen = QPen()
+        self._segment_preview_brush = QBrush()
 
         # Aspect ratio for coordinate conversion (set when displaying image)
         self._aspect_ratio: float = 1.0
@@ -98,7 +247,8 @@ class SliceView(QWidget):
         # Graphics view for image display
         self.scene = QGraphicsScene()
         self.view = QGraphicsView(self.scene)
-        self.view.setRenderHint(QPainter.Antialiasing)
+        # Only pixmaps are drawn at the view level, so antialiasing is left
+        # off; smoothing is toggled by _update_smooth_hint()
         self.view.setRenderHint(QPainter.SmoothPixmapTransform)
         self.view.setDragMode(QGraphicsView.NoDrag)
         self.view.setTransformationAnchor(QGraphicsView.AnchorUnderMouse)
@@ -107,15 +257,18 @@ class SliceView(QWidget):
         self.view.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         self.view.setBackgroundBrush(QBrush(QColor(30, 30, 30)))
         self.view.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        # Without a usable OpenGL context the default raster viewport is kept
+        if config.SLICE_VIEW_OPENGL and _opengl_available():
+            self.view.setViewport(QOpenGLWidget())
 
         # Install event filter for mouse events
         self.view.viewport().installEventFilter(self)
 
         # Image and overlay items
-        self.image_item = QGraphicsPixmapItem()
+        self.image_item = _ImageItem()
         self.scene.addItem(self.image_item)
 
-        self.mask_overlay_item = QGraphicsPixmapItem()
+        self.mask_overlay_item = _ImageItem()
         self.mask_overlay_item.setZValue(1)
         self.scene.addItem(self.mask_overlay_item)
 
@@ -123,11 +276,36 @@ class SliceView(QWidget):
         self.annotation_overlay_item.setZValue(2)
         self.scene.addItem(self.annotation_overlay_item)
 
+        # Keep the scaled images between paints so panning and preview
+        # repaints don't resample them; setting an image invalidates the cache
+        for item in (self.image_item, self.mask_overlay_item,
+                     self.annotation_overlay_item):
+            item.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+
+        # Interactive previews are separate items updated in place, so mouse
+        # moves don't repaint the annotation overlay
+        self._brush_preview_item = QGraphicsPathItem()
+        self._brush_preview_item.setZValue(3)
+        self._brush_preview_item.hide()
+        self.scene.addItem(self._brush_preview_item)
+
+        self._lineseg_preview_item = QGraphicsLineItem()
+        self._lineseg_preview_item.setZValue(3)
+        self._lineseg_preview_item.hide()
+        self.scene.addItem(self._lineseg_preview_item)
+
+        self._lineseg_preview_marker = QGraphicsEllipseItem(-4, -4, 8, 8)
+        self._lineseg_preview_marker.setZValue(3)
+        self._lineseg_preview_marker.hide()
+        self.scene.addItem(self._lineseg_preview_marker)
+
         # Slice slider
         slider_layout = QHBoxLayout()
         self.slider = QSlider(Qt.Horizontal)
         self.slider.setMinimum(0)
         self.slider.valueChanged.connect(self._on_slider_changed)
+        self.slider.sliderPressed.connect(self._begin_interactive)
+        self.slider.sliderReleased.connect(self._end_interactive)
 
         self.slice_label = QLabel("0 / 0")
         self.slice_label.setMinimumWidth(60)
@@ -158,11 +336,16 @@ class SliceView(QWidget):
 
     def _handle_mouse_press(self, event: QMouseEvent):
         """Handle mouse press event."""
+        self._flush_mouse_move()
+        # Show the slice that the click will annotate
+        if self._slice_timer.isActive():
+            self._apply_slice_change()
         # Check for Ctrl+click panning
         if event.button() == Qt.LeftButton and event.modifiers() == Qt.ControlModifier:
             self._is_panning = True
             self._pan_start = event.pos()
             self.view.setCursor(Qt.ClosedHandCursor)
+            self._begin_interactive()
             return
 
         scene_pos = self.view.mapToScene(event.pos())
@@ -185,6 +368,23 @@ class SliceView(QWidget):
             )
             return
 
+        # Qt deletes the event after delivery, so keep a copy until the flush
+        self._pending_move = event.clone()
+        if not self._move_timer.isActive():
+            self._move_timer.start()
+
+    def _flush_mouse_move(self):
+        """Emit mouse_moved for the latest pending mouse move, if any."""
+        self._move_timer.stop()
+        event, self._pending_move = self._pending_move, None
+        if event is None:
+            return
+        # Nothing to report if the cursor is back where it was last emitted
+        key = (event.pos(), self.current_slice)
+        if key == self._last_move_key:
+            return
+        self._last_move_key = key
+
         scene_pos = self.view.mapToScene(event.pos())
         # Convert to image coordinates (account for aspect ratio scaling)
         image_pos = self._scene_to_image_coords(scene_pos)
@@ -192,9 +392,11 @@ class SliceView(QWidget):
 
     def _handle_mouse_release(self, event: QMouseEvent):
         """Handle mouse release event."""
+        self._flush_mouse_move()
         if self._is_panning and event.button() == Qt.LeftButton:
             self._is_panning = False
             self.view.setCursor(Qt.ArrowCursor)
+            self._end_interactive()
             return
 
         scene_pos = self.view.mapToScene(event.pos())
@@ -208,6 +410,7 @@ class SliceView(QWidget):
             # Zoom with Ctrl+Wheel
             factor = 1.15 if event.angleDelta().y() > 0 else 1 / 1.15
             self.view.scale(factor, factor)
+            self._update_smooth_hint()
         else:
             # Scroll slices with wheel
             delta = 1 if event.angleDelta().y() > 0 else -1
@@ -215,20 +418,42 @@ class SliceView(QWidget):
             if 0 <= new_slice <= self.max_slice:
                 self.slider.setValue(new_slice)
 
+    def _begin_interactive(self):
+        """Drop to cheap rendering while the user drags a slider or pans."""
+        self._interactive = True
+        self._update_smooth_hint()
+
+    def _end_interactive(self):
+        """Restore full-quality rendering for the final frame."""
+        self._interactive = False
+        self._update_smooth_hint()
+
+    def _update_smooth_hint(self):
+        """Smooth pixmaps only when they are shrunk and not being dragged.
+
+        At a scale of 1 or more, filtering only blurs voxel edges, so the
+        cheaper nearest-neighbour sampling is used.
+        """
+        smooth = not self._interactive and self.view.transform().m11() < 1.0
+        if bool(self.view.renderHints() & QPainter.SmoothPixmapTransform) != smooth:
+            self.view.setRenderHint(QPainter.SmoothPixmapTransform, smooth)
+
     def _is_in_image_bounds(self, scene_pos: QPointF) -> bool:
         """Check if position is within image bounds."""
-        pixmap = self.image_item.pixmap()
-        if pixmap.isNull():
-            return False
-        rect = QRectF(0, 0, pixmap.width(), pixmap.height())
-        return rect.contains(scene_pos)
+        return self._image_bounds is not None and self._image_bounds.contains(scene_pos)
 
     def _on_slider_changed(self, value: int):
         """Handle slice slider change."""
         self.current_slice = value
         self.slice_label.setText(f"{value} / {self.max_slice}")
+        if not self._slice_timer.isActive():
+            self._slice_timer.start()
+
+    def _apply_slice_change(self):
+        """Draw the current slice after slider changes."""
+        self._slice_timer.stop()
         self.update_display()
-        self.slice_changed.emit(self.plane, value)
+        self.slice_changed.emit(self.plane, self.current_slice)
 
     def set_volume(self, volume: "VolumeData", slice_index: Optional[int] = None):
         """Set volume data and update display.
@@ -238,6 +463,9 @@ class SliceView(QWidget):
             slice_index: Optional initial slice index
         """
         self._volume = volume
+        self._image_key = None
+        self._overlay_cache.clear()
+        self._update_aspect_transform()
 
         # Set slider range based on plane
         self.max_slice = volume.get_max_index(self.plane)
@@ -253,73 +481,96 @@ class SliceView(QWidget):
         self.window_center = (vmin + vmax) / 2
         self.window_width = vmax - vmin
 
-        self.update_display()
+        self._apply_slice_change()
         self.fit_view()
 
     def set_reference_mask(self, mask: Optional["VolumeData"]):
         """Set reference mask for overlay display."""
         self._reference_mask = mask
-        self.update_display()
+        self._overlay_cache.clear()
+        self._update_mask_overlay()
 
     def set_annotations(self, annotations: Optional["Annotations"]):
         """Set annotations for overlay display."""
         self._annotations = annotations
-        self.update_display()
+        self._overlay_cache.clear()
+        self._update_mask_overlay()
+        self._update_annotation_overlay()
 
     def set_window_level(self, center: float, width: float):
         """Set window/level parameters."""
         self.window_center = center
         self.window_width = width
-        self.update_display()
+        self._update_image()
 
     def set_mask_opacity(self, opacity: int):
         """Set mask overlay opacity (0-255)."""
         self.mask_opacity = opacity
-        self.update_display()
+        self._update_mask_overlay()
+
+    def refresh_annotations(self):
+        """Redraw only the annotation overlay, keeping the image and mask."""
+        self._update_annotation_overlay()
 
     def update_display(self):
-        """Update the displayed image and overlays."""
+        """Update the displayed image and overlays.
+
+        Setters that only affect one layer update just that layer.
+        """
         if self._volume is None:
             return
 
-        # Get and display slice
-        slice_data = self._volume.get_slice(self.plane, self.current_slice)
-        self._display_image(slice_data)
-
-        # Update mask overlay
+        self._update_image()
         self._update_mask_overlay()
-
-        # Update annotation overlay
         self._update_annotation_overlay()
 
+    def _update_image(self):
+        """Display the windowed slice, unless the shown image is still current."""
+        if self._volume is None:
+            return
+        image_key = (id(self._volume), self.current_slice,
+                     self.window_center, self.window_width)
+        if image_key != self._image_key:
+            slice_data = self._volume.get_slice(self.plane, self.current_slice)
+            self._display_image(slice_data)
+            self._image_key = image_key
+
     def _display_image(self, slice_data: np.ndarray):
         """Display slice with window/level applied."""
         # Apply windowing
         vmin = self.window_center - self.window_width / 2
         vmax = self.window_center + self.window_width / 2
 
-        display = np.clip(slice_data.astype(np.float32), vmin, vmax)
-        display = ((display - vmin) / (vmax - vmin + 1e-8) * 255).astype(np.uint8)
+        h, w = slice_data.shape
+        if self._display_buf is None or self._display_buf.shape != (h, w):
+            self._display_buf = np.empty((h, w), dtype=np.uint8)
+        apply_window(slice_data, vmin, vmax, out=self._display_buf)
 
-        # Convert to QImage
-        h, w = display.shape
-        # Ensure contiguous array for QImage
-        display = np.ascontiguousarray(display)
-        qimage = QImage(display.data, w, h, w, QImage.Format_Grayscale8)
+        # The item paints the buffer directly. A new wrapper is made for each
+        # slice, since painters cache images by cacheKey and would not see
+        # the buffer change under an old one
+        qimage = QImage(self._display_buf.data, w, h, w, QImage.Format_Grayscale8)
+        self.image_item.set_image(qimage, self._display_buf)
+        self._image_bounds = QRectF(0, 0, w, h)
 
-        pixmap = QPixmap.fromImage(qimage.copy())
+    def _update_aspect_transform(self):
+        """Stretch the image and overlay items for non-square voxels.
 
-        # Apply aspect ratio scaling to account for non-square voxels
+        The stretch is an item transform, so pixmaps stay at slice
+        resolution and are never rescaled on update.
+        """
         self._aspect_ratio = 1.0
         if self._volume is not None:
             aspect = self._volume.get_slice_aspect_ratio(self.plane)
             if abs(aspect - 1.0) > 0.01:  # Non-square pixels
                 self._aspect_ratio = aspect
-                new_width = int(pixmap.width() * aspect)
-                pixmap = pixmap.scaled(new_width, pixmap.height(),
-                                       Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
-
-        self.image_item.setPixmap(pixmap)
+        transform = QTransform.fromScale(self._aspect_ratio, 1.0)
+        for item in (self.image_item, self.mask_overlay_item, self.annotation_overlay_item,
+                     self._brush_preview_item, self._lineseg_preview_item):
+            item.setTransform(transform)
+        # The marker is positioned via setPos, so its transform is only the
+        # stretch of its own shape
+        self._lineseg_preview_marker.setTransform(transform)
 
     def _scene_to_image_coords(self, scene_pos: QPointF) -> QPointF:
         """Convert scene coordinates to original image coordinates.
@@ -331,86 +582,89 @@ class SliceView(QWidget):
             return QPointF(scene_pos.x() / self._aspect_ratio, scene_pos.y())
         return scene_pos
 
-    def _update_mask_overlay(self, debug=False):
+    def _update_mask_overlay(self):
         """Update the mask overlay (reference mask + user annotations)."""
         if self._volume is None:
-            self.mask_overlay_item.setPixmap(QPixmap())
+            self.mask_overlay_item.set_image(QImage())
+            return
+
+        key = (self.current_slice, self.mask_opacity, self.show_reference_mask,
+               self.show_annotations,
+               self._annotations.mask_version if self._annotations is not None else None)
+        cached = self._overlay_cache.get(key)
+        if cached is not None:
+            self._overlay_cache.move_to_end(key)
+            self.mask_overlay_item.set_image(*cached)
             return
 
         slice_shape = self._volume.get_slice_shape(self.plane)
         h, w = slice_shape
 
-        # Create RGBA overlay
-        overlay = np.zeros((h, w, 4), dtype=np.uint8)
-
-        # Get set of reference mask values that have user annotations (these override reference mask)
-        # We need to convert UI label IDs to reference mask values
-        user_edited_ref_values = set()
+        # Reference mask values that have user annotations (these override
+        # the reference mask); UI label IDs map to reference mask values
+        user_edited_ref_values: FrozenSet[int] = frozenset()
         if self._annotations is not None:
-            for label_id in self._annotations.masks.keys():
-                ref_value = config.LABEL_TO_REFERENCE_VALUE.get(label_id, label_id)
-                user_edited_ref_values.add(ref_value)
-
-        # DEBUG
-        if debug or (self._annotations is not None and len(self._annotations.masks) > 0):
-            print(f"\n=== DEBUG _update_mask_overlay ({self.plane}, slice={self.current_slice}) ===")
-            print(f"user_edited_label_ids={set(self._annotations.masks.keys()) if self._annotations else set()}")
-            print(f"user_edited_ref_values={user_edited_ref_values}")
-
-        # Draw reference mask if available and enabled
-        # Skip labels that have user annotations (user edits take precedence)
+            user_edited_ref_values = _edited_reference_values(tuple(self._annotations.masks))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Mask overlay %s slice %d: user-edited reference values %s",
+                         self.plane, self.current_slice, sorted(user_edited_ref_values))
+
+        # Draw reference mask if available and enabled, as one palette
+        # lookup. Labels with user annotations are left out of the palette
+        # (user edits take precedence)
         if self.show_reference_mask and self._reference_mask is not None:
             ref_slice = self._reference_mask.get_slice(self.plane, self.current_slice)
-            for ref_value, color in config.REFERENCE_MASK_COLORS.items():
-                # Skip this label if user has edited it
-                if ref_value in user_edited_ref_values:
-                    if debug or len(user_edited_ref_values) > 0:
-                        print(f"  SKIPPING reference value {ref_value} (user has edited)")
-                    continue
-                mask = ref_slice == ref_value
-                if np.any(mask):
-                    overlay[mask, 0] = color[0]
-                    overlay[mask, 1] = color[1]
-                    overlay[mask, 2] = color[2]
-                    overlay[mask, 3] = self.mask_opacity
+            if not np.issubdtype(ref_slice.dtype, np.integer):
+                ref_slice = ref_slice.astype(np.intp)
+            palette = _reference_palette(self.mask_opacity, user_edited_ref_values)
+            overlay = np.take(palette, ref_slice, mode="clip")
+        else:
+            overlay = np.zeros((h, w), dtype=np.uint32)
 
         # Draw user annotation masks if available
         if self.show_annotations and self._annotations is not None:
             for label_id, mask_ann in self._annotations.masks.items():
                 mask_slice = mask_ann.get_2d_slice(self.plane, self.current_slice)
-                mask_bool = mask_slice > 0
-                num_pixels = np.sum(mask_bool)
-                print(f"  Drawing user annotation label_id={label_id}: {num_pixels} pixels on this slice")
-                if np.any(mask_bool):
-                    overlay[mask_bool, 0] = mask_ann.color[0]
-                    overlay[mask_bool, 1] = mask_ann.color[1]
-                    overlay[mask_bool, 2] = mask_ann.color[2]
-                    overlay[mask_bool, 3] = self.mask_opacity
-
-        if self._annotations is not None and len(self._annotations.masks) > 0:
-            print(f"=== END DEBUG ===\n")
-
-        # Convert to QImage
-        overlay = np.ascontiguousarray(overlay)
-        qimage = QImage(overlay.data, w, h, w * 4, QImage.Format_RGBA8888)
-        pixmap = QPixmap.fromImage(qimage.copy())
-
-        # Apply aspect ratio scaling to match image
-        if self._volume is not None:
-            aspect = self._volume.get_slice_aspect_ratio(self.plane)
-            if abs(aspect - 1.0) > 0.01:
-                new_width = int(pixmap.width() * aspect)
-                pixmap = pixmap.scaled(new_width, pixmap.height(),
-                                       Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+                # Most labels are empty on most slices; max() is the cheapest
+                # full-slice check and skips building the boolean mask
+                if not mask_slice.max():
+                    continue
+                # Masked copy in one sweep (boolean indexing would first
+                # gather the indices of the set pixels)
+                np.copyto(overlay, _mask_argb(tuple(mask_ann.color), self.mask_opacity),
+                          where=mask_slice > 0)
 
-        self.mask_overlay_item.setPixmap(pixmap)
+        # Wrap as a QImage without copying (overlay was allocated
+        # C-contiguous above); the item keeps the array alive
+        qimage = QImage(overlay.data, w, h, w * 4, QImage.Format_ARGB32_Premultiplied)
+        self.mask_overlay_item.set_image(qimage, overlay)
+
+        self._overlay_cache[key] = (qimage, overlay)
+        if len(self._overlay_cache) > config.MASK_OVERLAY_CACHE_SIZE:
+            self._overlay_cache.popitem(last=False)
 
     def _update_annotation_overlay(self):
-        """Update the annotation overlay (keypoints, brush preview)."""
+        """Update the annotation overlay (keypoints, line segments, segment preview)."""
         if self._volume is None:
             self.annotation_overlay_item.setPixmap(QPixmap())
             return
 
+        keypoints_on_slice = []
+        lineseg_on_slice = []
+        if self.show_annotations and self._annotations is not None:
+            keypoints_on_slice = self._annotations.get_keypoints_on_slice(
+                self.plane, self.current_slice
+            )
+            lineseg_on_slice = self._annotations.get_line_segments_on_slice(
+                self.plane, self.current_slice
+            )
+
+        # Nothing to draw: show no overlay rather than a blank pixmap
+        if not keypoints_on_slice and not lineseg_on_slice and self._segment_preview_path is None:
+            if not self.annotation_overlay_item.pixmap().isNull():
+                self.annotation_overlay_item.setPixmap(QPixmap())
+            return
+
         slice_shape = self._volume.get_slice_shape(self.plane)
         h, w = slice_shape
 
@@ -419,135 +673,111 @@ class SliceView(QWidget):
         pixmap.fill(Qt.transparent)
         painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.Antialiasing)
+        # Pens and brushes are shared per color, so the loops build no Qt
+        # objects besides the points
+        label_pen, _ = _annotation_pen_brush((255, 255, 255), 1)
 
-        # Draw keypoints
-        if self.show_annotations and self._annotations is not None:
-            keypoints_on_slice = self._annotations.get_keypoints_on_slice(
-                self.plane, self.current_slice
-            )
-            for idx, kp, (x2d, y2d) in keypoints_on_slice:
-                color = QColor(*kp.color)
-                painter.setPen(QPen(color, 2))
-                painter.setBrush(QBrush(color))
-                r = config.KEYPOINT_RADIUS
-                painter.drawEllipse(QPointF(x2d, y2d), r, r)
-
-                # Draw label if present
-                if kp.label:
-                    painter.setPen(QPen(Qt.white, 1))
-                    painter.drawText(int(x2d + r + 2), int(y2d), kp.label)
+        # Draw keypoints, with their labels, as pre-rendered glyphs
+        for idx, kp, (x2d, y2d) in keypoints_on_slice:
+            glyph = _keypoint_glyph(tuple(kp.color), config.KEYPOINT_RADIUS, kp.label)
+            painter.drawPixmap(QPointF(x2d - glyph.width() / 2, y2d - glyph.height() / 2), glyph)
 
         # Draw line segments
-        if self.show_annotations and self._annotations is not None:
-            lineseg_on_slice = self._annotations.get_line_segments_on_slice(
-                self.plane, self.current_slice
-            )
-            for idx, ls, ((x1, y1), (x2, y2)) in lineseg_on_slice:
-                color = QColor(*ls.color)
-                pen = QPen(color, config.LINESEG_LINE_WIDTH)
-                painter.setPen(pen)
-                painter.drawLine(QPointF(x1, y1), QPointF(x2, y2))
-
-                # Draw endpoint markers
-                painter.setBrush(QBrush(color))
-                r = 3  # Small radius for endpoints
-                painter.drawEllipse(QPointF(x1, y1), r, r)
-                painter.drawEllipse(QPointF(x2, y2), r, r)
-
-                # Draw label at midpoint if present
-                if ls.label:
-                    mid_x = (x1 + x2) / 2
-                    mid_y = (y1 + y2) / 2
-                    painter.setPen(QPen(Qt.white, 1))
-                    painter.drawText(int(mid_x + 5), int(mid_y), ls.label)
-
-        # Draw brush preview
-        if self._brush_preview_points:
-            pen = QPen(QColor(255, 255, 0, 200), self._brush_preview_size,
-                      Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin)
+        r = 3  # Small radius for endpoints
+        for idx, ls, ((x1, y1), (x2, y2)) in lineseg_on_slice:
+            pen, brush = _annotation_pen_brush(tuple(ls.color), config.LINESEG_LINE_WIDTH)
             painter.setPen(pen)
-            if len(self._brush_preview_points) > 1:
-                path = QPainterPath()
-                path.moveTo(QPointF(*self._brush_preview_points[0]))
-                for pt in self._brush_preview_points[1:]:
-                    path.lineTo(QPointF(*pt))
-                painter.drawPath(path)
-            elif len(self._brush_preview_points) == 1:
-                pt = self._brush_preview_points[0]
-                painter.drawPoint(QPointF(*pt))
+            painter.drawLine(QPointF(x1, y1), QPointF(x2, y2))
+
+            # Draw endpoint markers
+            painter.setBrush(brush)
+            painter.drawEllipse(QPointF(x1, y1), r, r)
+            painter.drawEllipse(QPointF(x2, y2), r, r)
+
+            # Draw label at midpoint if present
+            if ls.label:
+                mid_x = (x1 + x2) / 2
+                mid_y = (y1 + y2) / 2
+                painter.setPen(label_pen)
+                painter.drawText(int(mid_x + 5), int(mid_y), ls.label)
 
         # Draw segment preview
         if self._segment_preview_path is not None:
-            # Use label color for preview, but tint red if erasing
-            if self._segment_preview_is_erasing:
-                # Red tint for erasing
-                color = QColor(255, 0, 0, 200)
-            else:
-                # Use the actual label color
-                r, g, b = self._segment_preview_color
-                color = QColor(r, g, b, 200)
-            pen = QPen(color, 2, Qt.SolidLine)
-            painter.setPen(pen)
+            painter.setPen(self._segment_preview_pen)
+            painter.setBrush(Qt.NoBrush)
             painter.drawPath(self._segment_preview_path)
 
-            # Semi-transparent fill preview
-            fill_color = QColor(color)
-            fill_color.setAlpha(50)
-            painter.setBrush(QBrush(fill_color))
+            # Semi-transparent fill over the outline; filling closes the open
+            # contour implicitly, so no closed copy of the path is needed
             painter.setPen(Qt.NoPen)
-            closed_path = QPainterPath(self._segment_preview_path)
-            closed_path.closeSubpath()
-            painter.drawPath(closed_path)
-
-        # Draw line segment preview
-        if self._lineseg_preview_start is not None and self._lineseg_preview_end is not None:
-            r, g, b = self._lineseg_preview_color
-            color = QColor(r, g, b, 200)
-            pen = QPen(color, config.LINESEG_LINE_WIDTH, Qt.DashLine)
-            painter.setPen(pen)
-            x1, y1 = self._lineseg_preview_start
-            x2, y2 = self._lineseg_preview_end
-            painter.drawLine(QPointF(x1, y1), QPointF(x2, y2))
-
-            # Draw start point marker
-            painter.setBrush(QBrush(color))
-            painter.drawEllipse(QPointF(x1, y1), 4, 4)
+            painter.setBrush(self._segment_preview_brush)
+            painter.drawPath(self._segment_preview_path)
 
         painter.end()
 
-        # Apply aspect ratio scaling to match image
-        if self._volume is not None:
-            aspect = self._volume.get_slice_aspect_ratio(self.plane)
-            if abs(aspect - 1.0) > 0.01:
-                new_width = int(pixmap.width() * aspect)
-                pixmap = pixmap.scaled(new_width, pixmap.height(),
-                                       Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
-
         self.annotation_overlay_item.setPixmap(pixmap)
 
-    def set_brush_preview(self, points: List[Tuple[int, int]], size: int):
-        """Set brush stroke preview for display."""
-        self._brush_preview_points = points
-        self._brush_preview_size = size
-        self._update_annotation_overlay()
+    def set_brush_preview(self, points: np.ndarray, size: int):
+        """Set brush stroke preview for display.
+
+        Args:
+            points: (N, 2) int array of (x, y) stroke points
+            size: Brush diameter in pixels
+        """
+        color = QColor(255, 255, 0, 200)
+        path = QPainterPath()
+        if len(points) > 1:
+            path.addPolygon(QPolygonF([QPointF(x, y) for x, y in points.tolist()]))
+            self._brush_preview_item.setPen(
+                QPen(color, size, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin))
+            self._brush_preview_item.setBrush(Qt.NoBrush)
+        else:
+            # A zero-length path draws nothing, so show a single dab as a disc
+            x, y = points[0].tolist()
+            path.addEllipse(QPointF(x, y), size / 2, size / 2)
+            self._brush_preview_item.setPen(Qt.NoPen)
+            self._brush_preview_item.setBrush(color)
+        self._brush_preview_item.setPath(path)
+        self._brush_preview_item.show()
 
     def clear_brush_preview(self):
         """Clear brush stroke preview."""
-        self._brush_preview_points = []
-        self._update_annotation_overlay()
+        self._brush_preview_item.hide()
 
-    def set_segment_preview(self, path: QPainterPath, is_erasing: bool = False, color: Tuple[int, int, int] = None):
+    def set_segment_preview(self, path: QPainterPath, is_erasing: bool = False, color: Optional[QColor] = None):
         """Set segment contour preview for display.
 
         Args:
             path: The QPainterPath defining the contour
             is_erasing: If True, shows erase preview (red tint)
-            color: RGB tuple for the label color. If None, uses default green.
+            color: Outline color for the label. If None, keeps the previous
+                color (default green).
         """
         self._segment_preview_path = path
-        self._segment_preview_is_erasing = is_erasing
         if color is not None:
             self._segment_preview_color = color
+
+        # Use label color for preview, but tint red if erasing
+        if is_erasing:
+            qcolor = QColor(255, 0, 0, 200)
+        else:
+            qcolor = self._segment_preview_color
+        self._segment_preview_pen = QPen(qcolor, 2, Qt.SolidLine)
+        fill_color = QColor(qcolor)
+        fill_color.setAlpha(50)
+        self._segment_preview_brush = QBrush(fill_color)
+        self._update_annotation_overlay()
+
+    def extend_segment_preview(self, points: List[QPointF]):
+        """Append points to the current segment preview and redraw it.
+
+        Extends the path passed to set_segment_preview() in place, so each
+        update only adds the new points instead of rebuilding the contour.
+        """
+        if self._segment_preview_path is None or not points:
+            return
+        for point in points:
+            self._segment_preview_path.lineTo(point)
         self._update_annotation_overlay()
 
     def clear_segment_preview(self):
@@ -555,34 +785,53 @@ class SliceView(QWidget):
         self._segment_preview_path = None
         self._update_annotation_overlay()
 
+    def drop_stroke_previews(self):
+        """Forget brush and segment previews without redrawing.
+
+        For callers that redraw the view right afterwards anyway.
+        """
+        self._brush_preview_item.hide()
+        self._segment_preview_path = None
+
     def set_lineseg_preview(
         self,
         start: Tuple[float, float],
         end: Tuple[float, float],
-        color: Tuple[int, int, int] = (255, 0, 0)
+        color: Optional[QColor] = None
     ):
         """Set line segment preview for display.
 
         Args:
             start: (x, y) start point in scene coordinates
             end: (x, y) end point (cursor position)
-            color: RGB tuple for the label color
+            color: Line color for the label. If None, uses red.
         """
-        self._lineseg_preview_start = start
-        self._lineseg_preview_end = end
-        self._lineseg_preview_color = color
-        self._update_annotation_overlay()
+        x1, y1 = start
+        x2, y2 = end
+        self._lineseg_preview_item.setLine(x1, y1, x2, y2)
+
+        qcolor = color if color is not None else QColor(255, 0, 0, 200)
+        if self._lineseg_preview_item.pen().color() != qcolor:
+            pen = QPen(qcolor, config.LINESEG_LINE_WIDTH, Qt.DashLine)
+            self._lineseg_preview_item.setPen(pen)
+            self._lineseg_preview_marker.setPen(pen)
+            self._lineseg_preview_marker.setBrush(QBrush(qcolor))
+
+        # Start point marker
+        self._lineseg_preview_marker.setPos(x1 * self._aspect_ratio, y1)
+        self._lineseg_preview_item.show()
+        self._lineseg_preview_marker.show()
 
     def clear_lineseg_preview(self):
         """Clear line segment preview."""
-        self._lineseg_preview_start = None
-        self._lineseg_preview_end = None
-        self._update_annotation_overlay()
+        self._lineseg_preview_item.hide()
+        self._lineseg_preview_marker.hide()
 
     def fit_view(self):
         """Fit the image to the view."""
-        if not self.image_item.pixmap().isNull():
+        if not self.image_item.image().isNull():
             self.view.fitInView(self.image_item, Qt.KeepAspectRatio)
+            self._update_smooth_hint()
 
     def resizeEvent(self, event):
         """Handle resize to maintain fit."""
@@ -2,9 +2,9 @@
 
 from PySide6.QtWidgets import (
     QToolBar, QWidget, QPushButton, QButtonGroup, QHBoxLayout,
-    QLabel, QSizePolicy
+    QLabel, QSizePolicy, QAbstractButton
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, Slot
 from PySide6.QtGui import QIcon
 
 
@@ -33,15 +33,15 @@ class ToolBar(QToolBar):
         """Create the toolbar UI."""
         # File operations
         self.load_button = QPushButton("Load Folder")
-        self.load_button.clicked.connect(self.load_requested.emit)
+        self.load_button.clicked.connect(self.load_requested)
         self.addWidget(self.load_button)
 
         self.save_button = QPushButton("Save")
-        self.save_button.clicked.connect(self.save_requested.emit)
+        self.save_button.clicked.connect(self.save_requested)
         self.addWidget(self.save_button)
 
         self.save_all_button = QPushButton("Save All")
-        self.save_all_button.clicked.connect(self.save_all_requested.emit)
+        self.save_all_button.clicked.connect(self.save_all_requested)
         self.addWidget(self.save_all_button)
 
         self.addSeparator()
@@ -108,7 +108,8 @@ class ToolBar(QToolBar):
         self.tool_indicator.setStyleSheet("font-weight: bold; padding: 0 10px;")
         self.addWidget(self.tool_indicator)
 
-    def _on_tool_button_clicked(self, button):
+    @Slot(QAbstractButton)
+    def _on_tool_button_clicked(self, button: QAbstractButton):
         """Handle tool button click."""
         if button == self.view_button:
             self._set_tool("view")